@@ -1,11 +1,21 @@
+import hashlib
 import logging
-from fastapi import HTTPException
+import threading
+import time
+from cachetools import TLRUCache
+from fastapi import HTTPException, Depends, Security
 from fastapi.security import APIKeyHeader
 from jwt import InvalidTokenError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from typing import Optional
 
-from app.core.hash import sha256
-from app.core.user import core_jwt
+from app.core.config_store import config
+from app.core.database.database import create_connection, create_async_connection
+from app.core.database.read_cache import CacheMetrics
+from app.core.user import core_jwt, core_user
 from app.core.user.core_jwt import get_sub, Role, include_role
+from app.schemas.user.Identity import Identity
 
 log = logging.getLogger(__name__)
 
@@ -17,31 +27,92 @@ class APIKeyHeaderBearer(APIKeyHeader):
 
 authorization_header = APIKeyHeaderBearer()
 
+JWT_CACHE_SIZE = config["security"].get("jwt_cache", {}).get("size", 10000)
 
-def authorize_jwt(token: str) -> dict[str, str]:
-  if token is None:
-    log.warning("Auth failed: Authorization header was not provided")
-    raise HTTPException(status_code=400, detail="Authorization header was not provided")
+# 검증이 끝난 access token의 claims를 exp까지 보관, key는 토큰의 sha256 digest
+_jwt_cache: TLRUCache = TLRUCache(
+  maxsize=JWT_CACHE_SIZE,
+  ttu=lambda _, claims, now: claims["exp"],
+  timer=time.time
+)
+_jwt_cache_lock = threading.Lock()
+jwt_cache_metrics = CacheMetrics()
 
-  if not token.startswith("Bearer "):
-    log.warning("Auth failed: Authorization must be Bearer token")
-    raise HTTPException(status_code=400, detail="Authorization must be Bearer token")
 
-  jwt_token = token[7:]
+def jwt_cache_status() -> dict[str, object]:
+  with _jwt_cache_lock:
+    size = _jwt_cache.currsize
+
+  return {
+    "size": size,
+    "maxsize": JWT_CACHE_SIZE,
+    **jwt_cache_metrics.snapshot()
+  }
+
+
+def verify_access_token(jwt_token: str) -> dict:
+  digest = hashlib.sha256(jwt_token.encode()).digest()
+
+  with _jwt_cache_lock:
+    claims = _jwt_cache.get(digest)
+
+  if claims is not None:
+    jwt_cache_metrics.observe_hit()
+    log.info("Authorized access token. jwt=%s, sub=%s", digest.hex(), get_sub(claims))
+    return claims
+
+  jwt_cache_metrics.observe_miss()
 
   try:
-    jwt_body = core_jwt.decode_access_token(jwt_token)
+    claims = core_jwt.decode_access_token(jwt_token)
   except InvalidTokenError as e:
     log.warning(f"Auth failed: Access token is invalid or unauthorized {e}")
     raise HTTPException(status_code=401, detail="Access token is invalid or unauthorized")
 
-  if not jwt_body:
+  if not claims:
     log.warning("Auth failed: Access token is invalid or unauthorized")
     raise HTTPException(status_code=401, detail="Access token is invalid or unauthorized")
 
-  if not include_role(jwt_body, Role.CORE_USER):
+  if not include_role(claims, Role.CORE_USER):
     log.warning("Auth failed: Access token absents core:user role")
     raise HTTPException(status_code=401, detail="Access token is invalid or unauthorized")
 
-  log.info("Authorized access token. jwt=%s, sub=%s", sha256(jwt_token), get_sub(jwt_body))
-  return jwt_body
+  with _jwt_cache_lock:
+    _jwt_cache[digest] = claims
+
+  log.info("Authorized access token. jwt=%s, sub=%s", digest.hex(), get_sub(claims))
+  return claims
+
+
+def authorize_jwt(token: str) -> dict[str, str]:
+  if token is None:
+    log.warning("Auth failed: Authorization header was not provided")
+    raise HTTPException(status_code=400, detail="Authorization header was not provided")
+
+  if not token.startswith("Bearer "):
+    log.warning("Auth failed: Authorization must be Bearer token")
+    raise HTTPException(status_code=400, detail="Authorization must be Bearer token")
+
+  jwt_token = token[7:]
+  return verify_access_token(jwt_token)
+
+
+async def authorized_token(
+  jwt: str = Security(authorization_header)
+) -> dict[str, str]:
+  return authorize_jwt(jwt)
+
+
+# FastAPI는 한 요청 안에서 같은 dependency 결과를 재사용하므로 identity는 요청당 한 번만 조회됨
+def current_identity(
+  token: dict[str, str] = Depends(authorized_token),
+  db: Session = Depends(create_connection)
+) -> Optional[Identity]:
+  return core_user.get_identity_cached(token, db)
+
+
+async def current_identity_async(
+  token: dict[str, str] = Depends(authorized_token),
+  db: AsyncSession = Depends(create_async_connection)
+) -> Optional[Identity]:
+  return await core_user.get_identity_cached_async(token, db)
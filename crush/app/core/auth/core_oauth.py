@@ -3,7 +3,7 @@ from fastapi import HTTPException
 from typing import Optional
 from uuid import uuid4
 
-from app.core.database.database import redis_db0
+from app.core.database.database import redis_db0, async_redis_db0
 from app.core.hash import sha256
 
 log = logging.getLogger(__name__)
@@ -12,15 +12,31 @@ log = logging.getLogger(__name__)
 def set_session_state(state: str) -> str:
   session_uuid = str(uuid4())
 
-  if redis_db0.exists(session_uuid) != 0:
+  # uuid가 겹치면 NX로 인해 저장되지 않으므로 별도의 존재 확인이 필요 없음
+  if not redis_db0.set(
+    name=session_uuid,
+    value=state,
+    ex=600,
+    nx=True
+  ):
     log.warning("OAuth state session has crashed %s", sha256(session_uuid))
     raise HTTPException(500, "Session UUID crash")
+  log.info("OAuth state session %s linked to state %s was saved", sha256(session_uuid), sha256(state))
+
+  return session_uuid
 
-  redis_db0.set(
+
+async def set_session_state_async(state: str) -> str:
+  session_uuid = str(uuid4())
+
+  if not await async_redis_db0.set(
     name=session_uuid,
     value=state,
-    ex=600
-  )
+    ex=600,
+    nx=True
+  ):
+    log.warning("OAuth state session has crashed %s", sha256(session_uuid))
+    raise HTTPException(500, "Session UUID crash")
   log.info("OAuth state session %s linked to state %s was saved", sha256(session_uuid), sha256(state))
 
   return session_uuid
@@ -0,0 +1,78 @@
+import logging
+from datetime import datetime
+from redis import RedisError
+from redis.client import Pipeline
+from typing import Optional, Tuple
+
+from app.core.database.database import redis_refresh_token_blacklist_db1
+
+log = logging.getLogger(__name__)
+
+REFRESH_TOKEN_LIFETIME = 2419200
+# 하루 단위 bucket은 그 날 발급된 마지막 토큰이 만료될 때까지 유지
+BUCKET_TTL = REFRESH_TOKEN_LIFETIME + 86400
+
+SEQUENCE_KEY = "refresh:seq:{day}"
+USED_KEY = "refresh:used:{day}"
+
+
+def bucket_day(issued_at: int) -> int:
+  return issued_at // 86400
+
+
+def _queue_sequence(pipe: Pipeline, issued_at: datetime):
+  # 발급 일자별로 1부터 증가하는 번호를 부여하여 사용 여부를 bitmap의 bit 하나로 기록
+  key = SEQUENCE_KEY.format(day=bucket_day(int(issued_at.timestamp())))
+  pipe.incr(key)
+  pipe.expire(key, BUCKET_TTL, nx=True)
+
+
+def _queue_consume(pipe: Pipeline, token: dict):
+  sequence = token.get("rsq")
+  if sequence is None:
+    # 번호 부여 이전에 발급된 토큰, 확인과 기록을 SET NX 한 번으로 처리하여 동시 요청이 함께 통과하지 못하게 함
+    pipe.set(name=token.get("rti"), value=1, ex=REFRESH_TOKEN_LIFETIME, nx=True)
+    return
+
+  key = USED_KEY.format(day=bucket_day(token["iat"]))
+  pipe.setbit(key, sequence, 1)
+  pipe.expire(key, BUCKET_TTL, nx=True)
+
+
+def _consumed(token: dict, result) -> bool:
+  # SETBIT는 이전 bit를, SET NX는 기록했을 때만 True를 반환
+  if token.get("rsq") is None:
+    return result is not None
+  return result == 0
+
+
+def issue_sequence(issued_at: datetime) -> Optional[int]:
+  try:
+    pipe = redis_refresh_token_blacklist_db1.pipeline(transaction=False)
+    _queue_sequence(pipe, issued_at)
+    sequence, _ = pipe.execute()
+  except RedisError as e:
+    # 번호가 없는 토큰은 rti 단위의 정확한 blacklist로 처리됨
+    log.warning("Failed to issue refresh token sequence: %s", e)
+    return None
+
+  return sequence
+
+
+# refresh token을 사용 처리하고, 이미 사용된 토큰이었다면 False를 반환
+def consume(token: dict) -> bool:
+  pipe = redis_refresh_token_blacklist_db1.pipeline(transaction=False)
+  _queue_consume(pipe, token)
+
+  return _consumed(token, pipe.execute()[0])
+
+
+# 사용 처리와 새 토큰의 번호 발급을 한 번의 왕복으로 처리
+def rotate(token: dict, issued_at: datetime) -> Tuple[bool, Optional[int]]:
+  pipe = redis_refresh_token_blacklist_db1.pipeline(transaction=False)
+  _queue_consume(pipe, token)
+  _queue_sequence(pipe, issued_at)
+  results = pipe.execute()
+
+  # 마지막 두 결과가 INCR, EXPIRE
+  return _consumed(token, results[0]), results[-2]
@@ -1,15 +1,15 @@
 import logging
+from datetime import datetime
 from fastapi import HTTPException
 from jwt import InvalidTokenError
 from sqlalchemy.orm import Session
 
-from app.core.database.database import redis_refresh_token_blacklist_db1
+from app.core.auth.core_refresh_blacklist import consume, rotate
 from app.core.hash import sha256
 from app.core.logger import logger
-from app.core.user import core_jwt
-from app.core.user.core_jwt import get_sub
+from app.core.user import core_jwt, core_user
+from app.core.user.core_jwt import get_sub, KST
 from app.core.user.core_login import login
-from app.models.users.IdentityModel import IdentityModel
 
 log = logging.getLogger(__name__)
 
@@ -28,31 +28,25 @@ def use_refresh_token(
     logger.warning(f"Auth failed: Refresh token is invalid or unauthorized {e}")
     raise HTTPException(status_code=401, detail="Refresh token is invalid or unauthorized")
 
-  if redis_refresh_token_blacklist_db1.exists(token.get("rti")):
+  issued_at = datetime.now(KST)
+  consumed, sequence = rotate(token, issued_at)
+  if not consumed:
     log.warning("Auth failed: Blacklisted refresh token was re-used. token_hash=%s", sha256(refresh_token))
     raise HTTPException(status_code=401, detail="Refresh token cannot be used")
-  else:
-    log.info("Blacklisted token %s", sha256(refresh_token))
-    redis_refresh_token_blacklist_db1.set(
-      name=token.get("rti"),
-      value=1,
-      ex=2419200
-    )
+
+  log.info("Blacklisted token %s", sha256(refresh_token))
 
   sub = get_sub(token)
   log.info("Refreshing tokens for user %s", sub)
 
-  identity = (
-    db.query(IdentityModel)
-    .filter(IdentityModel.uid == sub)
-    .scalar()
-  )
+  # 권한 정보는 identity cache에서 읽으므로 대부분의 refresh는 DB를 거치지 않음
+  identity = core_user.get_identity_cached(token, db)
 
   if identity is None:
-    log.warning("Identity %s was not found")
+    log.warning("Identity %s was not found", sub)
     raise HTTPException(status_code=404, detail="User was not found")
 
-  access_token, new_refresh_token = login(identity)
+  access_token, new_refresh_token = login(identity, issued_at, sequence)
   log.info("Access token %s and refresh token %s was issued for user %s", sha256(access_token),
            sha256(new_refresh_token), sub)
   return access_token, new_refresh_token
@@ -67,13 +61,8 @@ def revoke_refresh_token(
     logger.warning(f"Revoke failed: Refresh token is invalid or unauthorized {e}")
     raise HTTPException(status_code=401, detail="Refresh token is invalid or unauthorized")
 
-  if redis_refresh_token_blacklist_db1.exists(token.get("rti")):
+  if not consume(token):
     log.warning("Revoke failed: token was already blacklisted. token_hash=%s", sha256(refresh_token))
     raise HTTPException(status_code=401, detail="Refresh token cannot be used")
-  else:
-    log.info("Blacklisted token %s", sha256(refresh_token))
-    redis_refresh_token_blacklist_db1.set(
-      name=token.get("rti"),
-      value=1,
-      ex=2419200
-    )
+
+  log.info("Blacklisted token %s", sha256(refresh_token))
@@ -6,15 +6,16 @@ import uuid
 from datetime import datetime
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
-from typing import Tuple
+from typing import Tuple, Optional
 from uuid import UUID
 from webauthn import generate_registration_options, generate_authentication_options, options_to_json, \
   verify_registration_response, verify_authentication_response
 from webauthn.helpers.structs import UserVerificationRequirement
 
+from app.core import worker_pool
 from app.core.auth.passkey.paykey_aaguid import get_authenticator
 from app.core.config_store import config
-from app.core.database.database import redis_db0
+from app.core.database.database import redis_binary_db0, async_redis_binary_db0
 from app.core.hash import sha256, sha256_bytes
 from app.core.user import core_login
 from app.models.auth.PasskeyAuthModel import PasskeyAuthModel
@@ -23,14 +24,55 @@ from app.schemas.user.Identity import Identity
 
 log = logging.getLogger(__name__)
 
+PASSKEY_CHALLENGE_KEY = "passkey:challenge:{id}"
+# 인증 option과 session cookie의 유효 시간과 같음
+PASSKEY_CHALLENGE_TTL = 300
+
+
+def store_challenge(challenge_id: str, challenge: bytes):
+  # uuid가 겹치면 NX로 인해 저장되지 않으므로 별도의 존재 확인이 필요 없음
+  if not redis_binary_db0.set(PASSKEY_CHALLENGE_KEY.format(id=challenge_id), challenge,
+                              ex=PASSKEY_CHALLENGE_TTL, nx=True):
+    log.warning("Passkey challenge ID %r is duplicated", challenge_id)
+    raise HTTPException(status_code=400, detail="Registration ID already exists")
+
+
+async def store_challenge_async(challenge_id: str, challenge: bytes):
+  if not await async_redis_binary_db0.set(PASSKEY_CHALLENGE_KEY.format(id=challenge_id), challenge,
+                                          ex=PASSKEY_CHALLENGE_TTL, nx=True):
+    log.warning("Passkey challenge ID %r is duplicated", challenge_id)
+    raise HTTPException(status_code=400, detail="Registration ID already exists")
+
+
+def consume_challenge(challenge_id: Optional[str]) -> Optional[bytes]:
+  if challenge_id is None:
+    return None
+  return redis_binary_db0.getdel(PASSKEY_CHALLENGE_KEY.format(id=challenge_id))
+
 
 def begin_authentication() -> Tuple[str, dict]:
   challenge = os.urandom(32)
   authentication_id = str(uuid.uuid4())
 
-  if redis_db0.exists(authentication_id):
-    log.warning("Passkey authentication ID %r is duplicated", authentication_id)
-    raise HTTPException(status_code=400, detail="Registration ID already exists")
+  auth_option = generate_authentication_options(
+    rp_id=config['security']['webauthn']['rp_id'],
+    challenge=challenge,
+    user_verification=UserVerificationRequirement.REQUIRED,
+    timeout=300,
+  )
+
+  store_challenge(authentication_id, challenge)
+  log.info("Passkey authentication option %r has been saved", authentication_id)
+
+  return (
+    authentication_id,
+    json.loads(options_to_json(auth_option))
+  )
+
+
+async def begin_authentication_async() -> Tuple[str, dict]:
+  challenge = os.urandom(32)
+  authentication_id = str(uuid.uuid4())
 
   auth_option = generate_authentication_options(
     rp_id=config['security']['webauthn']['rp_id'],
@@ -39,7 +81,7 @@ def begin_authentication() -> Tuple[str, dict]:
     timeout=300,
   )
 
-  redis_db0.set(authentication_id, base64.encodebytes(challenge).decode('ascii'))
+  await store_challenge_async(authentication_id, challenge)
   log.info("Passkey authentication option %r has been saved", authentication_id)
 
   return (
@@ -58,10 +100,6 @@ def begin_registration(
   challenge = os.urandom(32)
   registration_id = str(uuid.uuid4())
 
-  if redis_db0.exists(registration_id):
-    log.warning("Passkey registration ID %r is duplicated", registration_id)
-    raise HTTPException(status_code=400, detail="Registration ID already exists")
-
   reg_option = generate_registration_options(
     rp_id=config['security']['webauthn']['rp_id'],
     rp_name=config['security']['webauthn']['rp_name'],
@@ -72,7 +110,7 @@ def begin_registration(
     timeout=300,
   )
 
-  redis_db0.set(registration_id, base64.encodebytes(challenge).decode('ascii'))
+  store_challenge(registration_id, challenge)
   log.info("Passkey registration option %r has been saved", registration_id)
 
   return (
@@ -91,21 +129,21 @@ def complete_registration(
     log.warning("Identity not found during passkey registration")
     raise HTTPException(status_code=404, detail="Identity not found")
 
-  challenge_b64 = redis_db0.get(register_option)
-  redis_db0.delete(register_option)
+  # worker pool이 가득 차 거절되더라도 challenge가 남아 다시 시도할 수 있도록 자리를 먼저 확보
+  with worker_pool.reserve() as worker:
+    challenge = consume_challenge(register_option)
 
-  if challenge_b64 is None:
-    log.warning("Register option not found when registering passkey of user %r", identity.user_id)
-    raise HTTPException(status_code=400, detail="Registration option not found")
+    if challenge is None:
+      log.warning("Register option not found when registering passkey of user %r", identity.user_id)
+      raise HTTPException(status_code=400, detail="Registration option not found")
 
-  challenge = base64.decodebytes(challenge_b64.encode('ascii'))
-
-  registration = verify_registration_response(
-    credential=request.attestation,
-    expected_rp_id=config['security']['webauthn']['rp_id'],
-    expected_challenge=challenge,
-    expected_origin=config['security']['webauthn']['rp_origin'],
-  )
+    registration = worker.run(
+      verify_registration_response,
+      credential=request.attestation,
+      expected_rp_id=config['security']['webauthn']['rp_id'],
+      expected_challenge=challenge,
+      expected_origin=config['security']['webauthn']['rp_origin'],
+    )
 
   aaguid = UUID(registration.aaguid)
 
@@ -158,23 +196,22 @@ def auth_passkey(
     log.warning("Identity was not found for passkey %r", sha256_bytes(credential_id))
     raise HTTPException(status_code=400, detail="Identity not found")
 
-  challenge_b64 = redis_db0.get(PSK_AUTH_SEK)
-  redis_db0.delete(PSK_AUTH_SEK)
-
-  if challenge_b64 is None:
-    log.warning("Passkey authentication option not found")
-    raise HTTPException(status_code=400, detail="Authentication option not found")
-
-  challenge = base64.decodebytes(challenge_b64.encode('ascii'))
-
-  auth = verify_authentication_response(
-    credential=body.attestation,
-    expected_rp_id=config['security']['webauthn']['rp_id'],
-    expected_challenge=challenge,
-    expected_origin=config['security']['webauthn']['rp_origin'],
-    credential_public_key=passkey_auth.public_key,
-    credential_current_sign_count=passkey_auth.counter,
-  )
+  with worker_pool.reserve() as worker:
+    challenge = consume_challenge(PSK_AUTH_SEK)
+
+    if challenge is None:
+      log.warning("Passkey authentication option not found")
+      raise HTTPException(status_code=400, detail="Authentication option not found")
+
+    auth = worker.run(
+      verify_authentication_response,
+      credential=body.attestation,
+      expected_rp_id=config['security']['webauthn']['rp_id'],
+      expected_challenge=challenge,
+      expected_origin=config['security']['webauthn']['rp_origin'],
+      credential_public_key=passkey_auth.public_key,
+      credential_current_sign_count=passkey_auth.counter,
+    )
 
   passkey_auth.counter = auth.new_sign_count
   passkey_auth.last_used = datetime.now()
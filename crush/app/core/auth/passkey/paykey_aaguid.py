@@ -1,45 +1,141 @@
+import base64
 import json
 import logging
-from pydantic.dataclasses import dataclass
-from typing import Optional
+import os
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Optional, Mapping
 from uuid import UUID
 
+from app.core.config_store import config
 from app.core.database.database import redis_aaguid_db2
+from app.core.hash import sha256_bytes
 
 log = logging.getLogger(__name__)
 
+AAGUID_CONFIG = config["security"]["webauthn"].get("aaguid", {})
+AAGUID_PATH = AAGUID_CONFIG.get("path", "resources/combined_aaguid.json")
+AAGUID_SHARED = AAGUID_CONFIG.get("shared", False)
 
-def load_aaguid():
-  redis_aaguid_db2.flushall()
-  log.info("AAGUID cache was reset")
-
-  with open("resources/combined_aaguid.json", "r") as f:
-    aaguid_json: dict = json.load(f)
+AAGUID_VERSION_KEY = "aaguid:version"
+AAGUID_TABLE_KEY = "aaguid:table:{version}"
+AAGUID_PIPELINE_CHUNK = 500
+# 이전 버전 테이블은 아직 읽고 있는 worker가 있을 수 있으므로 바로 지우지 않음
+AAGUID_STALE_TTL = 3600
 
-  keys = aaguid_json.keys()
 
-  for key in keys:
-    redis_aaguid_db2.set(key, json.dumps(aaguid_json[key]))
-  log.info("AAGUID cache was loaded with %d entries", len(keys))
+@dataclass(frozen=True, slots=True)
+class AuthenticatorIcon:
+  content: bytes
+  mime: str
+  etag: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Authenticator:
   name: str
-  icon_light: str
-  icon_dark: str
+  light: Optional[AuthenticatorIcon]
+  dark: Optional[AuthenticatorIcon]
 
+  def icon(self, variant: str) -> Optional[AuthenticatorIcon]:
+    # dark 아이콘이 없는 인증기는 light 아이콘을 그대로 사용
+    if variant == "dark" and self.dark is not None:
+      return self.dark
+    return self.light
 
-def get_authenticator(aaguid: UUID) -> Optional[Authenticator]:
-  aaguid_json = redis_aaguid_db2.get(str(aaguid))
-  if aaguid_json is None:
-    log.info("Authenticator AAGUID cache miss: %r", aaguid)
+
+_authenticators: Mapping[bytes, Authenticator] = MappingProxyType({})
+
+
+def decode_icon(data_uri: Optional[str]) -> Optional[AuthenticatorIcon]:
+  # data:image/svg+xml;base64,... 형식
+  if data_uri is None or "," not in data_uri:
     return None
 
-  aaguid_dict = json.loads(aaguid_json)
-  log.info("Authenticator AAGUID cache hit: %r", aaguid)
-  return Authenticator(
-    name=aaguid_dict['name'],
-    icon_light=aaguid_dict['icon_light'],
-    icon_dark=aaguid_dict['icon_dark'],
+  header, payload = data_uri.split(",", 1)
+  mime = header.replace("data:", "").replace(";base64", "")
+  content = base64.b64decode(payload)
+
+  return AuthenticatorIcon(
+    content=content,
+    mime=mime,
+    etag=f'"{sha256_bytes(content)}"'
   )
+
+
+def build_table(aaguid_json: dict[str, dict]) -> Mapping[bytes, Authenticator]:
+  table = {}
+  for key, entry in aaguid_json.items():
+    table[UUID(key).bytes] = Authenticator(
+      name=entry["name"],
+      light=decode_icon(entry.get("icon_light")),
+      dark=decode_icon(entry.get("icon_dark")),
+    )
+
+  return MappingProxyType(table)
+
+
+def publish_shared(aaguid_json: dict[str, dict], version: str):
+  if redis_aaguid_db2.get(AAGUID_VERSION_KEY) == version:
+    log.info("Shared AAGUID table %s is already published", version)
+    return
+
+  table_key = AAGUID_TABLE_KEY.format(version=version)
+  items = list(aaguid_json.items())
+
+  pipe = redis_aaguid_db2.pipeline(transaction=False)
+  for i in range(0, len(items), AAGUID_PIPELINE_CHUNK):
+    pipe.hset(table_key, mapping={
+      key: json.dumps(entry) for key, entry in items[i:i + AAGUID_PIPELINE_CHUNK]
+    })
+  # 이전에 밀려나 만료가 걸린 버전을 다시 게시하는 경우(rollback 등) 만료를 없앰
+  pipe.persist(table_key)
+  pipe.execute()
+
+  # 테이블을 다 쓴 뒤에 버전을 바꿔야 다른 worker가 덜 채워진 테이블을 읽지 않음
+  previous = redis_aaguid_db2.set(AAGUID_VERSION_KEY, version, get=True)
+  if previous is not None and previous != version:
+    redis_aaguid_db2.expire(AAGUID_TABLE_KEY.format(version=previous), AAGUID_STALE_TTL)
+
+  log.info("Shared AAGUID table %s was published with %d entries", version, len(items))
+
+
+def load_shared() -> Optional[dict[str, dict]]:
+  version = redis_aaguid_db2.get(AAGUID_VERSION_KEY)
+  if version is None:
+    return None
+
+  table = redis_aaguid_db2.hgetall(AAGUID_TABLE_KEY.format(version=version))
+  log.info("Shared AAGUID table %s was read with %d entries", version, len(table))
+
+  return {key: json.loads(entry) for key, entry in table.items()}
+
+
+def load_aaguid():
+  global _authenticators
+
+  aaguid_json = None
+  if os.path.exists(AAGUID_PATH):
+    with open(AAGUID_PATH, "rb") as f:
+      raw = f.read()
+    aaguid_json = json.loads(raw)
+
+    if AAGUID_SHARED:
+      publish_shared(aaguid_json, sha256_bytes(raw))
+  elif AAGUID_SHARED:
+    aaguid_json = load_shared()
+
+  if aaguid_json is None:
+    log.warning("AAGUID table was not found at %r", AAGUID_PATH)
+    aaguid_json = {}
+
+  _authenticators = build_table(aaguid_json)
+  log.info("AAGUID table was loaded with %d entries", len(_authenticators))
+
+
+def get_authenticator(aaguid: UUID) -> Optional[Authenticator]:
+  authenticator = _authenticators.get(aaguid.bytes)
+  if authenticator is None:
+    log.info("Authenticator AAGUID was not found: %r", aaguid)
+
+  return authenticator
@@ -1,10 +1,13 @@
 import redis
+import redis.asyncio
 from functools import reduce
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config_store import config
+from app.core.database.pool_metrics import InstrumentedQueuePool, InstrumentedAsyncAdaptedQueuePool
 
 SQLALCHEMY_DATABASE_URL = "postgresql://{user}:{password}@{host}:{port}/{dbname}".format(
   host=config["database"]["relational"]["host"],
@@ -14,12 +17,39 @@ SQLALCHEMY_DATABASE_URL = "postgresql://{user}:{password}@{host}:{port}/{dbname}
   dbname=config["database"]["relational"]["name"]
 )
 
+ASYNC_SQLALCHEMY_DATABASE_URL = "postgresql+asyncpg://{user}:{password}@{host}:{port}/{dbname}".format(
+  host=config["database"]["relational"]["host"],
+  port=config["database"]["relational"]["port"],
+  password=config["database"]["relational"]["password"],
+  user=config["database"]["relational"]["user"],
+  dbname=config["database"]["relational"]["name"]
+)
+
+POOL_CONFIG = config["database"]["relational"].get("pool", {})
+POOL_OPTIONS = {
+  "pool_size": POOL_CONFIG.get("size", 5),
+  "max_overflow": POOL_CONFIG.get("max_overflow", 10),
+  "pool_timeout": POOL_CONFIG.get("timeout", 30),
+  "pool_pre_ping": POOL_CONFIG.get("pre_ping", False),
+  "pool_recycle": POOL_CONFIG.get("recycle", -1),
+}
+
 engine = create_engine(
   SQLALCHEMY_DATABASE_URL,
-  echo=config["database"]["relational"]["echo"]
+  echo=config["database"]["relational"]["echo"],
+  poolclass=InstrumentedQueuePool,
+  **POOL_OPTIONS
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(
+  ASYNC_SQLALCHEMY_DATABASE_URL,
+  echo=config["database"]["relational"]["echo"],
+  poolclass=InstrumentedAsyncAdaptedQueuePool,
+  **POOL_OPTIONS
+)
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False, bind=async_engine)
+
 BaseTable = declarative_base()
 
 
@@ -31,7 +61,15 @@ def create_connection():
     db.close()
 
 
-from sqlalchemy.types import TypeDecorator, String
+async def create_async_connection():
+  db = AsyncSessionLocal()
+  try:
+    yield db
+  finally:
+    await db.close()
+
+
+from sqlalchemy.types import TypeDecorator, String, Integer
 
 
 class EnumAsValue(TypeDecorator):
@@ -41,6 +79,12 @@ class EnumAsValue(TypeDecorator):
     self._enumtype = enumtype
     super().__init__(*args, **kwargs)
 
+  def load_dialect_impl(self, dialect):
+    # asyncpg는 타입 캐스트를 붙여 바인딩하므로 정수 enum을 VARCHAR로 보내면 안 됨
+    if all(isinstance(member.value, int) for member in self._enumtype):
+      return dialect.type_descriptor(Integer())
+    return dialect.type_descriptor(String())
+
   def process_bind_param(self, value, dialect):
     return value.value if value is not None else None
 
@@ -55,26 +99,38 @@ def jsonb_path_equals(column, path_string, target_value):
   return path_expression.astext == str(target_value)
 
 
-redis_db0 = redis.Redis(
-  host=config["database"]["redis"]["host"],
-  port=config["database"]["redis"]["port"],
-  password=config["database"]["redis"]["password"],
-  db=0,
-  decode_responses=True
-)
-
-redis_refresh_token_blacklist_db1 = redis.Redis(
-  host=config["database"]["redis"]["host"],
-  port=config["database"]["redis"]["port"],
-  password=config["database"]["redis"]["password"],
-  db=1,
-  decode_responses=True
-)
-
-redis_aaguid_db2 = redis.Redis(
-  host=config["database"]["redis"]["host"],
-  port=config["database"]["redis"]["port"],
-  password=config["database"]["redis"]["password"],
-  db=2,
-  decode_responses=True
-)
+REDIS_CONFIG = config["database"]["redis"]
+REDIS_POOL_CONFIG = REDIS_CONFIG.get("pool", {})
+REDIS_OPTIONS = {
+  "host": REDIS_CONFIG["host"],
+  "port": REDIS_CONFIG["port"],
+  "password": REDIS_CONFIG["password"],
+  "decode_responses": True,
+  "max_connections": REDIS_POOL_CONFIG.get("max_connections", 50),
+  "socket_timeout": REDIS_POOL_CONFIG.get("socket_timeout", 5),
+  "socket_connect_timeout": REDIS_POOL_CONFIG.get("connect_timeout", 2),
+  "health_check_interval": REDIS_POOL_CONFIG.get("health_check_interval", 30),
+}
+
+redis_db0 = redis.Redis(db=0, **REDIS_OPTIONS)
+redis_refresh_token_blacklist_db1 = redis.Redis(db=1, **REDIS_OPTIONS)
+redis_aaguid_db2 = redis.Redis(db=2, **REDIS_OPTIONS)
+# 문자열로 decode하지 않고 bytes를 그대로 다루는 client
+redis_binary_db0 = redis.Redis(db=0, **{**REDIS_OPTIONS, "decode_responses": False})
+
+
+def create_async_redis(db: int, decode_responses: bool = True) -> redis.asyncio.Redis:
+  # pool이 가득 차면 오류 대신 timeout까지 빈 커넥션을 기다림
+  return redis.asyncio.Redis(
+    connection_pool=redis.asyncio.BlockingConnectionPool(
+      db=db,
+      timeout=REDIS_POOL_CONFIG.get("checkout_timeout", 5),
+      **{**REDIS_OPTIONS, "decode_responses": decode_responses}
+    )
+  )
+
+
+# 요청 처리 중 event loop를 막지 않도록 async handler에서는 이 client를 사용
+async_redis_db0 = create_async_redis(0)
+async_redis_refresh_token_blacklist_db1 = create_async_redis(1)
+async_redis_binary_db0 = create_async_redis(0, decode_responses=False)
@@ -0,0 +1,96 @@
+import bisect
+import logging
+import threading
+import time
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+log = logging.getLogger(__name__)
+
+CHECKOUT_WAIT_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+class PoolMetrics:
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._buckets = [0] * (len(CHECKOUT_WAIT_BUCKETS_MS) + 1)
+    self._count = 0
+    self._sum_ms = 0.0
+    self._timeouts = 0
+
+  def observe_wait(self, wait_ms: float):
+    idx = bisect.bisect_left(CHECKOUT_WAIT_BUCKETS_MS, wait_ms)
+    with self._lock:
+      self._buckets[idx] += 1
+      self._count += 1
+      self._sum_ms += wait_ms
+
+  def observe_timeout(self):
+    with self._lock:
+      self._timeouts += 1
+
+  def snapshot(self) -> dict[str, object]:
+    with self._lock:
+      buckets = list(self._buckets)
+      count, sum_ms, timeouts = self._count, self._sum_ms, self._timeouts
+
+    cumulative = 0
+    histogram = {}
+    for bound, bucket in zip(CHECKOUT_WAIT_BUCKETS_MS + ["+Inf"], buckets):
+      cumulative += bucket
+      histogram[str(bound)] = cumulative
+
+    return {
+      "checkout_wait_ms": {
+        "buckets": histogram,
+        "count": count,
+        "sum": round(sum_ms, 3)
+      },
+      "checkout_timeouts": timeouts
+    }
+
+
+def _timed_checkout(pool, do_get):
+  begin = time.perf_counter()
+  try:
+    return do_get()
+  except PoolTimeoutError:
+    pool.metrics.observe_timeout()
+    log.warning("Connection pool checkout timed out. status=[%s]", pool.status())
+    raise
+  finally:
+    pool.metrics.observe_wait((time.perf_counter() - begin) * 1000)
+
+
+class InstrumentedQueuePool(QueuePool):
+  def __init__(self, *args, **kwargs):
+    super().__init__(*args, **kwargs)
+    self.metrics = PoolMetrics()
+
+  def _do_get(self):
+    return _timed_checkout(self, super()._do_get)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+  def __init__(self, *args, **kwargs):
+    super().__init__(*args, **kwargs)
+    self.metrics = PoolMetrics()
+
+  def _do_get(self):
+    return _timed_checkout(self, super()._do_get)
+
+
+def pool_status(pool: QueuePool) -> dict[str, object]:
+  status = {
+    "size": pool.size(),
+    "checked_in": pool.checkedin(),
+    "checked_out": pool.checkedout(),
+    "overflow": max(pool.overflow(), 0),
+    "max_overflow": pool._max_overflow,
+  }
+
+  metrics = getattr(pool, "metrics", None)
+  if metrics is not None:
+    status.update(metrics.snapshot())
+
+  return status
@@ -0,0 +1,160 @@
+import logging
+import threading
+from redis import Redis, RedisError
+from redis.asyncio import Redis as AsyncRedis
+from typing import Callable, Optional, TypeVar, Generic
+
+from app.core.config_store import config
+from app.core.database.database import redis_db0, async_redis_db0
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CACHE_CONFIG = config["database"]["redis"].get("cache", {})
+DEFAULT_TTL = CACHE_CONFIG.get("ttl", 300)
+
+CACHES: dict[str, "ReadThroughCache"] = {}
+
+
+class CacheMetrics:
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._hits = 0
+    self._misses = 0
+    self._errors = 0
+    self._invalidations = 0
+
+  def observe_hit(self):
+    with self._lock:
+      self._hits += 1
+
+  def observe_miss(self):
+    with self._lock:
+      self._misses += 1
+
+  def observe_error(self):
+    with self._lock:
+      self._errors += 1
+
+  def observe_invalidation(self, n: int):
+    with self._lock:
+      self._invalidations += n
+
+  def snapshot(self) -> dict[str, object]:
+    with self._lock:
+      hits, misses, errors, invalidations = self._hits, self._misses, self._errors, self._invalidations
+
+    lookups = hits + misses
+    return {
+      "hits": hits,
+      "misses": misses,
+      "hit_rate": round(hits / lookups, 4) if lookups > 0 else None,
+      "errors": errors,
+      "invalidations": invalidations
+    }
+
+
+class ReadThroughCache(Generic[T]):
+  def __init__(
+    self,
+    namespace: str,
+    encode: Callable[[T], str],
+    decode: Callable[[str], T],
+    ttl: Optional[int] = None,
+    client: Redis = redis_db0,
+    async_client: AsyncRedis = async_redis_db0
+  ):
+    self.namespace = namespace
+    self.ttl = ttl if ttl is not None else CACHE_CONFIG.get(namespace, {}).get("ttl", DEFAULT_TTL)
+    self.metrics = CacheMetrics()
+    self._encode = encode
+    self._decode = decode
+    self._client = client
+    self._async_client = async_client
+    CACHES[namespace] = self
+
+  def key(self, uid) -> str:
+    return f"cache:{self.namespace}:{uid}"
+
+  def get(self, uid) -> Optional[T]:
+    key = self.key(uid)
+
+    # Redis 장애 시에는 miss로 취급하여 DB에서 바로 읽음
+    try:
+      cached = self._client.get(key)
+    except RedisError as e:
+      self.metrics.observe_error()
+      log.warning("Failed to read cache %s: %s", key, e)
+      return None
+
+    return self._observe(cached)
+
+  async def get_async(self, uid) -> Optional[T]:
+    key = self.key(uid)
+
+    try:
+      cached = await self._async_client.get(key)
+    except RedisError as e:
+      self.metrics.observe_error()
+      log.warning("Failed to read cache %s: %s", key, e)
+      return None
+
+    return self._observe(cached)
+
+  def _observe(self, cached: Optional[str]) -> Optional[T]:
+    if cached is None:
+      self.metrics.observe_miss()
+      return None
+
+    self.metrics.observe_hit()
+    return self._decode(cached)
+
+  def put(self, uid, value: T):
+    key = self.key(uid)
+
+    try:
+      self._client.set(key, self._encode(value), ex=self.ttl)
+    except RedisError as e:
+      self.metrics.observe_error()
+      log.warning("Failed to write cache %s: %s", key, e)
+
+  async def put_async(self, uid, value: T):
+    key = self.key(uid)
+
+    try:
+      await self._async_client.set(key, self._encode(value), ex=self.ttl)
+    except RedisError as e:
+      self.metrics.observe_error()
+      log.warning("Failed to write cache %s: %s", key, e)
+
+  def get_or_load(self, uid, loader: Callable[[], Optional[T]]) -> Optional[T]:
+    value = self.get(uid)
+    if value is not None:
+      return value
+
+    value = loader()
+    if value is not None:
+      self.put(uid, value)
+
+    return value
+
+  def invalidate(self, *uids):
+    if len(uids) == 0:
+      return
+
+    try:
+      self._client.delete(*[self.key(uid) for uid in uids])
+      self.metrics.observe_invalidation(len(uids))
+    except RedisError as e:
+      self.metrics.observe_error()
+      log.warning("Failed to invalidate cache %s of %r: %s", self.namespace, uids, e)
+
+
+def cache_status() -> dict[str, dict[str, object]]:
+  return {
+    namespace: {
+      "ttl": cache.ttl,
+      **cache.metrics.snapshot()
+    } for namespace, cache in CACHES.items()
+  }
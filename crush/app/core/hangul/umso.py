@@ -5,19 +5,20 @@ JONGSUNG_LIST = ["", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "
                  "ㅂㅅ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
 
 
-def 풀어쓰기(text: str):
-  sp = ""
-  begin = ord("가")
-  for c in text:
-    if "가" <= c <= "힣":
-      cc = ord(c)
-      delta = (cc - begin)
-      ch1 = delta // 588
-      ch2 = (delta - (588 * ch1)) // 28
-      ch3 = delta - (588 * ch1) - 28 * ch2
+HANGUL_BEGIN = ord("가")
+HANGUL_SYLLABLES = 11172
 
-      sp += (CHOSUNG_LIST[ch1] + JUNGSUNG_LIST[ch2] + JONGSUNG_LIST[ch3])
-    else:
-      sp += c
+# 완성형 음절 11,172자 -> 음소 문자열 변환표 (str.translate 용)
+UMSO_TABLE = {
+  HANGUL_BEGIN + delta: CHOSUNG_LIST[delta // 588] + JUNGSUNG_LIST[(delta % 588) // 28] + JONGSUNG_LIST[delta % 28]
+  for delta in range(HANGUL_SYLLABLES)
+}
 
-  return sp
+
+def 풀어쓰기(text: str) -> str:
+  return text.translate(UMSO_TABLE)
+
+
+def 풀어쓰기_batch(texts: list[str]) -> list[str]:
+  table = UMSO_TABLE
+  return [text.translate(table) for text in texts]
@@ -1,8 +1,11 @@
 import logging
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 from uuid import UUID
 
+from app.core.interaction import core_like_stats
 from app.models.interacrions.LikeModel import LikesModel
 from app.schemas.interaction.LikeRequests import LikeRequest, LikeSearchRequest
 from app.schemas.location.Place import Place
@@ -37,6 +40,8 @@ def like_place(
     place_id=body.place_id
   )
   db.add(like)
+  db.flush()
+  core_like_stats.apply_like_delta(body.place_id, None, 1, db)
   db.commit()
 
   log.info("User %r liked place %r was committed", identity.uid, body.place_id)
@@ -65,6 +70,7 @@ def dislike_place(
     raise HTTPException(status_code=404, detail="Not liked")
 
   db.delete(like)
+  core_like_stats.apply_like_delta(place_id, like.liked_at.date(), -1, db)
   db.commit()
 
   log.info("User %r dislike place %r was committed", identity.uid, place_id)
@@ -100,6 +106,36 @@ def list_liked(
   return [Place(place) for place in places]
 
 
+async def list_liked_async(
+  identity: Identity,
+  query: LikeSearchRequest,
+  db: AsyncSession
+) -> list[Place]:
+  if identity is None:
+    log.warning("Identity is None and list_liked cannot be done")
+    raise HTTPException(status_code=404, detail="User not found")
+
+  stmt = (
+    select(LikesModel)
+    .options(selectinload(LikesModel.place))
+    .filter(LikesModel.user_id == identity.uid)
+  )
+
+  if query.head is not None:
+    log.debug("Listing liked place head: %r", query.head)
+    head_subquery = select(LikesModel.liked_at).filter(LikesModel.place_id == query.head).scalar_subquery()
+    stmt = stmt.filter(LikesModel.liked_at > head_subquery)
+
+  stmt = stmt.order_by(LikesModel.liked_at.desc())
+  stmt = stmt.limit(query.limit)
+
+  liked_places = (await db.execute(stmt)).scalars().all()
+
+  log.info("Found %d liked places %s", len(liked_places), query.head)
+
+  return [Place(liked_place.place) for liked_place in liked_places]
+
+
 def did_liked_place(
   identity: Identity,
   place_id: UUID,
@@ -120,3 +156,26 @@ def did_liked_place(
 
   log.info("User %r %s", identity.uid, "liked place" if place_id else "disliked place")
   return liked_place
+
+
+async def did_liked_place_async(
+  identity: Identity,
+  place_id: UUID,
+  db: AsyncSession
+) -> bool:
+  if identity is None:
+    log.warning("Identity is None and did_liked_place cannot be done")
+    raise HTTPException(status_code=404, detail="User not found")
+
+  liked_place = (
+                  await db.scalar(
+                    select(LikesModel)
+                    .filter(
+                      LikesModel.user_id == identity.uid,
+                      LikesModel.place_id == place_id
+                    )
+                  )
+                ) is not None
+
+  log.info("User %r %s", identity.uid, "liked place" if place_id else "disliked place")
+  return liked_place
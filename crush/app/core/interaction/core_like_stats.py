@@ -0,0 +1,161 @@
+import logging
+from datetime import date
+from sqlalchemy import func, Row, delete, Subquery
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.functions import count
+from typing import Optional, Tuple
+from uuid import UUID
+
+from app.core.database.database import SessionLocal
+from app.models.interacrions.LikeModel import LikesModel
+from app.models.interacrions.LikeStatsModel import PlaceLikeStatsModel, PlaceLikeDailyModel
+from app.models.locations.PlaceModel import PlaceModel
+
+log = logging.getLogger(__name__)
+
+RECENT_WINDOW_MAX_DAYS = 30
+
+
+def apply_like_delta(
+  place_id: UUID,
+  liked_on: Optional[date],
+  delta: int,
+  db: Session
+):
+  # 호출한 쪽의 트랜잭션에 포함되므로 likes와 집계가 함께 commit/rollback 됨
+  # liked_on이 None이면 오늘(DB 기준) 누른 좋아요
+  db.execute(
+    insert(PlaceLikeStatsModel)
+    .values(place_id=place_id, like_count=max(delta, 0))
+    .on_conflict_do_update(
+      index_elements=[PlaceLikeStatsModel.place_id],
+      set_={
+        "like_count": func.greatest(PlaceLikeStatsModel.like_count + delta, 0),
+        "updated_at": func.now()
+      }
+    )
+  )
+
+  day = func.current_date() if liked_on is None else liked_on
+  db.execute(
+    insert(PlaceLikeDailyModel)
+    .values(place_id=place_id, day=day, like_count=max(delta, 0))
+    .on_conflict_do_update(
+      index_elements=[PlaceLikeDailyModel.place_id, PlaceLikeDailyModel.day],
+      set_={
+        "like_count": func.greatest(PlaceLikeDailyModel.like_count + delta, 0)
+      }
+    )
+  )
+
+
+def like_counts(
+  days: Optional[int],
+  db: Session
+) -> Subquery:
+  # days가 주어지면 최근 days일 동안의 좋아요 수, 아니면 전체 좋아요 수
+  if days is None:
+    return db.query(
+      PlaceLikeStatsModel.place_id,
+      PlaceLikeStatsModel.like_count.label("likes")
+    ).subquery()
+
+  return (
+    db.query(
+      PlaceLikeDailyModel.place_id,
+      func.sum(PlaceLikeDailyModel.like_count).label("likes")
+    )
+    .filter(PlaceLikeDailyModel.day > func.current_date() - days)
+    .group_by(PlaceLikeDailyModel.place_id)
+    .subquery()
+  )
+
+
+def popular_places(
+  days: Optional[int],
+  region_uid: Optional[UUID],
+  limit: int,
+  db: Session
+) -> list[Tuple[PlaceModel, int]]:
+  stats = like_counts(days, db)
+
+  query = (
+    db.query(PlaceModel, stats.c.likes)
+    .join(stats, stats.c.place_id == PlaceModel.uid)
+    .filter(stats.c.likes > 0)
+  )
+  if region_uid is not None:
+    query = query.filter(PlaceModel.region_uid == region_uid)
+
+  popular: list[Row[Tuple[PlaceModel, int]]] = (
+    query
+    .order_by(stats.c.likes.desc(), PlaceModel.uid)
+    .limit(limit)
+    .all()
+  )
+
+  log.info("Found %d popular places. days=%r region=%r", len(popular), days, region_uid)
+  return [(place, int(likes)) for place, likes in popular]
+
+
+def popular_regions(
+  days: Optional[int],
+  limit: int,
+  db: Session
+) -> list[Tuple[UUID, int]]:
+  stats = like_counts(days, db)
+  likes = func.sum(stats.c.likes)
+
+  regions: list[Row[Tuple[UUID, int]]] = (
+    db.query(PlaceModel.region_uid, likes.label("likes"))
+    .join(stats, stats.c.place_id == PlaceModel.uid)
+    .filter(PlaceModel.region_uid.isnot(None))
+    .group_by(PlaceModel.region_uid)
+    .having(likes > 0)
+    .order_by(likes.desc(), PlaceModel.region_uid)
+    .limit(limit)
+    .all()
+  )
+
+  log.info("Found %d popular regions. days=%r", len(regions), days)
+  return [(region_uid, int(likes)) for region_uid, likes in regions]
+
+
+def rebuild_like_stats(db: Session):
+  # 집계가 likes와 어긋났을 때(수동 데이터 수정 등) 전체를 다시 계산
+  db.execute(delete(PlaceLikeStatsModel))
+  db.execute(delete(PlaceLikeDailyModel))
+
+  db.execute(
+    insert(PlaceLikeStatsModel).from_select(
+      ["place_id", "like_count"],
+      db.query(LikesModel.place_id, count(LikesModel.user_id))
+      .group_by(LikesModel.place_id)
+    )
+  )
+
+  liked_on = func.date(LikesModel.liked_at)
+  db.execute(
+    insert(PlaceLikeDailyModel).from_select(
+      ["place_id", "day", "like_count"],
+      db.query(LikesModel.place_id, liked_on, count(LikesModel.user_id))
+      .filter(liked_on > func.current_date() - RECENT_WINDOW_MAX_DAYS)
+      .group_by(LikesModel.place_id, liked_on)
+    )
+  )
+
+  db.commit()
+  log.info("Like stats were rebuilt")
+
+
+def prune_like_daily():
+  with SessionLocal() as db:
+    pruned = (
+      db.query(PlaceLikeDailyModel)
+      .filter(PlaceLikeDailyModel.day <= func.current_date() - RECENT_WINDOW_MAX_DAYS)
+      .delete(synchronize_session=False)
+    )
+    db.commit()
+
+  log.info("Pruned %d daily like stats", pruned)
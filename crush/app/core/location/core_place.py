@@ -1,13 +1,19 @@
+import base64
+import json
 import logging
 import numpy as np
 from fastapi import HTTPException
 from numpy._typing import NDArray
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional
 from uuid import UUID
 
 from app.core.database.database import jsonb_path_equals
+from app.core.database.read_cache import ReadThroughCache
 from app.core.hangul.umso import 풀어쓰기
+from app.core.location import core_suggest
 from app.core.recommendation import core_prefer_vector
 from app.models.locations.PlaceModel import PlaceModel
 from app.models.preferences.PlaceThemeModel import PlaceThemeModel
@@ -17,6 +23,28 @@ from app.schemas.location.PlaceRequests import AddPlace, PatchPlace, PlaceSearch
 log = logging.getLogger(__name__)
 
 
+def decode_cached_place(cached: str) -> Place:
+  # Place.__init__은 PlaceModel을 받으므로 검증 없이 필드로 바로 생성
+  place = json.loads(cached)
+  place["uid"] = UUID(place["uid"])
+  if place["region_uid"] is not None:
+    place["region_uid"] = UUID(place["region_uid"])
+  return Place.model_construct(**place)
+
+
+place_cache: ReadThroughCache[Place] = ReadThroughCache(
+  "place",
+  encode=lambda place: json.dumps(place.model_dump()),
+  decode=decode_cached_place
+)
+
+place_theme_cache: ReadThroughCache[NDArray[np.float32]] = ReadThroughCache(
+  "place_theme",
+  encode=lambda theme: base64.b64encode(theme.astype(np.float32).tobytes()).decode("ascii"),
+  decode=lambda cached: np.frombuffer(base64.b64decode(cached), dtype=np.float32)
+)
+
+
 def add_place(
   place_data: AddPlace,
   db: Session
@@ -61,6 +89,62 @@ ALLOWED_QUERY = {
 }
 
 
+def place_search_filters(
+  q: PlaceSearchQuery
+) -> list:
+  filters = []
+
+  if q.name is not None:
+    qname_umso = 풀어쓰기(q.name)
+    log.debug("Added name %s filter for place search", qname_umso)
+    if q.fuzzy:
+      filters.append(PlaceModel.name_umso.op("%")(qname_umso))
+    else:
+      filters.append(PlaceModel.name_umso.like("%" + qname_umso + "%"))
+  if q.region_uid is not None:
+    log.debug("Added region %s filter for place search", q.region_uid)
+    filters.append(PlaceModel.region_uid == q.region_uid)
+  if q.address is not None:
+    log.debug("Added address %s filter for place search", q.address)
+    if q.fuzzy:
+      filters.append(PlaceModel.address.op("%")(q.address))
+    else:
+      filters.append(PlaceModel.address.like("%" + q.address + "%"))
+
+  if q.metadata != "":
+    meta_pairs = q.metadata.split(",")
+    meta = [meta_pair.split("=") for meta_pair in meta_pairs]
+    for mdata in meta:
+      key, value = mdata[0], mdata[1]
+      mtype = ALLOWED_QUERY.get(key, None)
+      if mtype is not None:
+        log.debug("Added metadata %s=%s filter for place search", key, value)
+        filters.append(jsonb_path_equals(PlaceModel.place_meta, key, value))
+
+  return filters
+
+
+def place_search_ordering(
+  q: PlaceSearchQuery
+) -> list:
+  # pg_trgm 유사도 순으로 정렬
+  rank = []
+
+  if q.name is not None:
+    rank.append(func.similarity(PlaceModel.name_umso, 풀어쓰기(q.name)))
+  if q.address is not None:
+    rank.append(func.similarity(PlaceModel.address, q.address))
+
+  if len(rank) == 0:
+    return []
+
+  score = rank[0]
+  for r in rank[1:]:
+    score = score + r
+
+  return [score.desc(), PlaceModel.uid]
+
+
 def search_place(
   q: PlaceSearchQuery,
   db: Session
@@ -69,35 +153,16 @@ def search_place(
 
   if q.uid is not None:
     log.debug("Searching place with uid=%s", q.uid)
-    places_db = (
-      query
-      .filter(PlaceModel.uid == q.uid)
-      .all()
-    )
+
+    def load_place() -> Optional[Place]:
+      place_db = query.filter(PlaceModel.uid == q.uid).scalar()
+      return Place(place_db) if place_db is not None else None
+
+    place = place_cache.get_or_load(q.uid, load_place)
+    return [place] if place is not None else []
   else:
-    if q.name is not None:
-      qname_umso = 풀어쓰기(q.name)
-      log.debug("Added name %s filter for place search", qname_umso)
-      query = query.filter(PlaceModel.name_umso.like("%" + qname_umso + "%"))
-    if q.region_uid is not None:
-      log.debug("Added region %s filter for place search", q.region_uid)
-      query = query.filter(PlaceModel.region_uid == q.region_uid)
-    if q.address is not None:
-      log.debug("Added address %s filter for place search", q.address)
-      query = query.filter(PlaceModel.address.like("%" + q.address + "%"))
-
-    if q.metadata != "":
-      meta_pairs = q.metadata.split(",")
-      meta = [meta_pair.split("=") for meta_pair in meta_pairs]
-      for mdata in meta:
-        key, value = mdata[0], mdata[1]
-        mtype = ALLOWED_QUERY.get(key, None)
-        if mtype is not None:
-          log.debug("Added metadata %s=%s filter for place search", key, value)
-
-          query = query.filter(
-            jsonb_path_equals(PlaceModel.place_meta, key, value)
-          )
+    query = query.filter(*place_search_filters(q))
+    query = query.order_by(*place_search_ordering(q))
 
     query = query.limit(q.limit)
     log.debug("Query limit set to %d", q.limit)
@@ -107,6 +172,36 @@ def search_place(
   return [Place(place) for place in places_db]
 
 
+async def search_place_async(
+  q: PlaceSearchQuery,
+  db: AsyncSession
+) -> list[Place]:
+  stmt = select(PlaceModel)
+
+  if q.uid is not None:
+    log.debug("Searching place with uid=%s", q.uid)
+
+    place = await place_cache.get_async(q.uid)
+    if place is None:
+      place_db = await db.scalar(stmt.filter(PlaceModel.uid == q.uid))
+      if place_db is None:
+        return []
+      place = Place(place_db)
+      await place_cache.put_async(q.uid, place)
+
+    return [place]
+  else:
+    stmt = stmt.filter(*place_search_filters(q))
+    stmt = stmt.order_by(*place_search_ordering(q))
+
+    stmt = stmt.limit(q.limit)
+    log.debug("Query limit set to %d", q.limit)
+
+  places_db = (await db.execute(stmt)).scalars().all()
+
+  return [Place(place) for place in places_db]
+
+
 def delete_place(
   place_id: UUID,
   db: Session
@@ -117,6 +212,12 @@ def delete_place(
     .delete()
   )
   db.commit()
+
+  if delete > 0:
+    core_suggest.remove_place(place_id)
+    place_cache.invalidate(place_id)
+    place_theme_cache.invalidate(place_id)
+
   return delete
 
 
@@ -164,19 +265,25 @@ def patch_place(
 
   db.commit()
 
+  place_cache.invalidate(place_id)
+  place_theme_cache.invalidate(place_id)
+
 
 def get_place_theme(
   place_id: UUID,
   db: Session
 ) -> NDArray[np.float32]:
-  place_theme: Optional[PlaceThemeModel] = (
-    db.query(PlaceThemeModel)
-    .filter(PlaceThemeModel.place_id == place_id)
-    .scalar()
+  place_theme: Optional[NDArray[np.float32]] = place_theme_cache.get_or_load(
+    place_id,
+    lambda: (
+      db.query(PlaceThemeModel.theme)
+      .filter(PlaceThemeModel.place_id == place_id)
+      .scalar()
+    )
   )
 
   if place_theme is None:
     log.warning("Place %s was not found", place_id)
     raise HTTPException(status_code=404, detail="No region was found")
 
-  return place_theme.theme
+  return place_theme
@@ -1,10 +1,15 @@
+import json
 import logging
 from fastapi import HTTPException
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional
 from uuid import UUID
 
+from app.core.database.read_cache import ReadThroughCache
 from app.core.hangul.umso import 풀어쓰기
+from app.core.location import core_suggest
 from app.models.locations.RegionModel import RegionModel
 from app.schemas.location.Region import Region
 from app.schemas.location.RegionsRequests import AddRegion, RegionSearchQuery, PatchRegion
@@ -12,6 +17,30 @@ from app.schemas.location.RegionsRequests import AddRegion, RegionSearchQuery, P
 log = logging.getLogger(__name__)
 
 
+def decode_cached_region(cached: str) -> Region:
+  # Region.__init__은 RegionModel을 받으므로 검증 없이 필드로 바로 생성
+  region = json.loads(cached)
+  region["uid"] = UUID(region["uid"])
+  return Region.model_construct(**region)
+
+
+region_cache: ReadThroughCache[Region] = ReadThroughCache(
+  "region",
+  encode=lambda region: json.dumps(region.model_dump()),
+  decode=decode_cached_region
+)
+
+
+def region_name_filter(
+  qname_umso: str,
+  fuzzy: bool
+):
+  if fuzzy:
+    return RegionModel.name_umso.op("%")(qname_umso)
+  else:
+    return RegionModel.name_umso.like("%" + qname_umso + "%")
+
+
 def add_region(
   region_data: AddRegion,
   db: Session
@@ -35,18 +64,20 @@ def search_region(
   if query.uid is not None:
     log.debug("Searching region with uid=%s", query.uid)
 
-    regions_db = (
-      db.query(RegionModel)
-      .filter(RegionModel.uid == query.uid)
-      .all()
-    )
+    def load_region() -> Optional[Region]:
+      region_db = db.query(RegionModel).filter(RegionModel.uid == query.uid).scalar()
+      return Region(region_db) if region_db is not None else None
+
+    region = region_cache.get_or_load(query.uid, load_region)
+    return [region] if region is not None else []
   elif query.name is not None:
     qname_umso = 풀어쓰기(query.name)
     log.debug("Searching region with name=%s", qname_umso)
 
     regions_db = (
       db.query(RegionModel)
-      .filter(RegionModel.name_umso.like("%" + qname_umso + "%"))
+      .filter(region_name_filter(qname_umso, query.fuzzy))
+      .order_by(func.similarity(RegionModel.name_umso, qname_umso).desc(), RegionModel.uid)
       .limit(query.limit)
       .all()
     )
@@ -57,6 +88,41 @@ def search_region(
   return [Region(region) for region in regions_db]
 
 
+async def search_region_async(
+  query: RegionSearchQuery,
+  db: AsyncSession
+) -> list[Region]:
+  if query.uid is not None:
+    log.debug("Searching region with uid=%s", query.uid)
+
+    region = await region_cache.get_async(query.uid)
+    if region is None:
+      region_db = await db.scalar(select(RegionModel).filter(RegionModel.uid == query.uid))
+      if region_db is None:
+        return []
+      region = Region(region_db)
+      await region_cache.put_async(query.uid, region)
+
+    return [region]
+  elif query.name is not None:
+    qname_umso = 풀어쓰기(query.name)
+    log.debug("Searching region with name=%s", qname_umso)
+
+    stmt = (
+      select(RegionModel)
+      .filter(region_name_filter(qname_umso, query.fuzzy))
+      .order_by(func.similarity(RegionModel.name_umso, qname_umso).desc(), RegionModel.uid)
+      .limit(query.limit)
+    )
+  else:
+    log.debug("No condition available for region search")
+    return []
+
+  regions_db = (await db.execute(stmt)).scalars().all()
+
+  return [Region(region) for region in regions_db]
+
+
 def delete_region(
   region_id: UUID,
   db: Session
@@ -67,6 +133,11 @@ def delete_region(
     .delete()
   )
   db.commit()
+
+  if delete > 0:
+    core_suggest.remove_region(region_id)
+    region_cache.invalidate(region_id)
+
   return delete
 
 
@@ -96,3 +167,5 @@ def patch_region(
     region.thumbnail = query.thumbnail
 
   db.commit()
+
+  region_cache.invalidate(region_id)
@@ -0,0 +1,232 @@
+import heapq
+import json
+import logging
+import threading
+from collections import defaultdict
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+from typing import Tuple
+from uuid import UUID
+
+from app.core.database.database import SessionLocal, redis_db0
+from app.core.hangul.umso import 풀어쓰기
+from app.models.locations.PlaceModel import PlaceModel
+from app.models.locations.RegionModel import RegionModel
+
+log = logging.getLogger(__name__)
+
+UMSO_INDEX_CHANNEL = "location:umso-index"
+PENDING_KEY = "umso_index_pending"
+
+
+class UmsoIndex:
+  def __init__(self, gram_size: int = 2):
+    self._gram_size = gram_size
+    self._lock = threading.Lock()
+    self._entries: dict[UUID, Tuple[str, str]] = {}
+    self._postings: dict[str, set[UUID]] = defaultdict(set)
+
+  def _grams(self, umso: str) -> set[str]:
+    grams = set()
+    for n in range(1, self._gram_size + 1):
+      for i in range(len(umso) - n + 1):
+        grams.add(umso[i:i + n])
+    return grams
+
+  def _query_grams(self, umso: str) -> set[str]:
+    n = min(len(umso), self._gram_size)
+    return {umso[i:i + n] for i in range(len(umso) - n + 1)}
+
+  def _remove_locked(self, uid: UUID):
+    entry = self._entries.pop(uid, None)
+    if entry is None:
+      return
+
+    for gram in self._grams(entry[1]):
+      posting = self._postings.get(gram)
+      if posting is None:
+        continue
+      posting.discard(uid)
+      if len(posting) == 0:
+        del self._postings[gram]
+
+  def upsert(self, uid: UUID, name: str, name_umso: str):
+    with self._lock:
+      self._remove_locked(uid)
+      self._entries[uid] = (name, name_umso)
+      for gram in self._grams(name_umso):
+        self._postings[gram].add(uid)
+
+  def remove(self, uid: UUID):
+    with self._lock:
+      self._remove_locked(uid)
+
+  def clear(self):
+    with self._lock:
+      self._entries.clear()
+      self._postings.clear()
+
+  def __len__(self):
+    return len(self._entries)
+
+  def search(self, query_umso: str, limit: int) -> list[Tuple[UUID, str]]:
+    if query_umso == "":
+      return []
+
+    with self._lock:
+      postings = []
+      for gram in self._query_grams(query_umso):
+        posting = self._postings.get(gram)
+        if posting is None:
+          return []
+        postings.append(posting)
+
+      postings.sort(key=len)
+      smallest, rest = postings[0], postings[1:]
+
+      matches = []
+      for uid in smallest:
+        if not all(uid in posting for posting in rest):
+          continue
+        name, name_umso = self._entries[uid]
+        pos = name_umso.find(query_umso)
+        if pos >= 0:
+          matches.append((pos, len(name_umso), name, uid))
+
+    # 앞부분 일치, 짧은 이름 순
+    return [(uid, name) for _, _, name, uid in heapq.nsmallest(limit, matches)]
+
+
+place_index = UmsoIndex()
+region_index = UmsoIndex()
+
+INDEXES = {
+  "place": place_index,
+  "region": region_index
+}
+
+
+def suggest_place(q: str, limit: int) -> list[dict[str, str]]:
+  return [{
+    "uid": str(uid),
+    "name": name
+  } for uid, name in place_index.search(풀어쓰기(q), limit)]
+
+
+def suggest_region(q: str, limit: int) -> list[dict[str, str]]:
+  return [{
+    "uid": str(uid),
+    "name": name
+  } for uid, name in region_index.search(풀어쓰기(q), limit)]
+
+
+def publish_change(kind: str, op: str, uid: UUID, name: str = None, name_umso: str = None):
+  message = {
+    "index": kind,
+    "op": op,
+    "uid": str(uid),
+  }
+  if op == "upsert":
+    message["name"] = name
+    message["name_umso"] = name_umso
+
+  apply_change(message)
+
+  try:
+    redis_db0.publish(UMSO_INDEX_CHANNEL, json.dumps(message))
+  except Exception as e:
+    log.warning("Failed to publish umso index change of %s %s: %s", kind, uid, e)
+
+
+def apply_change(message: dict[str, str]):
+  index = INDEXES.get(message.get("index"))
+  if index is None:
+    log.warning("Unknown umso index %r", message.get("index"))
+    return
+
+  uid = UUID(message["uid"])
+  if message["op"] == "upsert":
+    index.upsert(uid, message["name"], message["name_umso"])
+  elif message["op"] == "delete":
+    index.remove(uid)
+
+
+def remove_place(place_id: UUID):
+  publish_change("place", "delete", place_id)
+
+
+def remove_region(region_id: UUID):
+  publish_change("region", "delete", region_id)
+
+
+def _on_message(message):
+  try:
+    apply_change(json.loads(message["data"]))
+  except Exception as e:
+    log.warning("Malformed umso index message %r: %s", message.get("data"), e)
+
+
+def load_index():
+  # 구독을 먼저 시작해야 적재 중 다른 worker의 변경을 놓치지 않음
+  pubsub = redis_db0.pubsub(ignore_subscribe_messages=True)
+  pubsub.subscribe(**{UMSO_INDEX_CHANNEL: _on_message})
+  pubsub.run_in_thread(sleep_time=1, daemon=True)
+
+  place_index.clear()
+  region_index.clear()
+
+  with SessionLocal() as db:
+    for uid, name, name_umso in db.query(PlaceModel.uid, PlaceModel.name, PlaceModel.name_umso).yield_per(10000):
+      place_index.upsert(uid, name, name_umso)
+    for uid, name, name_umso in db.query(RegionModel.uid, RegionModel.name, RegionModel.name_umso).yield_per(10000):
+      region_index.upsert(uid, name, name_umso)
+
+  log.info("Umso index was loaded with %d places and %d regions", len(place_index), len(region_index))
+
+
+def _queue_change(target, kind: str):
+  db = object_session(target)
+  if db is None:
+    return
+  db.info.setdefault(PENDING_KEY, {})[(kind, target.uid)] = (target.name, target.name_umso)
+
+
+# uid는 server default로 생성되므로 insert 이후에 색인하고, 반영은 commit 이후에 함
+@event.listens_for(PlaceModel, "after_insert")
+@event.listens_for(PlaceModel, "after_update")
+def place_queue_index(mapper, connection, target: PlaceModel):
+  _queue_change(target, "place")
+
+
+@event.listens_for(RegionModel, "after_insert")
+@event.listens_for(RegionModel, "after_update")
+def region_queue_index(mapper, connection, target: RegionModel):
+  _queue_change(target, "region")
+
+
+@event.listens_for(PlaceModel, "after_delete")
+@event.listens_for(RegionModel, "after_delete")
+def queue_index_removal(mapper, connection, target):
+  db = object_session(target)
+  if db is None:
+    return
+  kind = "place" if isinstance(target, PlaceModel) else "region"
+  db.info.setdefault(PENDING_KEY, {})[(kind, target.uid)] = None
+
+
+@event.listens_for(Session, "after_commit")
+def flush_index_changes(db: Session):
+  pending = db.info.pop(PENDING_KEY, None)
+  if not pending:
+    return
+
+  for (kind, uid), entry in pending.items():
+    if entry is None:
+      publish_change(kind, "delete", uid)
+    else:
+      publish_change(kind, "upsert", uid, *entry)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_index_changes(db: Session):
+  db.info.pop(PENDING_KEY, None)
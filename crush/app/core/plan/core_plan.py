@@ -1,12 +1,15 @@
 import logging
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 from uuid import UUID
 
+from app.core.relationship import core_following
 from app.models.locations.RegionModel import RegionModel
 from app.models.plan.PlanMemberModel import PlanMemberModel, PlanRole
 from app.models.plan.PlanModel import PlanModel
-from app.models.users.RelationshipModel import RelationshipModel, RelationshipState
+from app.models.users.RelationshipModel import RelationshipState
 from app.schemas.plan.Plan import Plan
 from app.schemas.plan.PlanRequests import AddPlanRequest, FixDateRequest, ChangePlanNameRequest
 
@@ -62,15 +65,8 @@ def create_plan(
     raise HTTPException(status_code=400, detail="Members contain duplicated user IDs")
 
   # host는 members에게 친구 관계여야 함
-  relationship_check = (
-    db.query(RelationshipModel)
-    .filter(
-      RelationshipModel.user_id == host_id,
-      RelationshipModel.friend_id.in_(new_plan.members),
-      RelationshipModel.state >= RelationshipState.FRIEND
-    )
-    .count()
-  )
+  states = core_following.query_followings(host_id, new_plan.members, db)
+  relationship_check = sum(1 for state in states.values() if state.value >= RelationshipState.FRIEND.value)
 
   if relationship_check != len(new_plan.members):
     log.warning("Invalid Plan addition request: requested %d members, only %d are friends", len(new_plan.members),
@@ -164,6 +160,51 @@ def get_plan(
   }
 
 
+async def get_plan_async(
+  plan_id: UUID,
+  identity_uuid: UUID,
+  db: AsyncSession
+) -> dict[str, object]:
+  plan_model = await db.scalar(
+    select(PlanModel)
+    .join(PlanMemberModel, PlanModel.uid == PlanMemberModel.plan_id)
+    .filter(
+      PlanModel.uid == plan_id,
+      PlanMemberModel.user_id == identity_uuid
+    )
+  )
+
+  if plan_model is None:
+    log.warning("Plan uid=%r with uid=%r is a member was not found", plan_id, identity_uuid)
+    raise HTTPException(status_code=404, detail="Plan not found")
+
+  members = (
+    await db.execute(
+      select(PlanMemberModel)
+      .options(selectinload(PlanMemberModel.user))
+      .filter(PlanMemberModel.plan_id == plan_model.uid)
+    )
+  ).scalars().all()
+
+  return {
+    "uid": str(plan_model.uid),
+    "name": plan_model.name,
+    "date": {
+      "polling": plan_model.polling_date.isoformat() if plan_model.polling_date else None,
+      "from": plan_model.date_from.isoformat() if plan_model.date_from else None,
+      "to": plan_model.date_to.isoformat() if plan_model.date_to else None
+    },
+    "members": [
+      {
+        "uid": str(member.user_id),
+        "name": member.user.name,
+        "role": member.role.value
+      }
+      for member in members
+    ]
+  }
+
+
 def fix_plan_date(
   request: FixDateRequest,
   plan_id: UUID,
@@ -207,3 +248,19 @@ def list_plans(
   )
 
   return [Plan(plan) for plan in plans]
+
+
+async def list_plans_async(
+  sub: UUID,
+  db: AsyncSession
+) -> list[Plan]:
+  plans = (
+    await db.execute(
+      select(PlanModel)
+      .join(PlanMemberModel, PlanModel.uid == PlanMemberModel.plan_id)
+      .filter(PlanMemberModel.user_id == sub)
+      .order_by(PlanModel.created_at.desc())
+    )
+  ).scalars().all()
+
+  return [Plan(plan) for plan in plans]
@@ -4,8 +4,9 @@ from sqlalchemy.orm import Session
 from uuid import UUID
 
 from app.core.plan.core_plan import get_plan_with_role
+from app.core.relationship import core_following
 from app.models.plan.PlanMemberModel import PlanMemberModel, PlanRole
-from app.models.users.RelationshipModel import RelationshipModel, RelationshipState
+from app.models.users.RelationshipModel import RelationshipState
 from app.schemas.plan.PlanMemberRequests import PatchPlanMemberReqs
 
 log = logging.getLogger(__name__)
@@ -20,15 +21,8 @@ def patch_members(
   plan = get_plan_with_role(plan_id, sub, db, PlanRole.HOST, PlanRole.COHOST)
 
   # 요청자는 members에게 친구 관계여야 함
-  relationship_check = (
-    db.query(RelationshipModel)
-    .filter(
-      RelationshipModel.user_id == sub,
-      RelationshipModel.friend_id.in_(req.members),
-      RelationshipModel.state >= RelationshipState.FRIEND
-    )
-    .count()
-  )
+  states = core_following.query_followings(sub, req.members, db)
+  relationship_check = sum(1 for state in states.values() if state.value >= RelationshipState.FRIEND.value)
 
   if relationship_check != len(req.members):
     log.warning("Invalid member patch request: requested %d members, only %d are friends", len(req.members),
@@ -1,37 +1,55 @@
 import logging
+import numpy as np
 from fastapi import HTTPException
-from sqlalchemy import Row, and_
+from numpy.typing import NDArray
+from sqlalchemy import Row, and_, func, select
 from sqlalchemy.orm import Session
 from sqlalchemy.sql.functions import count
-from typing import Tuple
+from typing import Tuple, Optional, Literal
 from uuid import UUID
 
 from app.core.relationship import core_following
 from app.models.interacrions.LikeModel import LikesModel
+from app.models.interacrions.LikeStatsModel import PlaceLikeStatsModel
 from app.models.locations.PlaceModel import PlaceModel
+from app.models.preferences.PlaceThemeModel import PlaceThemeModel
+from app.models.preferences.UserPrefer import UserPrefer
 from app.models.users.RelationshipModel import RelationshipState
 from app.schemas.user.Identity import Identity
 
 log = logging.getLogger(__name__)
 
+GROUP_STRATEGIES = ("mean", "least_misery", "weighted")
+GROUP_CANDIDATE_FACTOR = 4
+# region 조건이 있으면 HNSW 후보를 이만큼 넉넉히 탐색 (pgvector의 ef_search 상한은 1000)
+FILTERED_EF_SEARCH_FACTOR = 10
+MAX_EF_SEARCH = 1000
 
-def recommend_region_from_users(
+
+def verify_friends(
   host: Identity,
   by_users: list[UUID],
   db: Session
-) -> list[dict[str, str | int]]:
-  # 모든 users가 host를 친구로 추가했는지 확인
-  for user in by_users:
-    if user == host.uid:
-      continue
-    state = core_following.query_following(host, user, db)
-    if state is None:
-      log.warning(f"Illegal recommendation request. %r->%r was not found", host.uid, user)
-      raise HTTPException(status_code=400, detail="Followee is not your friend")
+):
+  if host is None:
+    log.warning("Identity is None and recommendation cannot be done")
+    raise HTTPException(status_code=404, detail="User not found")
+
+  states = core_following.query_followings(host.uid, [user for user in by_users if user != host.uid], db)
+  for user, state in states.items():
     if state.value < RelationshipState.FRIEND.value:
       log.warning("Illegal recommendation request. %r->%r=%d", host.uid, user, state.value)
       raise HTTPException(status_code=400, detail="Followee is not your friend")
 
+
+def recommend_region_from_users(
+  host: Identity,
+  by_users: list[UUID],
+  db: Session
+) -> list[dict[str, str | int]]:
+  # 모든 users가 host를 친구로 추가했는지 확인
+  verify_friends(host, by_users, db)
+
   # host, users가 좋아한 place의 region 중 place의 수가 많은 것 순서로 쿼리
   recommended_regions: list[Row[Tuple[UUID, int]]] = (
     db.query(
@@ -63,16 +81,7 @@ def recommend_place_from_users(
   from_region: list[UUID],
   db: Session
 ) -> list[dict[str, str | int]]:
-  for user in by_users:
-    if user == host.uid:
-      continue
-    state = core_following.query_following(host, user, db)
-    if state is None:
-      log.warning("Illegal recommendation request. %r->%r was not found", host.uid, user)
-      raise HTTPException(status_code=400, detail="Followee is not your friend")
-    elif state.value < RelationshipState.FRIEND.value:
-      log.warning("Illegal recommendation request. %r->%r=%d", host.uid, user, state.value)
-      raise HTTPException(status_code=400, detail="Followee is not your friend")
+  verify_friends(host, by_users, db)
 
   recommended_places: list[Row[Tuple[UUID, int]]] = (
     db.query(
@@ -87,10 +96,15 @@ def recommend_place_from_users(
       )
     ).join(
       PlaceModel, LikesModel.place_id == PlaceModel.uid
+    ).outerjoin(
+      PlaceLikeStatsModel, PlaceLikeStatsModel.place_id == PlaceModel.uid
     ).group_by(
-      PlaceModel.uid
+      PlaceModel.uid,
+      PlaceLikeStatsModel.like_count
     ).order_by(
-      count(PlaceModel.uid).desc()
+      count(PlaceModel.uid).desc(),
+      # 그룹 안에서 동점이면 전체 좋아요 수(집계 테이블)가 많은 순
+      func.coalesce(PlaceLikeStatsModel.like_count, 0).desc()
     ).all()
   )
 
@@ -100,3 +114,201 @@ def recommend_place_from_users(
     "place": str(place[0]),
     "score": place[1]
   } for place in recommended_places]
+
+
+def widen_filtered_scan(
+  limit: int,
+  db: Session
+):
+  # HNSW는 ef_search개의 후보를 뽑은 뒤 WHERE 조건을 거르므로, 조건이 있으면 후보가 모자랄 수 있음
+  # 후보가 모자라면 순서를 지키며 이어서 탐색하고(pgvector 0.8+), 한 번에 뽑는 후보 수도 늘림
+  # set_config(..., true)는 SET LOCAL과 같이 현재 transaction에만 적용됨
+  ef_search = min(max(limit * FILTERED_EF_SEARCH_FACTOR, 40), MAX_EF_SEARCH)
+  db.execute(select(func.set_config("hnsw.iterative_scan", "strict_order", True)))
+  db.execute(select(func.set_config("hnsw.ef_search", str(ef_search), True)))
+
+
+def recommend_place_for_user(
+  identity: Identity,
+  from_region: Optional[list[UUID]],
+  limit: int,
+  db: Session
+) -> list[dict[str, str | float]]:
+  if identity is None:
+    log.warning("Identity is None and personal recommendation cannot be done")
+    raise HTTPException(status_code=404, detail="User not found")
+
+  prefer = (
+    db.query(UserPrefer.prefer)
+    .filter(UserPrefer.user_id == identity.uid)
+    .scalar()
+  )
+
+  if prefer is None:
+    log.warning("Preference vector of %r was not found", identity.uid)
+    raise HTTPException(status_code=404, detail="Preference not found")
+
+  # <#>는 음의 내적이므로 오름차순이 선호도 높은 순 (place_theme HNSW vector_ip_ops 인덱스 사용)
+  distance = PlaceThemeModel.theme.max_inner_product(prefer)
+
+  query = db.query(
+    PlaceThemeModel.place_id,
+    distance.label("distance")
+  )
+
+  if from_region is not None:
+    log.debug("Restricting personal recommendation of %r to regions %r", identity.uid, from_region)
+    widen_filtered_scan(limit, db)
+    query = (
+      query
+      .join(PlaceModel, PlaceThemeModel.place_id == PlaceModel.uid)
+      .filter(PlaceModel.region_uid.in_(from_region))
+    )
+
+  recommended_places: list[Row[Tuple[UUID, float]]] = (
+    query
+    .order_by(distance)
+    .limit(limit)
+    .all()
+  )
+
+  log.info("Found %d personal recommended places for %r", len(recommended_places), identity.uid)
+
+  return [{
+    "place": str(place[0]),
+    "score": -place[1]
+  } for place in recommended_places]
+
+
+def aggregate_preferences(
+  prefers: NDArray[np.float32],
+  strategy: Literal["mean", "least_misery", "weighted"],
+  weights: Optional[NDArray[np.float32]] = None
+) -> NDArray[np.float32]:
+  if strategy == "mean":
+    return prefers.mean(axis=0)
+  elif strategy == "least_misery":
+    return prefers.min(axis=0)
+  elif strategy == "weighted":
+    return weights @ prefers
+  raise ValueError(f"Unknown group strategy {strategy!r}")
+
+
+def score_for_group(
+  themes: NDArray[np.float32],
+  prefers: NDArray[np.float32],
+  strategy: Literal["mean", "least_misery", "weighted"],
+  weights: Optional[NDArray[np.float32]] = None
+) -> NDArray[np.float32]:
+  # (장소 수, 멤버 수) 행렬로 멤버별 선호도를 한 번에 계산
+  scores = themes @ prefers.T
+  if strategy == "mean":
+    return scores.mean(axis=1)
+  elif strategy == "least_misery":
+    return scores.min(axis=1)
+  elif strategy == "weighted":
+    return scores @ weights
+  raise ValueError(f"Unknown group strategy {strategy!r}")
+
+
+def recommend_place_for_group(
+  host: Identity,
+  by_users: list[UUID],
+  from_region: Optional[list[UUID]],
+  strategy: Literal["mean", "least_misery", "weighted"],
+  weights: Optional[list[float]],
+  like_weight: float,
+  limit: int,
+  db: Session
+) -> list[dict[str, str | float | int]]:
+  verify_friends(host, by_users, db)
+
+  if strategy == "weighted" and (weights is None or len(weights) != len(by_users)):
+    log.warning("Illegal group recommendation request. %d weights for %d users", len(weights or []), len(by_users))
+    raise HTTPException(status_code=400, detail="Weights do not match users")
+
+  members: list[Row[Tuple[UUID, NDArray[np.float32]]]] = (
+    db.query(UserPrefer.user_id, UserPrefer.prefer)
+    .filter(UserPrefer.user_id.in_(by_users))
+    .all()
+  )
+
+  if len(members) == 0:
+    log.warning("Preference vectors of %r were not found", by_users)
+    raise HTTPException(status_code=404, detail="Preference not found")
+  if len(members) < len(by_users):
+    log.info("Group recommendation of %r without %d members having no preference",
+             by_users, len(by_users) - len(members))
+
+  prefers = np.stack([member[1] for member in members]).astype(np.float32)
+
+  member_weights = None
+  if strategy == "weighted":
+    weight_of = dict(zip(by_users, weights))
+    member_weights = np.array([weight_of[member[0]] for member in members], dtype=np.float32)
+    if member_weights.sum() <= 0:
+      raise HTTPException(status_code=400, detail="Weights do not match users")
+    member_weights /= member_weights.sum()
+
+  # 합친 벡터로 ANN 후보를 넉넉히 뽑고, 후보 안에서 전략별 실제 점수로 다시 정렬
+  # 원소별 min 벡터는 취향이 겹치지 않으면 0 벡터가 되므로 least misery의 후보는 평균 벡터로 뽑음
+  query_strategy = "mean" if strategy == "least_misery" else strategy
+  distance = PlaceThemeModel.theme.max_inner_product(aggregate_preferences(prefers, query_strategy, member_weights))
+
+  candidate_query = db.query(
+    PlaceThemeModel.place_id,
+    PlaceThemeModel.theme
+  )
+  if from_region is not None:
+    widen_filtered_scan(limit * GROUP_CANDIDATE_FACTOR, db)
+    candidate_query = (
+      candidate_query
+      .join(PlaceModel, PlaceThemeModel.place_id == PlaceModel.uid)
+      .filter(PlaceModel.region_uid.in_(from_region))
+    )
+  candidates = (
+    candidate_query
+    .order_by(distance)
+    .limit(limit * GROUP_CANDIDATE_FACTOR)
+    .subquery()
+  )
+
+  likes = (
+    db.query(
+      LikesModel.place_id,
+      count(LikesModel.user_id).label("likes")
+    ).filter(
+      LikesModel.user_id.in_(by_users)
+    ).group_by(
+      LikesModel.place_id
+    ).subquery()
+  )
+
+  recommended_places: list[Row[Tuple[UUID, NDArray[np.float32], int]]] = (
+    db.query(
+      candidates.c.place_id,
+      candidates.c.theme,
+      func.coalesce(likes.c.likes, 0)
+    ).outerjoin(
+      likes, likes.c.place_id == candidates.c.place_id
+    ).all()
+  )
+
+  if len(recommended_places) == 0:
+    return []
+
+  themes = np.stack([place[1] for place in recommended_places]).astype(np.float32)
+  like_counts = np.array([place[2] for place in recommended_places], dtype=np.float32)
+
+  preference = score_for_group(themes, prefers, strategy, member_weights)
+  score = preference + like_weight * like_counts / len(by_users)
+  order = np.argsort(-score, kind="stable")[:limit]
+
+  log.info("Found %d group recommended places for %r by %s", len(order), by_users, strategy)
+
+  return [{
+    "place": str(recommended_places[i][0]),
+    "score": float(score[i]),
+    "preference": float(preference[i]),
+    "likes": int(like_counts[i])
+  } for i in order]
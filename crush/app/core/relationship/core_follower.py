@@ -1,6 +1,8 @@
 import logging
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 from uuid import UUID
 
 from app.models.users.RelationshipModel import RelationshipModel, RelationshipState
@@ -44,6 +46,31 @@ def query_follower(
   return relation.state
 
 
+async def query_follower_async(
+  identity: Identity,
+  follower_id: UUID,
+  db: AsyncSession
+) -> RelationshipModel | None:
+  if identity is None:
+    log.warning("Identity is None and query_follower cannot be done")
+    raise HTTPException(status_code=404, detail="User not found")
+
+  relation = await db.scalar(
+    select(RelationshipModel)
+    .filter(
+      RelationshipModel.user_id == follower_id,
+      RelationshipModel.friend_id == identity.uid
+    )
+  )
+
+  if relation is None:
+    log.warning("Relationship %r<-%r was not found", identity.uid, follower_id)
+    return None
+
+  log.info("Found relationship %r<-%r is %d", identity.uid, follower_id, relation.state.value)
+  return relation.state
+
+
 def unfollow(
   identity: Identity,
   follower_id: UUID,
@@ -159,6 +186,55 @@ def list_followers(
   return [Follower(follower) for follower in followers]
 
 
+async def list_followers_async(
+  identity: Identity,
+  query: ListingRelationshipRequest,
+  db: AsyncSession
+) -> list[Follower]:
+  if identity is None:
+    log.warning("Identity is None and list_followers cannot be done")
+    raise HTTPException(status_code=404, detail="User not found")
+
+  stmt = (
+    select(RelationshipModel)
+    .options(selectinload(RelationshipModel.user))
+    .filter(
+      RelationshipModel.friend_id == identity.uid,
+      RelationshipModel.state != RelationshipState.BLOCKED
+    )
+  )
+
+  if query.state is not None:
+    if query.up:
+      log.debug("Listing relationship closer than %d", query.state.value)
+      stmt = stmt.filter(RelationshipModel.state >= query.state)
+    else:
+      log.debug("Listing relationship of %d", query.state.value)
+      stmt = stmt.filter(RelationshipModel.state == query.state)
+  if query.head is not None:
+    log.debug("Listing relationship head is %r", query.head)
+    head_subquery = (
+      select(RelationshipModel.updated_at)
+      .filter(
+        RelationshipModel.user_id == query.head,
+        RelationshipModel.friend_id == identity.uid
+      )
+      .scalar_subquery()
+    )
+    stmt = stmt.filter(RelationshipModel.updated_at < head_subquery)
+
+  stmt = (
+    stmt
+    .order_by(RelationshipModel.updated_at.desc())
+    .limit(query.limit)
+  )
+
+  followers = (await db.execute(stmt)).scalars().all()
+  log.info("Found %d followers" % len(followers))
+
+  return [Follower(follower) for follower in followers]
+
+
 def count_follower(
   identity: Identity,
   db: Session
@@ -178,3 +254,24 @@ def count_follower(
   log.info("Found %d followings of %s", cnt, identity.uid)
 
   return cnt
+
+
+async def count_follower_async(
+  identity: Identity,
+  db: AsyncSession
+):
+  if identity is None:
+    log.warning("Identity is None and count_follower cannot be done")
+    raise HTTPException(status_code=404, detail="User not found")
+
+  cnt = await db.scalar(
+    select(func.count())
+    .select_from(RelationshipModel)
+    .filter(
+      RelationshipModel.friend_id == identity.uid,
+      RelationshipModel.state != RelationshipState.BLOCKED
+    )
+  )
+  log.info("Found %d followings of %s", cnt, identity.uid)
+
+  return cnt
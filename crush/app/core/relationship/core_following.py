@@ -1,6 +1,8 @@
 import logging
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 from uuid import UUID
 
 from app.models.users.IdentityModel import IdentityModel
@@ -45,6 +47,57 @@ def query_following(
   return relation.state
 
 
+def query_followings(
+  user_id: UUID,
+  friend_ids: list[UUID],
+  db: Session
+) -> dict[UUID, RelationshipState]:
+  # friend_ids 전체의 관계를 한 번의 IN 쿼리로 조회, 관계가 없으면 NONE
+  states = {friend_id: RelationshipState.NONE for friend_id in friend_ids}
+  if len(states) == 0:
+    return states
+
+  relations = (
+    db.query(RelationshipModel.friend_id, RelationshipModel.state)
+    .filter(
+      RelationshipModel.user_id == user_id,
+      RelationshipModel.friend_id.in_(states.keys())
+    )
+    .all()
+  )
+
+  for friend_id, state in relations:
+    states[friend_id] = state
+
+  log.info("Found %d relationships of %r among %d users", len(relations), user_id, len(states))
+  return states
+
+
+async def query_following_async(
+  identity: Identity,
+  friend_id: UUID,
+  db: AsyncSession
+) -> RelationshipState | None:
+  if identity is None:
+    log.warning("Identity is None and query following cannot be done")
+    raise HTTPException(status_code=404, detail="User not found")
+
+  relation = await db.scalar(
+    select(RelationshipModel)
+    .filter(
+      RelationshipModel.user_id == identity.uid,
+      RelationshipModel.friend_id == friend_id
+    )
+  )
+
+  if relation is None:
+    log.warning("Relationship %r->%r was not found", identity.uid, friend_id)
+    return RelationshipState.NONE
+
+  log.info("Found relationship %r->%r is %d", identity.uid, friend_id, relation.state.value)
+  return relation.state
+
+
 def follow(
   identity: Identity,
   body: FollowRequest,
@@ -184,6 +237,55 @@ def list_followings(
   return [Following(following) for following in followings]
 
 
+async def list_followings_async(
+  identity: Identity,
+  query: ListingRelationshipRequest,
+  db: AsyncSession
+):
+  if identity is None:
+    log.warning("Identity is None and list_followings cannot be done")
+    raise HTTPException(status_code=404, detail="User not found")
+
+  stmt = (
+    select(RelationshipModel)
+    .options(selectinload(RelationshipModel.friend))
+    .filter(
+      RelationshipModel.user_id == identity.uid,
+      RelationshipModel.state != RelationshipState.BLOCKED
+    )
+  )
+
+  if query.state is not None:
+    if query.up:
+      log.debug("Listing relationship closer than %d with %r", query.state.value, identity.uid)
+      stmt = stmt.filter(RelationshipModel.state >= query.state)
+    else:
+      log.debug("Listing relationship of %d with %r", query.state.value, identity.uid)
+      stmt = stmt.filter(RelationshipModel.state == query.state)
+  if query.head is not None:
+    log.debug("Listing relationship head is %r", identity.uid)
+    head_subquery = (
+      select(RelationshipModel.updated_at)
+      .filter(
+        RelationshipModel.user_id == identity.uid,
+        RelationshipModel.friend_id == query.head
+      )
+      .scalar_subquery()
+    )
+    stmt = stmt.filter(RelationshipModel.updated_at < head_subquery)
+
+  stmt = (
+    stmt
+    .order_by(RelationshipModel.updated_at.desc())
+    .limit(query.limit)
+  )
+
+  followings = (await db.execute(stmt)).scalars().all()
+  log.info("Found %d followings", len(followings))
+
+  return [Following(following) for following in followings]
+
+
 def count_following(
   identity: Identity,
   db: Session
@@ -203,3 +305,24 @@ def count_following(
 
   log.info("Found %d followings of %s", cnt, identity.uid)
   return cnt
+
+
+async def count_following_async(
+  identity: Identity,
+  db: AsyncSession
+):
+  if identity is None:
+    log.warning("Identity is None and count_following cannot be done")
+    raise HTTPException(status_code=404, detail="User not found")
+
+  cnt = await db.scalar(
+    select(func.count())
+    .select_from(RelationshipModel)
+    .filter(
+      RelationshipModel.user_id == identity.uid,
+      RelationshipModel.state != RelationshipState.BLOCKED
+    )
+  )
+
+  log.info("Found %d followings of %s", cnt, identity.uid)
+  return cnt
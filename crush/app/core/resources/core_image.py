@@ -1,18 +1,87 @@
-import base64
+import hashlib
+import io
+import json
 import logging
+import os
 import re
-from fastapi import UploadFile
+import tempfile
+from dataclasses import dataclass
+from PIL import Image, ImageOps, UnidentifiedImageError
+from fastapi import HTTPException, UploadFile
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
-from starlette.exceptions import HTTPException
-from typing import Tuple, Optional
+from typing import Tuple, Optional, BinaryIO, Iterator
 from uuid import UUID
 
+from app.core import worker_pool
 from app.core.auth.passkey import core_passkey_auth
+from app.core.auth.passkey.paykey_aaguid import AuthenticatorIcon
+from app.core.config_store import config
+from app.core.database.read_cache import ReadThroughCache
+from app.core.hash import sha256, sha256_bytes
+from app.core.resources.image_storage import create_image_storage
+from app.core.resources.variant_cache import VariantCache
+from app.models.resources.ImageBlobModel import ImageBlobModel
 from app.models.resources.ImageStoreModel import ImageStoreModel
 from app.models.users.IdentityModel import IdentityModel
+from app.schemas.resources.ImageRequests import ImageVariantQuery
 
 log = logging.getLogger(__name__)
 
+IMAGE_CONFIG = config.get("image", {})
+IMAGE_STORE_DIR = IMAGE_CONFIG.get("path", "images")
+IMAGE_MAX_SIZE = IMAGE_CONFIG.get("max_size", 10 * 1024 * 1024)
+# 단색 PNG처럼 파일은 작아도 풀면 메모리를 크게 차지하는 이미지를 막기 위한 화소 수 제한
+IMAGE_MAX_PIXELS = IMAGE_CONFIG.get("max_pixels", 64 * 1024 * 1024)
+# 켜면 같은 내용의 이미지는 sha256 digest 하나의 파일을 공유함
+IMAGE_CONTENT_ADDRESSED = IMAGE_CONFIG.get("content_addressed", False)
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# 기본은 로컬 디스크이며, 여러 서버가 이미지를 공유하려면 S3 호환 저장소를 사용
+image_storage = create_image_storage(IMAGE_CONFIG.get("storage", {}), IMAGE_STORE_DIR)
+
+# 파일 앞부분의 magic bytes로 실제 형식을 판별, 클라이언트가 보낸 Content-Type은 신뢰하지 않음
+IMAGE_SIGNATURES = [
+  (0, b"\xff\xd8\xff", "image/jpeg"),
+  (0, b"\x89PNG\r\n\x1a\n", "image/png"),
+  (0, b"GIF87a", "image/gif"),
+  (0, b"GIF89a", "image/gif"),
+  (4, b"ftypavif", "image/avif"),
+  (4, b"ftypavis", "image/avif"),
+]
+IMAGE_SNIFF_SIZE = 16
+
+IMAGE_VARIANT_CONFIG = IMAGE_CONFIG.get("variant_cache", {})
+IMAGE_VARIANT_QUALITY = IMAGE_VARIANT_CONFIG.get("quality", 80)
+# 변환 결과의 Pillow 형식과 MIME
+VARIANT_FORMATS = {
+  "jpeg": ("JPEG", "image/jpeg"),
+  "png": ("PNG", "image/png"),
+  "webp": ("WEBP", "image/webp"),
+  "avif": ("AVIF", "image/avif"),
+}
+# 형식을 지정하지 않고 크기만 바꾸면 원본과 같은 형식으로, GIF는 첫 프레임만 PNG로 변환
+DEFAULT_VARIANT_FORMATS = {
+  "image/jpeg": "jpeg",
+  "image/png": "png",
+  "image/gif": "png",
+  "image/webp": "webp",
+  "image/avif": "avif",
+}
+
+variant_cache = VariantCache(
+  root=IMAGE_VARIANT_CONFIG.get("path", os.path.join(IMAGE_STORE_DIR, ".variants")),
+  max_bytes=IMAGE_VARIANT_CONFIG.get("max_size", 512 * 1024 * 1024)
+)
+
+# 저장소 key는 설정(backend, 경로 규칙)에 따라 달라지므로 DB의 값만 보관하고 key는 읽을 때 계산함
+# 값의 형식이 경로였던 예전 "stored_image" 항목과 섞이지 않도록 namespace를 나눔
+stored_image_cache: ReadThroughCache[Tuple[str, Optional[str]]] = ReadThroughCache(
+  "stored_image_meta",
+  encode=json.dumps,
+  decode=lambda cached: tuple(json.loads(cached))
+)
+
 
 def profile_image(
   user_uuid: UUID,
@@ -29,6 +98,10 @@ def profile_image(
     raise HTTPException(status_code=404, detail="User not found")
 
   if re.match("^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", user):
+    # 저장소로 바로 보낼 수 있으면 이미지 API를 거치지 않음
+    if image_storage.redirects:
+      key, _ = stored_image(UUID(user), db)
+      return image_storage.url(key)
     return "/api/v1/resources/image/store/" + str(user)
   else:
     return user
@@ -38,72 +111,340 @@ def stored_image(
   image_uuid: UUID,
   db: Session
 ) -> Tuple[str, str]:
-  metadata = (
-    db.query(ImageStoreModel)
-    .filter(ImageStoreModel.uid == image_uuid)
-    .scalar()
-  )
+  def load_image() -> Optional[Tuple[str, Optional[str]]]:
+    image = (
+      db.query(ImageStoreModel.mime_type, ImageStoreModel.digest)
+      .filter(ImageStoreModel.uid == image_uuid)
+      .first()
+    )
+    if image is None:
+      return None
+
+    mime_type, digest = image
+    return mime_type, digest
 
-  if metadata is None:
+  image = stored_image_cache.get_or_load(image_uuid, load_image)
+
+  if image is None:
     log.warning("Image with UUID %r not found when querying stored image", image_uuid)
     raise HTTPException(status_code=404, detail="Image not found")
 
-  return "images/" + str(metadata.uid), metadata.mime_type
+  mime_type, digest = image
+  return (blob_key(digest) if digest is not None else image_key(image_uuid)), mime_type
 
 
-def upload(
-  file: UploadFile,
-  db: Session
-) -> str:
+def image_key(image_uuid) -> str:
+  return str(image_uuid)
+
+
+def blob_key(digest: str) -> str:
+  # 한 디렉터리에 파일이 몰리지 않도록 digest 앞 4글자로 두 단계 나눔
+  return f"sha256/{digest[:2]}/{digest[2:4]}/{digest}"
+
+
+def sniff_image_type(head: bytes) -> Optional[str]:
+  if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+    return "image/webp"
+
+  for offset, signature, mime_type in IMAGE_SIGNATURES:
+    if head[offset:offset + len(signature)] == signature:
+      return mime_type
+
+  return None
+
+
+def _spool(source: BinaryIO, head: bytes) -> Tuple[str, str, int]:
+  # 임시 파일에 나누어 쓴 뒤 저장소로 옮기므로 덜 쓰인 파일이 노출되지 않음
+  fd, tmp_path = tempfile.mkstemp(dir=image_storage.spool_dir, prefix=".upload-")
+  digest = hashlib.sha256(head)
+  try:
+    with os.fdopen(fd, "wb") as tmp:
+      size = len(head)
+      tmp.write(head)
+      while chunk := source.read(UPLOAD_CHUNK_SIZE):
+        size += len(chunk)
+        if size > IMAGE_MAX_SIZE:
+          log.warning("Uploaded image exceeds the size limit of %d bytes", IMAGE_MAX_SIZE)
+          raise HTTPException(status_code=413, detail="Image is too large")
+        digest.update(chunk)
+        tmp.write(chunk)
+      tmp.flush()
+      os.fsync(tmp.fileno())
+  except BaseException:
+    os.unlink(tmp_path)
+    raise
+
+  return tmp_path, digest.hexdigest(), size
+
+
+def _check_dimensions(source: str | BinaryIO):
+  # Image.open은 header만 읽으므로 화소를 풀지 않고 크기를 확인할 수 있음
+  try:
+    with Image.open(source) as image:
+      width, height = image.size
+  except UnidentifiedImageError:
+    # Pillow가 읽지 못하는 형식도 원본 그대로는 제공할 수 있으므로 거절하지 않음
+    log.info("Dimensions of uploaded image could not be read")
+    return
+  except Image.DecompressionBombError as e:
+    log.warning("Uploaded image exceeds the pixel limit of Pillow: %s", e)
+    raise HTTPException(status_code=413, detail="Image dimensions are too large")
+
+  if width * height > IMAGE_MAX_PIXELS:
+    log.warning("Uploaded image of %dx%d exceeds the pixel limit of %d", width, height, IMAGE_MAX_PIXELS)
+    raise HTTPException(status_code=413, detail="Image dimensions are too large")
+
+
+def _write_tmp(binary: bytes) -> str:
+  fd, tmp_path = tempfile.mkstemp(dir=image_storage.spool_dir, prefix=".upload-")
+  try:
+    with os.fdopen(fd, "wb") as tmp:
+      tmp.write(binary)
+  except BaseException:
+    os.unlink(tmp_path)
+    raise
+
+  return tmp_path
+
+
+def _reference_blob(digest: str, mime_type: str, size: int, db: Session):
+  db.execute(
+    insert(ImageBlobModel)
+    .values(digest=digest, mime_type=mime_type, size=size, ref_count=1)
+    .on_conflict_do_update(
+      index_elements=[ImageBlobModel.digest],
+      set_={
+        "ref_count": ImageBlobModel.ref_count + 1
+      }
+    )
+  )
+
+
+# 저장된 이미지의 uid와, 이번 요청에서 새로 만들어 실패 시 지워도 되는 key를 반환
+def _store(tmp_path: str, mime_type: str, digest: str, size: int, db: Session) -> Tuple[str, Optional[str]]:
   metadata = ImageStoreModel(
-    mime_type=file.content_type
+    mime_type=mime_type
   )
+
+  if IMAGE_CONTENT_ADDRESSED:
+    _reference_blob(digest, mime_type, size, db)
+    metadata.digest = digest
+
   db.add(metadata)
   db.flush()
 
-  image_uuid = metadata.uid
-  path = "images/" + str(image_uuid)
+  if not IMAGE_CONTENT_ADDRESSED:
+    key = image_key(metadata.uid)
+    image_storage.put(tmp_path, key, mime_type)
+    return metadata.uid, key
 
-  with open(path, "wb") as image_file:
-    content = file.file.read()
-    image_file.write(content)
+  key = blob_key(digest)
+  if image_storage.exists(key):
+    # 같은 내용이 이미 저장되어 있으면 메타데이터만 추가
+    log.info("Image %s was deduplicated", digest)
+    os.unlink(tmp_path)
+  else:
+    image_storage.put(tmp_path, key, mime_type)
 
-  db.commit()
-  return image_uuid
+  # 다른 이미지와 공유될 수 있는 파일은 실패해도 지우지 않음
+  return metadata.uid, None
 
 
-def upload_binary(
-  binary: bytes,
+# Pillow 작업은 CPU를 오래 쓰므로 worker pool에서 실행
+# 원본은 로컬 파일 경로 또는 저장소에서 받아온 내용
+def render_variant(source: str | bytes, width: Optional[int], height: Optional[int], variant_format: str) -> bytes:
+  pillow_format, _ = VARIANT_FORMATS[variant_format]
+
+  with Image.open(io.BytesIO(source) if isinstance(source, bytes) else source) as image:
+    image = ImageOps.exif_transpose(image)
+
+    # 비율을 유지하며 주어진 크기 안에 맞추고, 원본보다 키우지는 않음
+    if width is not None or height is not None:
+      image.thumbnail((width or image.width, height or image.height), Image.Resampling.LANCZOS)
+
+    if pillow_format == "JPEG" and image.mode not in ("RGB", "L"):
+      image = image.convert("RGB")
+    elif image.mode not in ("RGB", "RGBA", "L", "LA"):
+      image = image.convert("RGBA")
+
+    buffer = io.BytesIO()
+    image.save(buffer, format=pillow_format, quality=IMAGE_VARIANT_QUALITY)
+
+  return buffer.getvalue()
+
+
+@dataclass(frozen=True, slots=True)
+class ImageVariant:
+  key: str
+  format: str
+  mime_type: str
+
+  @property
+  def etag(self) -> str:
+    return f'"{self.key}"'
+
+
+def image_etag(image_uuid: UUID) -> str:
+  # 저장된 이미지는 uid가 같으면 내용도 같으므로 uid를 강한 ETag로 사용
+  return f'"{image_uuid}"'
+
+
+def image_variant(
+  image_uuid: UUID,
   mime_type: str,
+  query: ImageVariantQuery
+) -> ImageVariant:
+  variant_format = query.format or DEFAULT_VARIANT_FORMATS.get(mime_type)
+  if variant_format is None:
+    log.warning("Image %r of type %r cannot be resized", image_uuid, mime_type)
+    raise HTTPException(status_code=415, detail="Image cannot be resized")
+  _, variant_mime = VARIANT_FORMATS[variant_format]
+
+  # 이미지 uid는 바뀌지 않으므로 uid와 변환 조건만으로 결과를 식별할 수 있음
+  return ImageVariant(
+    key=sha256(f"{image_uuid}:{query.width}:{query.height}:{variant_format}"),
+    format=variant_format,
+    mime_type=variant_mime
+  )
+
+
+def open_variant(
+  key: str,
+  variant: ImageVariant,
+  query: ImageVariantQuery
+) -> BinaryIO:
+  # 다른 worker가 캐시에서 지웠으면 다시 변환함
+  cached = variant_cache.open(variant.key)
+  if cached is not None:
+    return cached
+
+  # 원격 저장소의 원본은 캐시에 없을 때만 받아옴
+  source = image_storage.local_path(key)
+  if source is None:
+    source = image_storage.read(key)
+
+  try:
+    content = worker_pool.run(render_variant, source, query.width, query.height, variant.format)
+  except UnidentifiedImageError:
+    log.warning("Image %r could not be decoded for resizing", key)
+    raise HTTPException(status_code=415, detail="Image cannot be resized")
+  except Image.DecompressionBombError:
+    # 화소 수 제한 이전에 올라온 이미지
+    log.warning("Image %r has too many pixels to be resized", key)
+    raise HTTPException(status_code=415, detail="Image cannot be resized")
+
+  log.info("Image variant %s of %r was rendered with %d bytes", variant.key, key, len(content))
+  return variant_cache.put(variant.key, content)
+
+
+def read_chunks(handle: BinaryIO) -> Iterator[bytes]:
+  with handle:
+    while chunk := handle.read(UPLOAD_CHUNK_SIZE):
+      yield chunk
+
+
+def _sniff_upload(file: UploadFile) -> Tuple[bytes, str]:
+  if file.size is not None and file.size > IMAGE_MAX_SIZE:
+    log.warning("Uploaded image of %d bytes exceeds the size limit of %d bytes", file.size, IMAGE_MAX_SIZE)
+    raise HTTPException(status_code=413, detail="Image is too large")
+
+  head = file.file.read(IMAGE_SNIFF_SIZE)
+  mime_type = sniff_image_type(head)
+  if mime_type is None:
+    log.warning("Uploaded file is not a supported image. content_type=%r", file.content_type)
+    raise HTTPException(status_code=415, detail="Unsupported image type")
+
+  return head, mime_type
+
+
+# 저장하기 전에 가공해야 하는 작은 이미지(프로필 사진 등)를 upload와 같은 제한을 적용해 메모리로 읽음
+def read_image(file: UploadFile) -> bytes:
+  head, _ = _sniff_upload(file)
+
+  content = head + file.file.read(IMAGE_MAX_SIZE + 1 - len(head))
+  if len(content) > IMAGE_MAX_SIZE:
+    log.warning("Uploaded image exceeds the size limit of %d bytes", IMAGE_MAX_SIZE)
+    raise HTTPException(status_code=413, detail="Image is too large")
+
+  _check_dimensions(io.BytesIO(content))
+  return content
+
+
+def upload(
+  file: UploadFile,
   db: Session
 ) -> str:
-  metadata = ImageStoreModel(
-    mime_type=mime_type
-  )
-  db.add(metadata)
-  db.flush()
+  head, mime_type = _sniff_upload(file)
+
+  tmp_path, digest, size = _spool(file.file, head)
+  try:
+    _check_dimensions(tmp_path)
+    image_uuid, created_key = _store(tmp_path, mime_type, digest, size, db)
+  except BaseException:
+    if os.path.exists(tmp_path):
+      os.unlink(tmp_path)
+    raise
 
-  image_uuid = metadata.uid
-  path = "images/" + str(image_uuid)
+  try:
+    db.commit()
+  except BaseException:
+    # 메타데이터가 저장되지 않았으므로 가리키는 곳이 없는 파일을 지움
+    if created_key is not None:
+      image_storage.delete(created_key)
+    raise
 
-  with open(path, "wb") as image_file:
-    image_file.write(binary)
+  return str(image_uuid)
+
+
+def upload_binary(
+  binary: bytes,
+  mime_type: str,
+  db: Session
+) -> str:
+  tmp_path = _write_tmp(binary)
+  try:
+    image_uuid, _ = _store(tmp_path, mime_type, sha256_bytes(binary), len(binary), db)
+  except BaseException:
+    if os.path.exists(tmp_path):
+      os.unlink(tmp_path)
+    raise
 
   return image_uuid
 
 
 def authenticator_image(
-  aaguid: UUID
-) -> Tuple[str, str]:
+  aaguid: UUID,
+  variant: str = "light"
+) -> AuthenticatorIcon:
   authenticator = core_passkey_auth.get_authenticator(aaguid)
 
   if authenticator is None:
     log.warning("Authenticator with aaguid of %r was not found", aaguid)
     raise HTTPException(status_code=404, detail="Authenticator not found")
 
-  mime, svg_b64 = authenticator.icon_light.split(",", 1)
-  mime = mime.replace("data:", "").replace(";base64", "")
+  icon = authenticator.icon(variant)
+  if icon is None:
+    log.warning("Authenticator with aaguid of %r has no icon", aaguid)
+    raise HTTPException(status_code=404, detail="Authenticator icon not found")
+
+  return icon
+
+
+def etag_matches(
+  if_none_match: Optional[str],
+  etag: str
+) -> bool:
+  # If-None-Match는 약한 비교를 사용함 (RFC 9110 13.1.2)
+  if if_none_match is None:
+    return False
+  if if_none_match.strip() == "*":
+    return True
 
-  svg = base64.b64decode(svg_b64).decode("utf-8")
+  for candidate in if_none_match.split(","):
+    candidate = candidate.strip()
+    if candidate.startswith("W/"):
+      candidate = candidate[2:]
+    if candidate == etag:
+      return True
 
-  return svg, mime
+  return False
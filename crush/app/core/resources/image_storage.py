@@ -0,0 +1,181 @@
+import boto3
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from typing import Optional
+
+log = logging.getLogger(__name__)
+
+# 저장된 객체는 key가 바뀌지 않는 한 내용이 바뀌지 않음
+OBJECT_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class ImageStorage(ABC):
+  # 업로드를 임시 파일로 받아둘 디렉터리
+  spool_dir: str
+  # 클라이언트를 저장소로 바로 보낼 수 있는지
+  redirects: bool = False
+  # 저장소 URL로의 redirect 응답을 캐시해도 되는 시간
+  url_max_age: int = 0
+
+  # tmp_path의 파일을 key로 옮기며, 성공하면 tmp_path는 남지 않음
+  @abstractmethod
+  def put(self, tmp_path: str, key: str, mime_type: str):
+    pass
+
+  @abstractmethod
+  def exists(self, key: str) -> bool:
+    pass
+
+  @abstractmethod
+  def delete(self, key: str):
+    pass
+
+  @abstractmethod
+  def read(self, key: str) -> bytes:
+    pass
+
+  def local_path(self, key: str) -> Optional[str]:
+    return None
+
+  def url(self, key: str) -> Optional[str]:
+    return None
+
+
+class LocalImageStorage(ImageStorage):
+  def __init__(self, root: str):
+    self.root = root
+    # 같은 파일 시스템에 받아두어야 rename이 원자적임
+    self.spool_dir = root
+
+  def local_path(self, key: str) -> str:
+    return os.path.join(self.root, key)
+
+  def put(self, tmp_path: str, key: str, mime_type: str):
+    path = self.local_path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    os.replace(tmp_path, path)
+
+  def exists(self, key: str) -> bool:
+    return os.path.exists(self.local_path(key))
+
+  def delete(self, key: str):
+    try:
+      os.unlink(self.local_path(key))
+    except FileNotFoundError:
+      pass
+
+  def read(self, key: str) -> bytes:
+    with open(self.local_path(key), "rb") as f:
+      return f.read()
+
+
+class S3ImageStorage(ImageStorage):
+  redirects = True
+
+  def __init__(
+    self,
+    bucket: str,
+    prefix: str = "",
+    endpoint_url: Optional[str] = None,
+    region: Optional[str] = None,
+    access_key: Optional[str] = None,
+    secret_key: Optional[str] = None,
+    public_url: Optional[str] = None,
+    presign_ttl: int = 3600,
+    max_connections: int = 10,
+    spool_dir: Optional[str] = None
+  ):
+    self.bucket = bucket
+    self.prefix = prefix
+    self.public_url = public_url.rstrip("/") if public_url is not None else None
+    self.presign_ttl = presign_ttl
+    self.spool_dir = spool_dir or tempfile.gettempdir()
+    # 공개 URL은 바뀌지 않지만 presigned URL은 만료되므로 만료 전에 다시 받도록 함
+    self.url_max_age = 31536000 if self.public_url is not None else presign_ttl // 2
+
+    # MinIO 등 S3 호환 저장소는 virtual host 방식의 bucket 주소를 지원하지 않을 수 있음
+    self._client = boto3.client(
+      "s3",
+      endpoint_url=endpoint_url,
+      region_name=region,
+      aws_access_key_id=access_key,
+      aws_secret_access_key=secret_key,
+      config=Config(
+        max_pool_connections=max_connections,
+        s3={"addressing_style": "path" if endpoint_url is not None else "auto"}
+      )
+    )
+
+  def object_key(self, key: str) -> str:
+    return self.prefix + key
+
+  def put(self, tmp_path: str, key: str, mime_type: str):
+    self._client.upload_file(
+      tmp_path,
+      self.bucket,
+      self.object_key(key),
+      ExtraArgs={
+        "ContentType": mime_type,
+        "CacheControl": OBJECT_CACHE_CONTROL
+      }
+    )
+    os.unlink(tmp_path)
+
+  def exists(self, key: str) -> bool:
+    try:
+      self._client.head_object(Bucket=self.bucket, Key=self.object_key(key))
+    except ClientError as e:
+      if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+        return False
+      raise
+
+    return True
+
+  def delete(self, key: str):
+    self._client.delete_object(Bucket=self.bucket, Key=self.object_key(key))
+
+  def read(self, key: str) -> bytes:
+    response = self._client.get_object(Bucket=self.bucket, Key=self.object_key(key))
+    return response["Body"].read()
+
+  def url(self, key: str) -> str:
+    if self.public_url is not None:
+      return f"{self.public_url}/{self.object_key(key)}"
+
+    # 서명은 로컬에서 계산하므로 저장소에 요청을 보내지 않음
+    return self._client.generate_presigned_url(
+      "get_object",
+      Params={
+        "Bucket": self.bucket,
+        "Key": self.object_key(key)
+      },
+      ExpiresIn=self.presign_ttl
+    )
+
+
+def create_image_storage(storage_config: dict, root: str) -> ImageStorage:
+  backend = storage_config.get("backend", "local")
+
+  if backend == "local":
+    return LocalImageStorage(storage_config.get("path", root))
+
+  if backend == "s3":
+    log.info("Images are stored in bucket %r at %r", storage_config["bucket"], storage_config.get("endpoint_url"))
+    return S3ImageStorage(
+      bucket=storage_config["bucket"],
+      prefix=storage_config.get("prefix", ""),
+      endpoint_url=storage_config.get("endpoint_url"),
+      region=storage_config.get("region"),
+      access_key=storage_config.get("access_key"),
+      secret_key=storage_config.get("secret_key"),
+      public_url=storage_config.get("public_url"),
+      presign_ttl=storage_config.get("presign_ttl", 3600),
+      max_connections=storage_config.get("max_connections", 10),
+      spool_dir=storage_config.get("spool_path")
+    )
+
+  raise ValueError(f"Unsupported image storage backend: {backend}")
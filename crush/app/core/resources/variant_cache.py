@@ -0,0 +1,138 @@
+import fcntl
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import BinaryIO, Optional
+
+log = logging.getLogger(__name__)
+
+LOCK_FILE = ".lock"
+
+
+class VariantCache:
+  # 여러 worker가 같은 디렉터리를 함께 쓰므로 사용량과 LRU 순서는 디스크의 파일 크기와 atime을 기준으로 함
+  def __init__(self, root: str, max_bytes: int, rescan_bytes: Optional[int] = None):
+    self.root = root
+    self.max_bytes = max_bytes
+    # 이 worker가 이만큼 쓰면 다른 worker가 쓴 양까지 알기 위해 디스크를 다시 셈
+    self.rescan_bytes = rescan_bytes if rescan_bytes is not None else max(max_bytes // 16, 1)
+    self._lock = threading.Lock()
+    self._entries = 0
+    self._bytes = 0
+    self._written = 0
+    self._hits = 0
+    self._misses = 0
+    self._evictions = 0
+
+  def path(self, key: str) -> str:
+    return os.path.join(self.root, key[:2], key)
+
+  def load(self):
+    self._scan()
+    log.info("Image variant cache was loaded with %d entries, %d bytes", self._entries, self._bytes)
+
+  def _scan(self):
+    os.makedirs(self.root, exist_ok=True)
+
+    with open(os.path.join(self.root, LOCK_FILE), "a") as lock:
+      # 다른 worker가 이미 정리 중이면 기다리지 않고 맡김
+      try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+      except BlockingIOError:
+        return
+
+      found = []
+      for directory, _, files in os.walk(self.root):
+        for name in files:
+          if name.startswith("."):
+            continue
+          path = os.path.join(directory, name)
+          try:
+            stat = os.stat(path)
+          except FileNotFoundError:
+            continue
+          found.append((stat.st_atime, path, stat.st_size))
+
+      total = sum(size for _, _, size in found)
+      evicted = 0
+      # 가장 오래 쓰이지 않은 파일부터 지움
+      for _, path, size in sorted(found):
+        if total <= self.max_bytes:
+          break
+        try:
+          os.unlink(path)
+        except FileNotFoundError:
+          pass
+        total -= size
+        evicted += 1
+
+    with self._lock:
+      self._entries = len(found) - evicted
+      self._bytes = total
+      self._written = 0
+      self._evictions += evicted
+
+  def open(self, key: str) -> Optional[BinaryIO]:
+    path = self.path(key)
+
+    # 열어둔 파일은 다른 worker가 지우더라도 끝까지 읽을 수 있음
+    try:
+      handle = open(path, "rb")
+    except FileNotFoundError:
+      with self._lock:
+        self._misses += 1
+      return None
+
+    # mtime은 Last-Modified로 쓰이므로 atime만 갱신
+    try:
+      os.utime(path, (time.time(), os.fstat(handle.fileno()).st_mtime))
+    except FileNotFoundError:
+      pass
+
+    with self._lock:
+      self._hits += 1
+
+    return handle
+
+  def put(self, key: str, content: bytes) -> BinaryIO:
+    path = self.path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    handle = os.fdopen(fd, "w+b")
+    try:
+      handle.write(content)
+      handle.flush()
+      os.replace(tmp_path, path)
+      handle.seek(0)
+    except BaseException:
+      handle.close()
+      if os.path.exists(tmp_path):
+        os.unlink(tmp_path)
+      raise
+
+    with self._lock:
+      self._entries += 1
+      self._bytes += len(content)
+      self._written += len(content)
+      rescan = self._bytes > self.max_bytes or self._written >= self.rescan_bytes
+
+    if rescan:
+      self._scan()
+
+    return handle
+
+  def status(self) -> dict[str, object]:
+    with self._lock:
+      lookups = self._hits + self._misses
+      return {
+        "entries": self._entries,
+        "bytes": self._bytes,
+        "max_bytes": self.max_bytes,
+        "hits": self._hits,
+        "misses": self._misses,
+        "hit_rate": round(self._hits / lookups, 4) if lookups > 0 else None,
+        "evictions": self._evictions
+      }
@@ -2,9 +2,14 @@ import jwt
 import logging
 import re
 import uuid
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from fastapi import HTTPException
+from jwt.algorithms import ECAlgorithm, OKPAlgorithm
 from typing import Optional
 from uuid import UUID
 
@@ -14,6 +19,74 @@ KST = timezone(timedelta(hours=9))
 
 log = logging.getLogger(__name__)
 
+ACCESS_TOKEN_CONFIG = config["security"].get("access_token", {})
+ACCESS_TOKEN_ALGORITHM = ACCESS_TOKEN_CONFIG.get("algorithm", "HS256")
+ASYMMETRIC_ALGORITHMS = {
+  "EdDSA": OKPAlgorithm,
+  "ES256": ECAlgorithm
+}
+
+
+@dataclass(frozen=True, slots=True)
+class SigningKey:
+  kid: str
+  private_key: object
+  public_key: object
+  jwk: dict
+
+
+def load_signing_key(kid: str, path: str, algorithm: str) -> SigningKey:
+  with open(path, "rb") as f:
+    private_key = serialization.load_pem_private_key(f.read(), password=None)
+
+  if algorithm == "EdDSA" and not isinstance(private_key, Ed25519PrivateKey):
+    raise ValueError(f"Signing key {kid} is not an Ed25519 key")
+  if algorithm == "ES256" and not (
+    isinstance(private_key, ec.EllipticCurvePrivateKey) and isinstance(private_key.curve, ec.SECP256R1)
+  ):
+    raise ValueError(f"Signing key {kid} is not a P-256 key")
+
+  public_key = private_key.public_key()
+  jwk = ASYMMETRIC_ALGORITHMS[algorithm].to_jwk(public_key, as_dict=True)
+  jwk.update({
+    "kid": kid,
+    "alg": algorithm,
+    "use": "sig"
+  })
+
+  return SigningKey(kid=kid, private_key=private_key, public_key=public_key, jwk=jwk)
+
+
+def load_signing_keys() -> dict[str, SigningKey]:
+  if ACCESS_TOKEN_ALGORITHM == "HS256":
+    return {}
+  if ACCESS_TOKEN_ALGORITHM not in ASYMMETRIC_ALGORITHMS:
+    raise ValueError(f"Unsupported access token algorithm: {ACCESS_TOKEN_ALGORITHM}")
+
+  keys = {
+    key["kid"]: load_signing_key(key["kid"], key["path"], ACCESS_TOKEN_ALGORITHM)
+    for key in ACCESS_TOKEN_CONFIG.get("keys", [])
+  }
+  if len(keys) == 0:
+    raise ValueError(f"No signing key is configured for {ACCESS_TOKEN_ALGORITHM} access tokens")
+
+  log.info("Access token signing keys were loaded: %s", ", ".join(keys))
+  return keys
+
+
+# 교체 중에는 이전 key도 남겨두어 이미 발급된 토큰을 검증하고 JWKS에 계속 공개함
+_signing_keys: dict[str, SigningKey] = load_signing_keys()
+ACTIVE_KID: Optional[str] = ACCESS_TOKEN_CONFIG.get("active_kid", next(iter(_signing_keys), None))
+
+if ACTIVE_KID is not None and ACTIVE_KID not in _signing_keys:
+  raise ValueError(f"Active signing key {ACTIVE_KID} is not configured")
+
+
+def jwks() -> dict[str, list[dict]]:
+  return {
+    "keys": [key.jwk for key in _signing_keys.values()]
+  }
+
 
 def create_access_token(user_id: UUID, role: list[str]) -> str:
   payload = {
@@ -25,6 +98,14 @@ def create_access_token(user_id: UUID, role: list[str]) -> str:
     "scope": role
   }
 
+  if ACTIVE_KID is not None:
+    return jwt.encode(
+      payload=payload,
+      key=_signing_keys[ACTIVE_KID].private_key,
+      algorithm=ACCESS_TOKEN_ALGORITHM,
+      headers={"kid": ACTIVE_KID}
+    )
+
   return jwt.encode(
     payload=payload,
     key=config["security"]["jwt_secret"],
@@ -32,18 +113,22 @@ def create_access_token(user_id: UUID, role: list[str]) -> str:
   )
 
 
-def create_refresh_token(user_id: UUID) -> str:
+def create_refresh_token(user_id: UUID, issued_at: Optional[datetime] = None, sequence: Optional[int] = None) -> str:
   refresh_token_uid = uuid.uuid4()
+  if issued_at is None:
+    issued_at = datetime.now(KST)
 
   payload = {
     "sub": str(user_id),
-    "exp": datetime.now(KST) + timedelta(weeks=4),
-    "iat": datetime.now(KST),
+    "exp": issued_at + timedelta(weeks=4),
+    "iat": issued_at,
     "iss": "with",
     "aud": ["crush"],
     "rti": str(refresh_token_uid),
     "scope": ["auth:refresh"]
   }
+  if sequence is not None:
+    payload["rsq"] = sequence
 
   return jwt.encode(
     payload=payload,
@@ -53,10 +138,19 @@ def create_refresh_token(user_id: UUID) -> str:
 
 
 def decode_access_token(token: str) -> dict:
+  # kid가 없는 토큰은 비대칭 서명 도입 이전에 발급된 HS256 토큰
+  kid = jwt.get_unverified_header(token).get("kid")
+  if kid is None:
+    key, algorithms = config["security"]["jwt_secret"], ["HS256"]
+  elif kid in _signing_keys:
+    key, algorithms = _signing_keys[kid].public_key, [ACCESS_TOKEN_ALGORITHM]
+  else:
+    raise jwt.InvalidTokenError(f"Unknown signing key {kid!r}")
+
   return jwt.decode(
     jwt=token,
-    key=config["security"]["jwt_secret"],
-    algorithms=["HS256"],
+    key=key,
+    algorithms=algorithms,
     verify_signature=True,
     issuer="with",
     require=["aud", "exp", "iat", "iss", "sub"],
@@ -113,6 +207,8 @@ class Role(Enum):
 
   IMAGE_UPLOAD = "image:upload"
 
+  METRICS_READ = "metrics:read"
+
   ROOT = "core:root"
 
 
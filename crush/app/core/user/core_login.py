@@ -1,14 +1,20 @@
 import logging
+from datetime import datetime
 from fastapi import HTTPException
-from typing import Tuple
+from typing import Tuple, Optional
 
-from app.core.user.core_jwt import create_access_token, create_refresh_token, Role
+from app.core.auth.core_refresh_blacklist import issue_sequence
+from app.core.user.core_jwt import create_access_token, create_refresh_token, Role, KST
 from app.schemas.user.Identity import Identity
 
 log = logging.getLogger(__name__)
 
 
-def login(identity: Identity) -> Tuple[str, str]:
+def login(
+  identity: Identity,
+  issued_at: Optional[datetime] = None,
+  sequence: Optional[int] = None
+) -> Tuple[str, str]:
   if identity is None:
     log.warning("Login was attempted with none identity")
     raise HTTPException(status_code=401, detail="Unauthorized")
@@ -21,8 +27,15 @@ def login(identity: Identity) -> Tuple[str, str]:
     identity.role
   )
 
+  # refresh 요청은 번호를 사용 처리와 함께 미리 발급받아 전달함
+  if issued_at is None:
+    issued_at = datetime.now(KST)
+    sequence = issue_sequence(issued_at)
+
   refresh_token = create_refresh_token(
-    identity.uid
+    identity.uid,
+    issued_at,
+    sequence
   )
 
   return access_token, refresh_token
@@ -1,16 +1,22 @@
 import io
 import json
 import logging
+import threading
 from PIL import Image
+from cachetools import TTLCache
 from fastapi import HTTPException
-from sqlalchemy import Row
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, aliased
 from sqlalchemy.sql.expression import case
 from starlette.datastructures import UploadFile
 from typing import Optional, Tuple
 from uuid import uuid4, UUID
 
+from app.core import worker_pool
+from app.core.config_store import config
 from app.core.database.database import redis_db0
+from app.core.database.read_cache import CacheMetrics
 from app.core.hash import sha256
 from app.core.recommendation import core_prefer_vector
 from app.core.resources import core_image
@@ -25,21 +31,33 @@ from app.schemas.user.IdentityRequests import IdentityPatchRequest, IdentitySear
 
 log = logging.getLogger(__name__)
 
+IDENTITY_CACHE_CONFIG = config["security"].get("identity_cache", {})
+IDENTITY_INVALIDATE_CHANNEL = "users:identity-invalidate"
+PROFILE_PICTURE_SIZE = 96
+
+# 요청마다 같은 identity를 다시 읽지 않도록 짧게 보관, 수정 시 모든 worker에서 무효화
+_identity_cache: TTLCache = TTLCache(
+  maxsize=IDENTITY_CACHE_CONFIG.get("size", 10000),
+  ttl=IDENTITY_CACHE_CONFIG.get("ttl", 10)
+)
+_identity_cache_lock = threading.Lock()
+_identity_generation = 0
+identity_cache_metrics = CacheMetrics()
+
 
 def create_signup_session(
   application: dict[str, any]
 ) -> str:
   session_uuid = str(uuid4())
 
-  if redis_db0.exists(session_uuid) != 0:
-    log.warning("Registration session has crashed %s", sha256(session_uuid))
-    raise HTTPException(500, "Session UUID crash")
-
-  redis_db0.set(
+  if not redis_db0.set(
     name=session_uuid,
     value=json.dumps(application),
-    ex=3600
-  )
+    ex=3600,
+    nx=True
+  ):
+    log.warning("Registration session has crashed %s", sha256(session_uuid))
+    raise HTTPException(500, "Session UUID crash")
   log.info("New registration session %s was saved", sha256(session_uuid))
 
   return session_uuid
@@ -64,6 +82,116 @@ def get_identity(
     return Identity(iden)
 
 
+async def get_identity_async(
+  token: dict[str, str],
+  db: AsyncSession
+) -> Optional[Identity]:
+  uid = get_sub(token)
+
+  iden = await db.scalar(
+    select(IdentityModel)
+    .filter(IdentityModel.uid == uid)
+  )
+
+  if iden is None:
+    log.warning("Identity %s was not found", uid)
+    return None
+  else:
+    return Identity(iden)
+
+
+def _cached_identity(uid: UUID) -> Tuple[Optional[Identity], int]:
+  with _identity_cache_lock:
+    identity = _identity_cache.get(uid)
+    generation = _identity_generation
+
+  if identity is not None:
+    identity_cache_metrics.observe_hit()
+  else:
+    identity_cache_metrics.observe_miss()
+
+  return identity, generation
+
+
+def _cache_identity(identity: Identity, generation: int):
+  # 읽는 도중 무효화가 있었으면 읽은 값이 오래된 것일 수 있으므로 저장하지 않음
+  with _identity_cache_lock:
+    if generation == _identity_generation:
+      _identity_cache[identity.uid] = identity
+
+
+def get_identity_cached(
+  token: dict[str, str],
+  db: Session
+) -> Optional[Identity]:
+  identity, generation = _cached_identity(get_sub(token))
+  if identity is not None:
+    return identity
+
+  identity = get_identity(token, db)
+  if identity is not None:
+    _cache_identity(identity, generation)
+
+  return identity
+
+
+async def get_identity_cached_async(
+  token: dict[str, str],
+  db: AsyncSession
+) -> Optional[Identity]:
+  identity, generation = _cached_identity(get_sub(token))
+  if identity is not None:
+    return identity
+
+  identity = await get_identity_async(token, db)
+  if identity is not None:
+    _cache_identity(identity, generation)
+
+  return identity
+
+
+def evict_identity(uid: UUID):
+  global _identity_generation
+
+  with _identity_cache_lock:
+    _identity_generation += 1
+    if _identity_cache.pop(uid, None) is not None:
+      identity_cache_metrics.observe_invalidation(1)
+
+
+def invalidate_identity(uid: UUID):
+  evict_identity(uid)
+
+  try:
+    redis_db0.publish(IDENTITY_INVALIDATE_CHANNEL, str(uid))
+  except Exception as e:
+    log.warning("Failed to publish identity invalidation of %r: %s", uid, e)
+
+
+def _on_identity_invalidate(message):
+  try:
+    evict_identity(UUID(message["data"]))
+  except ValueError as e:
+    log.warning("Malformed identity invalidation %r: %s", message.get("data"), e)
+
+
+def subscribe_identity_invalidation():
+  pubsub = redis_db0.pubsub(ignore_subscribe_messages=True)
+  pubsub.subscribe(**{IDENTITY_INVALIDATE_CHANNEL: _on_identity_invalidate})
+  pubsub.run_in_thread(sleep_time=1, daemon=True)
+
+
+def identity_cache_status() -> dict[str, object]:
+  with _identity_cache_lock:
+    size = _identity_cache.currsize
+
+  return {
+    "ttl": _identity_cache.ttl,
+    "size": size,
+    **identity_cache_metrics.snapshot()
+  }
+
+
 def get_identity_by_uid(
   uid: UUID,
   db: Session
@@ -81,6 +209,22 @@ def get_identity_by_uid(
     return Identity(iden)
 
 
+async def get_identity_by_uid_async(
+  uid: UUID,
+  db: AsyncSession
+) -> Optional[Identity]:
+  iden = await db.scalar(
+    select(IdentityModel)
+    .filter(IdentityModel.uid == uid)
+  )
+
+  if iden is None:
+    log.warning("Identity %s was not found", uid)
+    return None
+  else:
+    return Identity(iden)
+
+
 def register_using_session(
   application: RegisterIdentityReq,
   reg_session_uuid: UUID,
@@ -175,48 +319,69 @@ def update_identity(
 
   db.commit()
 
+  invalidate_identity(identity_uid)
 
-async def update_profile_picture(
-  profile_picture: UploadFile,
-  identity_uid: UUID,
-  db: Session
-) -> str:
-  identity: IdentityModel = (
-    db.query(IdentityModel)
-    .filter(IdentityModel.uid == identity_uid)
-    .scalar()
-  )
-
-  if identity is None:
-    log.warning("Identity %r was not found for profile picture update", identity_uid)
-    raise HTTPException(status_code=404, detail="Identity not found")
 
-  image_byte = await profile_picture.read()
+# Pillow 작업은 CPU를 오래 쓰므로 worker pool에서 실행
+def crop_profile_picture(image_byte: bytes) -> bytes:
   image = Image.open(io.BytesIO(image_byte))
+  # JPEG는 디코딩 단계에서 미리 줄여 큰 사진도 적은 메모리로 처리
+  image.draft("RGB", (PROFILE_PICTURE_SIZE * 2, PROFILE_PICTURE_SIZE * 2))
 
   w = image.width;
   h = image.height
 
   if w != h:
     side = min(w, h)
-    log.debug("Cropping profile picture for identity %r from %dx%d to %dx%d", identity_uid, w, h, side, side)
+    log.debug("Cropping profile picture from %dx%d to %dx%d", w, h, side, side)
     left = (w - side) / 2
     top = (h - side) / 2
     right = (w + side) / 2
     bottom = (h + side) / 2
     image = image.crop((left, top, right, bottom))
 
-  image = image.resize((96, 96))
+  image = image.resize((PROFILE_PICTURE_SIZE, PROFILE_PICTURE_SIZE))
+  if image.mode != "RGB":
+    image = image.convert("RGB")
 
   buffer = io.BytesIO()
   image.save(buffer, format="JPEG")
-  binary = buffer.getvalue()
+  return buffer.getvalue()
+
+
+def update_profile_picture(
+  profile_picture: UploadFile,
+  identity_uid: UUID,
+  db: Session
+) -> str:
+  identity: IdentityModel = (
+    db.query(IdentityModel)
+    .filter(IdentityModel.uid == identity_uid)
+    .scalar()
+  )
+
+  if identity is None:
+    log.warning("Identity %r was not found for profile picture update", identity_uid)
+    raise HTTPException(status_code=404, detail="Identity not found")
+
+  image_byte = core_image.read_image(profile_picture)
+  try:
+    binary = worker_pool.run(crop_profile_picture, image_byte)
+  except Image.DecompressionBombError:
+    log.warning("Profile picture of %r has too many pixels", identity_uid)
+    raise HTTPException(status_code=413, detail="Image dimensions are too large")
+  # 형식을 알 수 없거나 중간에 잘린 이미지는 OSError로 올라옴
+  except OSError:
+    log.warning("Profile picture of %r could not be decoded", identity_uid)
+    raise HTTPException(status_code=415, detail="Unsupported image type")
 
   img_uuid = core_image.upload_binary(binary, "image/jpeg", db)
 
   identity.profile_picture = img_uuid
   db.commit()
 
+  invalidate_identity(identity_uid)
+
   return img_uuid
 
 
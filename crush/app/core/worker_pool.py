@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from fastapi import HTTPException
+from typing import Callable, Iterator, TypeVar
+
+from app.core.config_store import config
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+WORKER_POOL_CONFIG = config.get("worker_pool", {})
+WORKER_POOL_KIND = WORKER_POOL_CONFIG.get("kind", "thread")
+WORKER_POOL_SIZE = WORKER_POOL_CONFIG.get("size", os.cpu_count() or 1)
+# 실행 중인 작업과 대기 중인 작업을 합한 최대 개수
+WORKER_POOL_MAX_PENDING = WORKER_POOL_CONFIG.get("max_pending", WORKER_POOL_SIZE * 4)
+
+
+class WorkerPoolMetrics:
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._pending = 0
+    self._peak_pending = 0
+    self._completed = 0
+    self._failed = 0
+    self._rejected = 0
+    self._wait_ms = 0.0
+    self._run_ms = 0.0
+
+  def try_acquire(self, limit: int) -> bool:
+    with self._lock:
+      if self._pending >= limit:
+        self._rejected += 1
+        return False
+      self._pending += 1
+      self._peak_pending = max(self._peak_pending, self._pending)
+      return True
+
+  def release(self):
+    with self._lock:
+      self._pending -= 1
+
+  def observe_done(self, wait_ms: float, run_ms: float, failed: bool):
+    with self._lock:
+      self._pending -= 1
+      self._wait_ms += wait_ms
+      self._run_ms += run_ms
+      if failed:
+        self._failed += 1
+      else:
+        self._completed += 1
+
+  def snapshot(self) -> dict[str, object]:
+    with self._lock:
+      finished = self._completed + self._failed
+      return {
+        "pending": self._pending,
+        "peak_pending": self._peak_pending,
+        "completed": self._completed,
+        "failed": self._failed,
+        "rejected": self._rejected,
+        "avg_wait_ms": round(self._wait_ms / finished, 3) if finished > 0 else None,
+        "avg_run_ms": round(self._run_ms / finished, 3) if finished > 0 else None
+      }
+
+
+def _create_executor() -> Executor:
+  if WORKER_POOL_KIND == "process":
+    return ProcessPoolExecutor(max_workers=WORKER_POOL_SIZE)
+  if WORKER_POOL_KIND == "thread":
+    return ThreadPoolExecutor(max_workers=WORKER_POOL_SIZE, thread_name_prefix="worker-pool")
+  raise ValueError(f"Unsupported worker pool kind: {WORKER_POOL_KIND}")
+
+
+_executor = _create_executor()
+worker_pool_metrics = WorkerPoolMetrics()
+
+
+# process pool에서도 대기 시간을 잴 수 있도록 시작 시각은 worker 안에서 wall clock으로 기록
+def _timed(fn: Callable[..., T], submitted_at: float, *args, **kwargs) -> tuple[T, float, float]:
+  wait_ms = (time.time() - submitted_at) * 1000
+  started_at = time.perf_counter()
+  result = fn(*args, **kwargs)
+  return result, wait_ms, (time.perf_counter() - started_at) * 1000
+
+
+def _acquire():
+  # 대기열이 가득 차면 작업을 쌓아두지 않고 바로 거절하여 가벼운 요청까지 밀리지 않게 함
+  if not worker_pool_metrics.try_acquire(WORKER_POOL_MAX_PENDING):
+    log.warning("Worker pool is saturated. pending limit=%d", WORKER_POOL_MAX_PENDING)
+    raise HTTPException(status_code=503, detail="Server is busy", headers={"Retry-After": "1"})
+
+
+def _submit_acquired(fn: Callable[..., T], *args, **kwargs) -> Future:
+  submitted_at = time.time()
+  result: Future = Future()
+
+  def on_done(future: Future):
+    try:
+      value, wait_ms, run_ms = future.result()
+    except BaseException as e:
+      worker_pool_metrics.observe_done(0, (time.time() - submitted_at) * 1000, failed=True)
+      result.set_exception(e)
+      return
+
+    worker_pool_metrics.observe_done(wait_ms, run_ms, failed=False)
+    result.set_result(value)
+
+  try:
+    _executor.submit(_timed, fn, submitted_at, *args, **kwargs).add_done_callback(on_done)
+  except BaseException:
+    worker_pool_metrics.observe_done(0, 0, failed=True)
+    raise
+
+  return result
+
+
+def submit(fn: Callable[..., T], *args, **kwargs) -> Future:
+  _acquire()
+  return _submit_acquired(fn, *args, **kwargs)
+
+
+class WorkerSlot:
+  def __init__(self):
+    self.used = False
+
+  def submit(self, fn: Callable[..., T], *args, **kwargs) -> Future:
+    if self.used:
+      raise RuntimeError("Worker slot was already used")
+    self.used = True
+    return _submit_acquired(fn, *args, **kwargs)
+
+  def run(self, fn: Callable[..., T], *args, **kwargs) -> T:
+    return self.submit(fn, *args, **kwargs).result()
+
+
+@contextmanager
+def reserve() -> Iterator[WorkerSlot]:
+  # 한 번만 쓸 수 있는 입력(challenge 등)을 꺼내기 전에 자리를 먼저 잡아, 거절되면 입력이 남아 다시 시도할 수 있게 함
+  _acquire()
+  slot = WorkerSlot()
+  try:
+    yield slot
+  finally:
+    if not slot.used:
+      worker_pool_metrics.release()
+
+
+def run(fn: Callable[..., T], *args, **kwargs) -> T:
+  return submit(fn, *args, **kwargs).result()
+
+
+async def run_async(fn: Callable[..., T], *args, **kwargs) -> T:
+  return await asyncio.wrap_future(submit(fn, *args, **kwargs))
+
+
+def worker_pool_status() -> dict[str, object]:
+  return {
+    "kind": WORKER_POOL_KIND,
+    "size": WORKER_POOL_SIZE,
+    "max_pending": WORKER_POOL_MAX_PENDING,
+    **worker_pool_metrics.snapshot()
+  }
@@ -5,9 +5,14 @@ from fastapi import FastAPI
 
 from app.core.auth.passkey.paykey_aaguid import load_aaguid
 from app.core.config_store import mode
+from app.core.interaction.core_like_stats import prune_like_daily
+from app.core.location.core_suggest import load_index
+from app.core.resources.core_image import variant_cache
+from app.core.user.core_user import subscribe_identity_invalidation
 from app.routers.ErrorHandlingRouter import add_error_handler
-from app.routers.auth import GoogleOAuthRouter, GeneralAuthRouter, PasskeyAuthRouter, PasskeyRouter
+from app.routers.auth import GoogleOAuthRouter, GeneralAuthRouter, PasskeyAuthRouter, PasskeyRouter, JwksRouter
 from app.routers.interaction import LikeRouter
+from app.routers.internal import MetricsRouter
 from app.routers.location import PlaceRouter, RegionRouter
 from app.routers.plan import PlanRouter, PlanDatePollingRouter, PlanMembersRouter, PlanActivitiesRouter
 from app.routers.recommendation import RecommendationRouter, ThemeRouter
@@ -28,6 +33,7 @@ app.include_router(PasskeyAuthRouter.router)
 app.include_router(PasskeyRouter.router)
 app.include_router(IdentityRegisterRouter.router)
 app.include_router(GeneralAuthRouter.router)
+app.include_router(JwksRouter.router)
 app.include_router(IdentityRouter.router)
 app.include_router(LikeRouter.router)
 app.include_router(FollowingRouter.router)
@@ -39,8 +45,13 @@ app.include_router(PlanDatePollingRouter.router)
 app.include_router(PlanMembersRouter.router)
 app.include_router(PlanActivitiesRouter.router)
 app.include_router(ImageResourcesRouter.router)
+app.include_router(MetricsRouter.router)
 add_error_handler(app)
 
 load_aaguid()
+load_index()
+subscribe_identity_invalidation()
+prune_like_daily()
+variant_cache.load()
 
 log.info("Application started on %s", datetime.now().isoformat())
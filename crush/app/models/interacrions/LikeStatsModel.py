@@ -0,0 +1,37 @@
+from datetime import datetime, date
+from sqlalchemy import Column, ForeignKey, Integer, Index
+from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP, DATE
+from sqlalchemy.orm import Mapped
+from uuid import UUID as PyUUID
+
+from app.core.database.database import BaseTable
+
+
+class PlaceLikeStatsModel(BaseTable):
+  __tablename__ = "place_like_stats"
+  __table_args__ = (
+    Index("place_like_stats_like_count_idx", "like_count"),
+    {
+      "schema": "interactions"
+    }
+  )
+
+  place_id: Mapped[PyUUID] = Column(UUID(as_uuid=True), ForeignKey("locations.places.uid", ondelete="CASCADE"),
+                                    primary_key=True, nullable=False)
+  like_count: Mapped[int] = Column(Integer, nullable=False, server_default="0")
+  updated_at: Mapped[datetime] = Column(TIMESTAMP, nullable=False, server_default="CURRENT_TIMESTAMP")
+
+
+class PlaceLikeDailyModel(BaseTable):
+  __tablename__ = "place_like_daily"
+  __table_args__ = (
+    Index("place_like_daily_day_idx", "day"),
+    {
+      "schema": "interactions"
+    }
+  )
+
+  place_id: Mapped[PyUUID] = Column(UUID(as_uuid=True), ForeignKey("locations.places.uid", ondelete="CASCADE"),
+                                    primary_key=True, nullable=False)
+  day: Mapped[date] = Column(DATE, primary_key=True, nullable=False)
+  like_count: Mapped[int] = Column(Integer, nullable=False, server_default="0")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, event
+from sqlalchemy import Column, ForeignKey, Index, event
 from sqlalchemy.dialects.postgresql import UUID, VARCHAR, DOUBLE_PRECISION, ARRAY, JSONB, TEXT
 from sqlalchemy.orm import Mapped, relationship, backref
 from uuid import UUID as PyUUID
@@ -10,9 +10,15 @@ from app.models.locations.RegionModel import RegionModel
 
 class PlaceModel(BaseTable):
   __tablename__ = "places"
-  __table_args__ = {
-    "schema": "locations"
-  }
+  __table_args__ = (
+    Index("places_name_umso_trgm_idx", "name_umso", postgresql_using="gin",
+          postgresql_ops={"name_umso": "gin_trgm_ops"}),
+    Index("places_address_trgm_idx", "address", postgresql_using="gin",
+          postgresql_ops={"address": "gin_trgm_ops"}),
+    {
+      "schema": "locations"
+    }
+  )
 
   uid: Mapped[PyUUID] = Column(UUID(as_uuid=True), primary_key=True, unique=True, nullable=False,
                                server_default="gen_random_uuid()")
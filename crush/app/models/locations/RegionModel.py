@@ -1,4 +1,4 @@
-from sqlalchemy import Column, event
+from sqlalchemy import Column, Index, event
 from sqlalchemy.dialects.postgresql import UUID, VARCHAR, TEXT
 from sqlalchemy.orm import Mapped
 from uuid import UUID as PyUUID
@@ -9,9 +9,13 @@ from app.core.hangul.umso import 풀어쓰기
 
 class RegionModel(BaseTable):
   __tablename__ = "regions"
-  __table_args__ = {
-    "schema": "locations"
-  }
+  __table_args__ = (
+    Index("regions_name_umso_trgm_idx", "name_umso", postgresql_using="gin",
+          postgresql_ops={"name_umso": "gin_trgm_ops"}),
+    {
+      "schema": "locations"
+    }
+  )
 
   uid: Mapped[PyUUID] = Column(UUID(as_uuid=True), primary_key=True, unique=True, nullable=False,
                                server_default="gen_random_uuid()")
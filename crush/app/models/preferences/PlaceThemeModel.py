@@ -1,7 +1,7 @@
 import numpy as np
 from numpy.typing import NDArray
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, relationship, backref
 
@@ -11,9 +11,14 @@ from app.schemas.location.Place import Place
 
 class PlaceThemeModel(BaseTable):
   __tablename__ = "place_theme"
-  __table_args__ = {
-    "schema": "preferences"
-  }
+  __table_args__ = (
+    Index("place_theme_theme_hnsw_idx", "theme", postgresql_using="hnsw",
+          postgresql_with={"m": 16, "ef_construction": 64},
+          postgresql_ops={"theme": "vector_ip_ops"}),
+    {
+      "schema": "preferences"
+    }
+  )
 
   place_id: Mapped[UUID] = Column(UUID(as_uuid=True), ForeignKey("locations.places.uid"), primary_key=True,
                                   nullable=False, unique=True)
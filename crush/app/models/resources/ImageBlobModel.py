@@ -0,0 +1,19 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, BigInteger
+from sqlalchemy.dialects.postgresql import VARCHAR, TIMESTAMP
+from sqlalchemy.orm import Mapped
+
+from app.core.database.database import BaseTable
+
+
+class ImageBlobModel(BaseTable):
+  __tablename__ = "image_blob"
+  __table_args__ = {
+    "schema": "resources"
+  }
+
+  digest: Mapped[str] = Column(VARCHAR(64), primary_key=True, nullable=False)
+  mime_type: Mapped[str] = Column(VARCHAR(32), nullable=False)
+  size: Mapped[int] = Column(BigInteger, nullable=False)
+  ref_count: Mapped[int] = Column(Integer, nullable=False, server_default="0")
+  created_at: Mapped[datetime] = Column(TIMESTAMP, nullable=False, server_default="CURRENT_TIMESTAMP")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column
+from sqlalchemy import Column, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID, VARCHAR
 from sqlalchemy.orm import Mapped
 
@@ -14,3 +14,5 @@ class ImageStoreModel(BaseTable):
   uid: Mapped[str] = Column(UUID(as_uuid=True), primary_key=True, nullable=False, unique=True,
                             server_default="gen_random_uuid()")
   mime_type: Mapped[str] = Column(VARCHAR(32), nullable=False)
+  # content-addressed 저장 이전에 올라온 이미지는 digest 없이 uid로 저장되어 있음
+  digest: Mapped[str] = Column(VARCHAR(64), ForeignKey("resources.image_blob.digest"), nullable=True)
@@ -37,8 +37,10 @@ HTTP_CODE_TO_STATE = {
 
 def http_exception_handler(request: Request, exc: HTTPException):
   log.error("HTTPException: status_code={}, detail={}".format(exc.status_code, exc.detail))
+  # Retry-After 등 예외에 지정된 header를 그대로 전달
   response = JSONResponse(
     status_code=exc.status_code,
+    headers=exc.headers,
     content={
       "code": exc.status_code,
       "status": HTTP_CODE_TO_STATE[exc.status_code],
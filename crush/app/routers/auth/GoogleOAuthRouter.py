@@ -2,6 +2,7 @@ import logging
 from fastapi import APIRouter
 from fastapi.params import Cookie, Depends
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from starlette.requests import Request
 from starlette.responses import RedirectResponse, JSONResponse
 from typing import Annotated
@@ -9,7 +10,7 @@ from uuid import UUID
 
 from app.core.auth import core_google_auth
 from app.core.auth.core_google_auth import create_auth_url
-from app.core.auth.core_oauth import set_session_state
+from app.core.auth.core_oauth import set_session_state_async
 from app.core.config_store import config
 from app.core.database.database import create_connection
 from app.core.hash import sha256
@@ -27,10 +28,11 @@ router = APIRouter(
 @router.get(
   path="",
 )
-def begin_authentication():
-  (authorization_url, state) = create_auth_url()
+async def begin_authentication():
+  # client secret 파일을 읽으므로 threadpool에서 실행
+  (authorization_url, state) = await run_in_threadpool(create_auth_url)
 
-  session_uuid = set_session_state(state)
+  session_uuid = await set_session_state_async(state)
 
   response = RedirectResponse(authorization_url)
   response.set_cookie(
@@ -0,0 +1,24 @@
+from fastapi import APIRouter
+from starlette.responses import JSONResponse
+
+from app.core.user import core_jwt
+
+router = APIRouter(
+  prefix="/.well-known",
+  tags=["auth"]
+)
+
+JWKS_CACHE_CONTROL = "public, max-age=300"
+
+
+@router.get(
+  path="/jwks.json"
+)
+def get_jwks():
+  return JSONResponse(
+    status_code=200,
+    content=core_jwt.jwks(),
+    headers={
+      "Cache-Control": JWKS_CACHE_CONTROL
+    }
+  )
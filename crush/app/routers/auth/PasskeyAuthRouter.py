@@ -25,8 +25,8 @@ router = APIRouter(
 @router.get(
   path="/challenge/option"
 )
-def get_passkey_challenge_options():
-  (session_id, option) = core_passkey_auth.begin_authentication()
+async def get_passkey_challenge_options():
+  (session_id, option) = await core_passkey_auth.begin_authentication_async()
 
   response = JSONResponse(
     content={
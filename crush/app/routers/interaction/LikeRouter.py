@@ -1,15 +1,16 @@
 from fastapi import APIRouter
-from fastapi.params import Security, Depends, Query
+from fastapi.params import Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
-from typing import Annotated
+from typing import Annotated, Optional
 from uuid import UUID
 
-from app.core.auth.core_authorization import authorization_header, authorize_jwt
-from app.core.database.database import create_connection
+from app.core.auth.core_authorization import current_identity, current_identity_async
+from app.core.database.database import create_connection, create_async_connection
 from app.core.interaction import core_like
-from app.core.user import core_user
 from app.schemas.interaction.LikeRequests import LikeRequest, LikeSearchRequest
+from app.schemas.user.Identity import Identity
 
 router = APIRouter(
   prefix="/api/v1/interaction/like",
@@ -20,15 +21,12 @@ router = APIRouter(
 @router.get(
   path=""
 )
-def query_liked_places(
+async def query_liked_places(
   query: Annotated[LikeSearchRequest, Query()],
-  jwt: str = Security(authorization_header),
-  db: Session = Depends(create_connection)
+  identity: Optional[Identity] = Depends(current_identity_async),
+  db: AsyncSession = Depends(create_async_connection)
 ):
-  token = authorize_jwt(jwt)
-
-  identity = core_user.get_identity(token, db)
-  liked_places = core_like.list_liked(identity, query, db)
+  liked_places = await core_like.list_liked_async(identity, query, db)
 
   return JSONResponse(
     status_code=200,
@@ -43,15 +41,12 @@ def query_liked_places(
 @router.get(
   path="/{place_id}"
 )
-def query_liked_place(
+async def query_liked_place(
   place_id: UUID,
-  jwt: str = Security(authorization_header),
-  db: Session = Depends(create_connection)
+  identity: Optional[Identity] = Depends(current_identity_async),
+  db: AsyncSession = Depends(create_async_connection)
 ):
-  token = authorize_jwt(jwt)
-
-  identity = core_user.get_identity(token, db)
-  liked = core_like.did_liked_place(identity, place_id, db)
+  liked = await core_like.did_liked_place_async(identity, place_id, db)
   return JSONResponse(
     status_code=200,
     content={
@@ -67,12 +62,9 @@ def query_liked_place(
 )
 def like_place(
   body: LikeRequest,
-  jwt: str = Security(authorization_header),
+  identity: Optional[Identity] = Depends(current_identity),
   db: Session = Depends(create_connection)
 ):
-  token = authorize_jwt(jwt)
-
-  identity = core_user.get_identity(token, db)
   core_like.like_place(identity, body, db)
 
   return JSONResponse(
@@ -89,12 +81,9 @@ def like_place(
 )
 def unlike_place(
   place_id: UUID,
-  jwt: str = Security(authorization_header),
+  identity: Optional[Identity] = Depends(current_identity),
   db: Session = Depends(create_connection)
 ):
-  token = authorize_jwt(jwt)
-
-  identity = core_user.get_identity(token, db)
   core_like.dislike_place(identity, place_id, db)
 
   return JSONResponse(
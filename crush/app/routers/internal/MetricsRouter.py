@@ -0,0 +1,84 @@
+import logging
+from fastapi import APIRouter
+from fastapi.params import Security
+from starlette.responses import JSONResponse
+
+from app.core.auth.core_authorization import authorization_header, authorize_jwt, jwt_cache_status
+from app.core.database.database import engine, async_engine
+from app.core.database.pool_metrics import pool_status
+from app.core.database.read_cache import cache_status
+from app.core.resources.core_image import variant_cache
+from app.core.user.core_user import identity_cache_status
+from app.core.user.core_jwt import require_role, Role
+from app.core.worker_pool import worker_pool_status
+
+log = logging.getLogger(__name__)
+
+router = APIRouter(
+  prefix="/internal/metrics",
+  tags=["internal", "metrics"],
+  include_in_schema=False
+)
+
+
+@router.get(
+  path="/db-pool"
+)
+def get_db_pool_metrics(
+  jwt: str = Security(authorization_header)
+):
+  token = authorize_jwt(jwt)
+  require_role(token, Role.METRICS_READ)
+
+  return JSONResponse(
+    status_code=200,
+    content={
+      "code": 200,
+      "status": "OK",
+      "pools": {
+        "sync": pool_status(engine.pool),
+        "async": pool_status(async_engine.pool)
+      }
+    }
+  )
+
+
+@router.get(
+  path="/cache"
+)
+def get_cache_metrics(
+  jwt: str = Security(authorization_header)
+):
+  token = authorize_jwt(jwt)
+  require_role(token, Role.METRICS_READ)
+
+  return JSONResponse(
+    status_code=200,
+    content={
+      "code": 200,
+      "status": "OK",
+      "caches": cache_status(),
+      "jwt": jwt_cache_status(),
+      "identity": identity_cache_status(),
+      "image_variants": variant_cache.status()
+    }
+  )
+
+
+@router.get(
+  path="/worker-pool"
+)
+def get_worker_pool_metrics(
+  jwt: str = Security(authorization_header)
+):
+  token = authorize_jwt(jwt)
+  require_role(token, Role.METRICS_READ)
+
+  return JSONResponse(
+    status_code=200,
+    content={
+      "code": 200,
+      "status": "OK",
+      "pool": worker_pool_status()
+    }
+  )
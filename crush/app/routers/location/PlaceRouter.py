@@ -1,17 +1,21 @@
 import logging
 from fastapi import APIRouter, Depends
 from fastapi.params import Security
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
 from typing import Annotated
 from uuid import UUID
 
 from app.core.auth.core_authorization import authorization_header, authorize_jwt
-from app.core.database.database import create_connection
-from app.core.location import core_place
+from app.core.database.database import create_connection, create_async_connection
+from app.core.interaction import core_like_stats
+from app.core.location import core_place, core_suggest
 from app.core.user.core_jwt import require_role, Role
 from app.schemas.location.Place import Place
 from app.schemas.location.PlaceRequests import AddPlace, PlaceSearchQuery, PatchPlace
+from app.schemas.location.PopularRequests import PopularPlaceQuery
+from app.schemas.location.SuggestRequests import SuggestQuery
 
 log = logging.getLogger(__name__)
 
@@ -27,14 +31,14 @@ router = APIRouter(
 async def search_place(
   query: Annotated[PlaceSearchQuery, Depends()],
   jwt: str = Security(authorization_header),
-  db: Session = Depends(create_connection)
+  db: AsyncSession = Depends(create_async_connection)
 ):
   token = authorize_jwt(jwt)
   require_role(token, Role.CORE_USER)
 
   log.info("Searching place. query=[%s]", query)
 
-  places: list[Place] = core_place.search_place(query, db)
+  places: list[Place] = await core_place.search_place_async(query, db)
   log.info("Found %d places" % len(places))
 
   return JSONResponse({
@@ -46,10 +50,55 @@ async def search_place(
   })
 
 
+@router.get(
+  path="/suggest",
+)
+def suggest_place(
+  query: Annotated[SuggestQuery, Depends()],
+  jwt: str = Security(authorization_header)
+):
+  token = authorize_jwt(jwt)
+  require_role(token, Role.CORE_USER)
+
+  suggestions = core_suggest.suggest_place(query.q, query.limit)
+  log.debug("Suggested %d places for %r", len(suggestions), query.q)
+
+  return JSONResponse({
+    "code": 200,
+    "status": "OK",
+    "content": suggestions
+  })
+
+
+@router.get(
+  path="/popular",
+)
+def popular_place(
+  query: Annotated[PopularPlaceQuery, Depends()],
+  jwt: str = Security(authorization_header),
+  db: Session = Depends(create_connection)
+):
+  token = authorize_jwt(jwt)
+  require_role(token, Role.CORE_USER)
+
+  popular = core_like_stats.popular_places(query.days, query.region_uid, query.limit, db)
+
+  return JSONResponse({
+    "code": 200,
+    "status": "OK",
+    "content": [
+      {
+        "place": Place(place).model_dump(),
+        "likes": likes
+      } for place, likes in popular
+    ]
+  })
+
+
 @router.post(
   path="",
 )
-async def add_place(
+def add_place(
   new_place: AddPlace,
   jwt: str = Security(authorization_header),
   db: Session = Depends(create_connection)
@@ -71,7 +120,7 @@ async def add_place(
 @router.patch(
   path="/{place_id}",
 )
-async def patch_place(
+def patch_place(
   place_id: UUID,
   query: PatchPlace,
   jwt: str = Security(authorization_header),
@@ -93,7 +142,7 @@ async def patch_place(
 @router.delete(
   path="/{place_id}",
 )
-async def delete_place(
+def delete_place(
   place_id: UUID,
   jwt: str = Security(authorization_header),
   db: Session = Depends(create_connection)
@@ -1,16 +1,20 @@
 import logging
 from fastapi import APIRouter, Query, Depends, Security
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
 from typing import Annotated
 from uuid import UUID
 
 from app.core.auth.core_authorization import authorization_header, authorize_jwt
-from app.core.database.database import create_connection
-from app.core.location import core_region
+from app.core.database.database import create_connection, create_async_connection
+from app.core.interaction import core_like_stats
+from app.core.location import core_region, core_suggest
 from app.core.user.core_jwt import require_role, Role
 from app.schemas.location.Region import Region
 from app.schemas.location.RegionsRequests import AddRegion, RegionSearchQuery, PatchRegion
+from app.schemas.location.PopularRequests import PopularRegionQuery
+from app.schemas.location.SuggestRequests import SuggestQuery
 
 router = APIRouter(
   prefix="/api/v1/location/region",
@@ -26,13 +30,13 @@ log = logging.getLogger(__name__)
 async def search_region(
   query: Annotated[RegionSearchQuery, Query()],
   jwt: str = Security(authorization_header),
-  db: Session = Depends(create_connection)
+  db: AsyncSession = Depends(create_async_connection)
 ):
   token = authorize_jwt(jwt)
   require_role(token, Role.CORE_USER)
 
   log.info("Searching region. query=[%s]", query)
-  regions: list[Region] = core_region.search_region(query, db)
+  regions: list[Region] = await core_region.search_region_async(query, db)
   log.info("Found %d regions" % len(regions))
 
   return JSONResponse({
@@ -44,10 +48,55 @@ async def search_region(
   })
 
 
+@router.get(
+  path="/suggest",
+)
+def suggest_region(
+  query: Annotated[SuggestQuery, Query()],
+  jwt: str = Security(authorization_header)
+):
+  token = authorize_jwt(jwt)
+  require_role(token, Role.CORE_USER)
+
+  suggestions = core_suggest.suggest_region(query.q, query.limit)
+  log.debug("Suggested %d regions for %r", len(suggestions), query.q)
+
+  return JSONResponse({
+    "code": 200,
+    "status": "OK",
+    "content": suggestions
+  })
+
+
+@router.get(
+  path="/popular",
+)
+def popular_region(
+  query: Annotated[PopularRegionQuery, Query()],
+  jwt: str = Security(authorization_header),
+  db: Session = Depends(create_connection)
+):
+  token = authorize_jwt(jwt)
+  require_role(token, Role.CORE_USER)
+
+  popular = core_like_stats.popular_regions(query.days, query.limit, db)
+
+  return JSONResponse({
+    "code": 200,
+    "status": "OK",
+    "content": [
+      {
+        "region": str(region_uid),
+        "likes": likes
+      } for region_uid, likes in popular
+    ]
+  })
+
+
 @router.post(
   path="",
 )
-async def add_region(
+def add_region(
   region: AddRegion,
   jwt: str = Security(authorization_header),
   db: Session = Depends(create_connection)
@@ -69,7 +118,7 @@ async def add_region(
 @router.patch(
   path="/{region_id}",
 )
-async def patch_region(
+def patch_region(
   region_id: UUID,
   query: PatchRegion,
   jwt: str = Security(authorization_header),
@@ -91,7 +140,7 @@ async def patch_region(
 @router.delete(
   path="/{region_id}",
 )
-async def delete_region(
+def delete_region(
   region_id: UUID,
   jwt: str = Security(authorization_header),
   db: Session = Depends(create_connection)
@@ -1,12 +1,13 @@
 import logging
 from fastapi import APIRouter
 from fastapi.params import Security, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
 from uuid import UUID
 
 from app.core.auth.core_authorization import authorization_header, authorize_jwt
-from app.core.database.database import create_connection
+from app.core.database.database import create_connection, create_async_connection
 from app.core.plan import core_plan
 from app.core.user.core_jwt import require_role, Role, get_sub
 from app.schemas.plan.PlanRequests import AddPlanRequest, FixDateRequest, ChangePlanNameRequest
@@ -47,16 +48,16 @@ def add_plan(
 @router.get(
   path=""
 )
-def list_plans(
+async def list_plans(
   jwt: str = Security(authorization_header),
-  db: Session = Depends(create_connection)
+  db: AsyncSession = Depends(create_async_connection)
 ):
   token = authorize_jwt(jwt)
   require_role(token, Role.CORE_USER)
 
   sub = get_sub(token)
   log.info("Listing plans of user %r", sub)
-  plans = core_plan.list_plans(sub, db)
+  plans = await core_plan.list_plans_async(sub, db)
   log.info("Found %d plans for %r", len(plans), sub)
 
   return JSONResponse(
@@ -72,16 +73,16 @@ def list_plans(
 @router.get(
   path="/{plan_id}"
 )
-def get_plan(
+async def get_plan(
   plan_id: UUID,
   jwt: str = Security(authorization_header),
-  db: Session = Depends(create_connection)
+  db: AsyncSession = Depends(create_async_connection)
 ):
   token = authorize_jwt(jwt)
   require_role(token, Role.CORE_USER)
 
   log.info("Searching plan. plan_id=[%s]", plan_id)
-  plan = core_plan.get_plan(plan_id, get_sub(token), db)
+  plan = await core_plan.get_plan_async(plan_id, get_sub(token), db)
   log.info("Found plan uid=%r, name=%r", plan.get("uid"), plan.get("name"))
 
   return JSONResponse(
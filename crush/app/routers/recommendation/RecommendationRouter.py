@@ -1,14 +1,15 @@
 from fastapi import APIRouter
-from fastapi.params import Security, Query, Depends
+from fastapi.params import Query, Depends
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
-from typing import Annotated
+from typing import Annotated, Optional
 
-from app.core.auth.core_authorization import authorization_header, authorize_jwt
+from app.core.auth.core_authorization import current_identity
 from app.core.database.database import create_connection
 from app.core.recommendation import core_recommendation
-from app.core.user import core_user
-from app.schemas.recommendation.RecommendationRequests import RecommendByUsersParam, RecommendByUserFromRegionParam
+from app.schemas.recommendation.RecommendationRequests import RecommendByUsersParam, RecommendByUserFromRegionParam, \
+  RecommendPersonalParam, RecommendGroupParam
+from app.schemas.user.Identity import Identity
 
 router = APIRouter(
   prefix="/api/v1/recommendation",
@@ -21,12 +22,9 @@ router = APIRouter(
 )
 def recommend_region_from_users(
   users: Annotated[RecommendByUsersParam, Query()],
-  jwt: str = Security(authorization_header),
+  identity: Optional[Identity] = Depends(current_identity),
   db: Session = Depends(create_connection)
 ):
-  token = authorize_jwt(jwt)
-  identity = core_user.get_identity(token, db)
-
   recommendation = core_recommendation.recommend_region_from_users(identity, users.get_user_uuids(), db)
 
   return JSONResponse(
@@ -44,12 +42,9 @@ def recommend_region_from_users(
 )
 def recommend_place_from_users(
   cond: Annotated[RecommendByUserFromRegionParam, Query()],
-  jwt: str = Security(authorization_header),
+  identity: Optional[Identity] = Depends(current_identity),
   db: Session = Depends(create_connection)
 ):
-  token = authorize_jwt(jwt)
-  identity = core_user.get_identity(token, db)
-
   recommendation = core_recommendation.recommend_place_from_users(identity, cond.get_user_uuids(),
                                                                   cond.get_regions_uuid(), db)
 
@@ -61,3 +56,45 @@ def recommend_place_from_users(
       "recommendation": recommendation
     }
   )
+
+
+@router.get(
+  path="/place/personal"
+)
+def recommend_place_for_user(
+  cond: Annotated[RecommendPersonalParam, Query()],
+  identity: Optional[Identity] = Depends(current_identity),
+  db: Session = Depends(create_connection)
+):
+  recommendation = core_recommendation.recommend_place_for_user(identity, cond.get_regions_uuid(), cond.limit, db)
+
+  return JSONResponse(
+    status_code=200,
+    content={
+      "code": 200,
+      "status": "OK",
+      "recommendation": recommendation
+    }
+  )
+
+
+@router.get(
+  path="/place/group"
+)
+def recommend_place_for_group(
+  cond: Annotated[RecommendGroupParam, Query()],
+  identity: Optional[Identity] = Depends(current_identity),
+  db: Session = Depends(create_connection)
+):
+  recommendation = core_recommendation.recommend_place_for_group(identity, cond.get_user_uuids(),
+                                                                 cond.get_regions_uuid(), cond.strategy,
+                                                                 cond.get_weights(), cond.like_weight, cond.limit, db)
+
+  return JSONResponse(
+    status_code=200,
+    content={
+      "code": 200,
+      "status": "OK",
+      "recommendation": recommendation
+    }
+  )
@@ -1,16 +1,19 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.params import Security, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
-from typing import Annotated
+from typing import Annotated, Optional
 from uuid import UUID
 
-from app.core.auth.core_authorization import authorization_header, authorize_jwt
-from app.core.database.database import create_connection
+from app.core.auth.core_authorization import authorization_header, authorize_jwt, current_identity, \
+  current_identity_async
+from app.core.database.database import create_connection, create_async_connection
 from app.core.relationship import core_follower
 from app.core.user import core_user
 from app.core.user.core_jwt import require_role, Role
 from app.schemas.relationship.FollowRequests import FollowPatchRequest, ListingRelationshipRequest
+from app.schemas.user.Identity import Identity
 
 router = APIRouter(
   prefix="/api/v1/user/follower",
@@ -21,14 +24,12 @@ router = APIRouter(
 @router.get(
   path=""
 )
-def list_followers(
+async def list_followers(
   query: Annotated[ListingRelationshipRequest, Query()],
-  jwt: str = Security(authorization_header),
-  db: Session = Depends(create_connection)
+  identity: Optional[Identity] = Depends(current_identity_async),
+  db: AsyncSession = Depends(create_async_connection)
 ):
-  token = authorize_jwt(jwt)
-  identity = core_user.get_identity(token, db)
-  followers = core_follower.list_followers(identity, query, db)
+  followers = await core_follower.list_followers_async(identity, query, db)
 
   return JSONResponse(
     status_code=200,
@@ -43,13 +44,11 @@ def list_followers(
 @router.get(
   path="/count"
 )
-def count_follower(
-  jwt: str = Security(authorization_header),
-  db: Session = Depends(create_connection)
+async def count_follower(
+  identity: Optional[Identity] = Depends(current_identity_async),
+  db: AsyncSession = Depends(create_async_connection)
 ):
-  token = authorize_jwt(jwt)
-  identity = core_user.get_identity(token, db)
-  cnt = core_follower.count_follower(identity, db)
+  cnt = await core_follower.count_follower_async(identity, db)
 
   return JSONResponse(
     status_code=200,
@@ -64,19 +63,19 @@ def count_follower(
 @router.get(
   path="/count/{user_id}"
 )
-def count_user_follower(
+async def count_user_follower(
   user_id: UUID,
   jwt: str = Security(authorization_header),
-  db: Session = Depends(create_connection)
+  db: AsyncSession = Depends(create_async_connection)
 ):
   token = authorize_jwt(jwt)
   require_role(token, Role.CORE_USER)
 
-  identity = core_user.get_identity_by_uid(user_id, db)
+  identity = await core_user.get_identity_by_uid_async(user_id, db)
   if identity is None:
     raise HTTPException(status_code=404, detail="Identity not found")
 
-  cnt = core_follower.count_follower(identity, db)
+  cnt = await core_follower.count_follower_async(identity, db)
 
   return JSONResponse(
     status_code=200,
@@ -91,14 +90,12 @@ def count_user_follower(
 @router.get(
   path="/{follower_id}"
 )
-def query_relationship(
+async def query_relationship(
   follower_id: UUID,
-  jwt: str = Security(authorization_header),
-  db: Session = Depends(create_connection)
+  identity: Optional[Identity] = Depends(current_identity_async),
+  db: AsyncSession = Depends(create_async_connection)
 ):
-  token = authorize_jwt(jwt)
-  identity = core_user.get_identity(token, db)
-  relation = core_follower.query_follower(identity, follower_id, db)
+  relation = await core_follower.query_follower_async(identity, follower_id, db)
 
   return JSONResponse(
     status_code=200,
@@ -115,11 +112,9 @@ def query_relationship(
 )
 def unfollow(
   follower_id: UUID,
-  jwt: str = Security(authorization_header),
+  identity: Optional[Identity] = Depends(current_identity),
   db: Session = Depends(create_connection)
 ):
-  token = authorize_jwt(jwt)
-  identity = core_user.get_identity(token, db)
   core_follower.unfollow(identity, follower_id, db)
 
   return JSONResponse(
@@ -137,12 +132,9 @@ def unfollow(
 def patch_relationship(
   follower_id: UUID,
   body: FollowPatchRequest,
-  jwt: str = Security(authorization_header),
+  identity: Optional[Identity] = Depends(current_identity),
   db: Session = Depends(create_connection)
 ):
-  token = authorize_jwt(jwt)
-  identity = core_user.get_identity(token, db)
-
   core_follower.patch_relationship(identity, follower_id, body, db)
 
   return JSONResponse(
@@ -1,16 +1,19 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.params import Security, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
-from typing import Annotated
+from typing import Annotated, Optional
 from uuid import UUID
 
-from app.core.auth.core_authorization import authorization_header, authorize_jwt
-from app.core.database.database import create_connection
+from app.core.auth.core_authorization import authorization_header, authorize_jwt, current_identity, \
+  current_identity_async
+from app.core.database.database import create_connection, create_async_connection
 from app.core.relationship import core_following
 from app.core.user import core_user
 from app.core.user.core_jwt import require_role, Role
 from app.schemas.relationship.FollowRequests import FollowRequest, FollowPatchRequest, ListingRelationshipRequest
+from app.schemas.user.Identity import Identity
 
 router = APIRouter(
   prefix="/api/v1/user/following",
@@ -21,14 +24,12 @@ router = APIRouter(
 @router.get(
   path=""
 )
-def list_followings(
+async def list_followings(
   query: Annotated[ListingRelationshipRequest, Query()],
-  jwt: str = Security(authorization_header),
-  db: Session = Depends(create_connection)
+  identity: Optional[Identity] = Depends(current_identity_async),
+  db: AsyncSession = Depends(create_async_connection)
 ):
-  token = authorize_jwt(jwt)
-  identity = core_user.get_identity(token, db)
-  followings = core_following.list_followings(identity, query, db)
+  followings = await core_following.list_followings_async(identity, query, db)
 
   return JSONResponse(
     status_code=200,
@@ -46,13 +47,11 @@ def list_followings(
 @router.get(
   path="/count"
 )
-def count_following(
-  jwt: str = Security(authorization_header),
-  db: Session = Depends(create_connection)
+async def count_following(
+  identity: Optional[Identity] = Depends(current_identity_async),
+  db: AsyncSession = Depends(create_async_connection)
 ):
-  token = authorize_jwt(jwt)
-  identity = core_user.get_identity(token, db)
-  cnt = core_following.count_following(identity, db)
+  cnt = await core_following.count_following_async(identity, db)
 
   return JSONResponse(
     status_code=200,
@@ -67,19 +66,19 @@ def count_following(
 @router.get(
   path="/count/{user_id}"
 )
-def count_user_following(
+async def count_user_following(
   user_id: UUID,
   jwt: str = Security(authorization_header),
-  db: Session = Depends(create_connection)
+  db: AsyncSession = Depends(create_async_connection)
 ):
   token = authorize_jwt(jwt)
   require_role(token, Role.CORE_USER)
 
-  identity = core_user.get_identity_by_uid(user_id, db)
+  identity = await core_user.get_identity_by_uid_async(user_id, db)
   if identity is None:
     raise HTTPException(status_code=404, detail="Identity not found")
 
-  cnt = core_following.count_following(identity, db)
+  cnt = await core_following.count_following_async(identity, db)
 
   return JSONResponse(
     status_code=200,
@@ -94,14 +93,12 @@ def count_user_following(
 @router.get(
   path="/{friend_id}"
 )
-def query_relationship(
+async def query_relationship(
   friend_id: UUID,
-  jwt: str = Security(authorization_header),
-  db: Session = Depends(create_connection)
+  identity: Optional[Identity] = Depends(current_identity_async),
+  db: AsyncSession = Depends(create_async_connection)
 ):
-  token = authorize_jwt(jwt)
-  identity = core_user.get_identity(token, db)
-  relation = core_following.query_following(identity, friend_id, db)
+  relation = await core_following.query_following_async(identity, friend_id, db)
 
   return JSONResponse(
     status_code=200,
@@ -118,12 +115,9 @@ def query_relationship(
 )
 def follow(
   body: FollowRequest,
-  jwt: str = Security(authorization_header),
+  identity: Optional[Identity] = Depends(current_identity),
   db: Session = Depends(create_connection)
 ):
-  token = authorize_jwt(jwt)
-  identity = core_user.get_identity(token, db)
-
   core_following.follow(identity, body, db)
 
   return JSONResponse(
@@ -140,11 +134,9 @@ def follow(
 )
 def unfollow(
   friend_id: UUID,
-  jwt: str = Security(authorization_header),
+  identity: Optional[Identity] = Depends(current_identity),
   db: Session = Depends(create_connection)
 ):
-  token = authorize_jwt(jwt)
-  identity = core_user.get_identity(token, db)
   core_following.unfollow(identity, friend_id, db)
 
   return JSONResponse(
@@ -162,12 +154,9 @@ def unfollow(
 def patch_relationship(
   friend_id: UUID,
   body: FollowPatchRequest,
-  jwt: str = Security(authorization_header),
+  identity: Optional[Identity] = Depends(current_identity),
   db: Session = Depends(create_connection)
 ):
-  token = authorize_jwt(jwt)
-  identity = core_user.get_identity(token, db)
-
   core_following.patch_relationship(identity, friend_id, body, db)
 
   return JSONResponse(
@@ -1,17 +1,26 @@
 import logging
+import os
+from email.utils import formatdate
 from fastapi import APIRouter, UploadFile
-from fastapi.params import Security, Depends, File
+from fastapi.params import Security, Depends, File, Query, Header
 from sqlalchemy.orm import Session
-from starlette.responses import JSONResponse, RedirectResponse, FileResponse, Response
+from starlette.responses import JSONResponse, RedirectResponse, FileResponse, Response, StreamingResponse
+from typing import Literal, Optional, Annotated
 from uuid import UUID
 
 from app.core.auth.core_authorization import authorization_header, authorize_jwt
 from app.core.database.database import create_connection
 from app.core.resources import core_image
 from app.core.user.core_jwt import require_role, Role, get_sub
+from app.schemas.resources.ImageRequests import ImageVariantQuery
 
 log = logging.getLogger(__name__)
 
+# 아이콘은 AAGUID 메타데이터가 갱신될 때만 바뀌고, 바뀌면 ETag도 바뀜
+AUTHENTICATOR_IMAGE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 저장된 이미지는 uid가 바뀌지 않는 한 내용이 바뀌지 않고, 변환 결과도 마찬가지임
+STORED_IMAGE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
 router = APIRouter(
   prefix="/api/v1/resources/image",
   tags=["resources", "image"],
@@ -23,14 +32,56 @@ router = APIRouter(
 )
 def get_stored_image(
   image_uuid: UUID,
+  query: Annotated[ImageVariantQuery, Depends()],
+  if_none_match: Optional[str] = Header(default=None),
   db: Session = Depends(create_connection)
 ):
   log.info("Querying stored image %r", image_uuid)
-  path, mime = core_image.stored_image(image_uuid, db)
+  key, mime = core_image.stored_image(image_uuid, db)
+
+  variant = None
+  etag = core_image.image_etag(image_uuid)
+  if not query.is_original():
+    variant = core_image.image_variant(image_uuid, mime, query)
+    etag = variant.etag
+
+  headers = {
+    "ETag": etag,
+    "Cache-Control": STORED_IMAGE_CACHE_CONTROL
+  }
+
+  # ETag는 uid와 변환 조건만으로 정해지므로 파일을 열거나 변환하지 않고 응답함
+  if core_image.etag_matches(if_none_match, etag):
+    log.debug("Stored image %r was not modified", image_uuid)
+    return Response(status_code=304, headers=headers)
 
+  if variant is not None:
+    log.info("Resizing stored image %r to %r", image_uuid, query)
+    # 캐시 파일은 다른 worker가 언제든 지울 수 있으므로 경로 대신 열어둔 파일로 응답함
+    handle = core_image.open_variant(key, variant, query)
+    stat = os.fstat(handle.fileno())
+    headers["Content-Length"] = str(stat.st_size)
+    headers["Last-Modified"] = formatdate(stat.st_mtime, usegmt=True)
+    return StreamingResponse(
+      core_image.read_chunks(handle),
+      media_type=variant.mime_type,
+      headers=headers
+    )
+
+  if core_image.image_storage.redirects:
+    # 원본은 저장소에서 바로 받도록 하여 worker가 이미지 내용을 중계하지 않음
+    return RedirectResponse(
+      url=core_image.image_storage.url(key),
+      headers={
+        "Cache-Control": f"public, max-age={core_image.image_storage.url_max_age}"
+      }
+    )
+
+  # Range, If-Range 요청은 FileResponse가 처리함
   return FileResponse(
-    path,
+    core_image.image_storage.local_path(key),
     media_type=mime,
+    headers=headers
   )
 
 
@@ -77,12 +128,23 @@ def get_profile_image(
 )
 def get_authenticator_image(
   aaguid: UUID,
+  variant: Literal["light", "dark"] = Query(default="light"),
+  if_none_match: Optional[str] = Header(default=None)
 ):
-  log.info("Querying authenticator image for AAGUID %r", aaguid)
-  path, mime = core_image.authenticator_image(aaguid)
-  log.debug("Authenticator image path for AAGUID %r is %r", aaguid, path)
+  log.info("Querying %s authenticator image for AAGUID %r", variant, aaguid)
+  icon = core_image.authenticator_image(aaguid, variant)
+
+  headers = {
+    "ETag": icon.etag,
+    "Cache-Control": AUTHENTICATOR_IMAGE_CACHE_CONTROL
+  }
+
+  if core_image.etag_matches(if_none_match, icon.etag):
+    log.debug("Authenticator image for AAGUID %r was not modified", aaguid)
+    return Response(status_code=304, headers=headers)
 
   return Response(
-    content=path,
-    media_type=mime
+    content=icon.content,
+    media_type=icon.mime,
+    headers=headers
   )
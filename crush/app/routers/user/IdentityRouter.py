@@ -68,7 +68,7 @@ def update_user_identity(
 @router.patch(
   path="/picture"
 )
-async def update_user_profile_picture(
+def update_user_profile_picture(
   file: UploadFile = File(...),
   jwt: str = Security(authorization_header),
   db: Session = Depends(create_connection)
@@ -77,7 +77,7 @@ async def update_user_profile_picture(
   require_role(token, Role.CORE_USER)
 
   log.info("Updating profile picture for identity %r", get_sub(token))
-  img_uuid = await core_user.update_profile_picture(file, get_sub(token), db)
+  img_uuid = core_user.update_profile_picture(file, get_sub(token), db)
   log.info("Update of profile picture for identity %r was committed", get_sub(token))
 
   return JSONResponse(
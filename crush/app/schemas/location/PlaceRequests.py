@@ -23,6 +23,7 @@ class PlaceSearchQuery(BaseModel):
     min_length=0, max_length=512,
     pattern=r"^(\w+(\.\w+)*=\w+(,\w+(\.\w+)*=\w+)*)?$"
   )
+  fuzzy: bool = Field(default=False)
 
   limit: int = Field(default=100, ge=0, le=100)
 
@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from uuid import UUID
+
+from app.core.interaction.core_like_stats import RECENT_WINDOW_MAX_DAYS
+
+
+class PopularPlaceQuery(BaseModel):
+  region_uid: Optional[UUID] = Field(alias="regionUid", default=None)
+  days: Optional[int] = Field(default=None, ge=1, le=RECENT_WINDOW_MAX_DAYS)
+  limit: int = Field(default=20, ge=1, le=100)
+
+
+class PopularRegionQuery(BaseModel):
+  days: Optional[int] = Field(default=None, ge=1, le=RECENT_WINDOW_MAX_DAYS)
+  limit: int = Field(default=20, ge=1, le=100)
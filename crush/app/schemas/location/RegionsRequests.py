@@ -9,6 +9,7 @@ class RegionSearchQuery(BaseModel):
     min_length=1, max_length=64,
   )
   uid: Optional[UUID] = Field(default=None)
+  fuzzy: bool = Field(default=False)
   limit: int = Field(100, ge=0, le=100)
 
 
@@ -0,0 +1,8 @@
+from pydantic import BaseModel, Field
+
+
+class SuggestQuery(BaseModel):
+  q: str = Field(
+    min_length=1, max_length=64
+  )
+  limit: int = Field(default=10, ge=1, le=50)
@@ -1,4 +1,6 @@
+import math
 from pydantic import Field, BaseModel
+from typing import Optional, Literal
 from uuid import UUID
 
 
@@ -42,3 +44,73 @@ class RecommendByUserFromRegionParam(BaseModel):
         raise ValueError("invalid as uuid")
 
     return uuids
+
+
+class RecommendPersonalParam(BaseModel):
+  regions: Optional[str] = Field(default=None)
+  limit: int = Field(default=20, ge=1, le=40)
+
+  def get_regions_uuid(self) -> Optional[list[UUID]]:
+    if self.regions is None:
+      return None
+
+    uuid_strs = self.regions.split(".")
+    uuids = []
+    for uuid_str in uuid_strs:
+      try:
+        uuids.append(UUID(uuid_str))
+      except ValueError:
+        raise ValueError("invalid as uuid")
+
+    return uuids
+
+
+class RecommendGroupParam(BaseModel):
+  users: str = Field()
+  regions: Optional[str] = Field(default=None)
+  strategy: Literal["mean", "least_misery", "weighted"] = Field(default="mean")
+  weights: Optional[str] = Field(default=None)
+  like_weight: float = Field(default=0.5, ge=0)
+  limit: int = Field(default=20, ge=1, le=40)
+
+  def get_user_uuids(self) -> list[UUID]:
+    uuid_strs = self.users.split(".")
+    uuids = []
+    for uuid_str in uuid_strs:
+      try:
+        uuids.append(UUID(uuid_str))
+      except ValueError:
+        raise ValueError("invalid as uuid")
+
+    return uuids
+
+  def get_regions_uuid(self) -> Optional[list[UUID]]:
+    if self.regions is None:
+      return None
+
+    uuid_strs = self.regions.split(".")
+    uuids = []
+    for uuid_str in uuid_strs:
+      try:
+        uuids.append(UUID(uuid_str))
+      except ValueError:
+        raise ValueError("invalid as uuid")
+
+    return uuids
+
+  def get_weights(self) -> Optional[list[float]]:
+    if self.weights is None:
+      return None
+
+    weights = []
+    for weight_str in self.weights.split(","):
+      try:
+        weight = float(weight_str)
+      except ValueError:
+        raise ValueError("invalid as weight")
+      # nan, inf나 음수 가중치는 가중 평균을 깨뜨림
+      if not (math.isfinite(weight) and weight >= 0):
+        raise ValueError("invalid as weight")
+      weights.append(weight)
+
+    return weights
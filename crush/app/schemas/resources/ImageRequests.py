@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import Optional, Literal
+
+IMAGE_VARIANT_MAX_DIMENSION = 2048
+
+
+class ImageVariantQuery(BaseModel):
+  width: Optional[int] = Field(default=None, ge=1, le=IMAGE_VARIANT_MAX_DIMENSION)
+  height: Optional[int] = Field(default=None, ge=1, le=IMAGE_VARIANT_MAX_DIMENSION)
+  format: Optional[Literal["jpeg", "webp", "avif"]] = Field(default=None)
+
+  def is_original(self) -> bool:
+    return self.width is None and self.height is None and self.format is None
@@ -0,0 +1,12 @@
+-- 장소/지역 이름(음소) 및 주소 검색용 pg_trgm GIN 인덱스
+-- LIKE '%...%' 와 % (유사도) 연산자 모두 인덱스를 사용함
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS places_name_umso_trgm_idx
+  ON locations.places USING gin (name_umso gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS places_address_trgm_idx
+  ON locations.places USING gin (address gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS regions_name_umso_trgm_idx
+  ON locations.regions USING gin (name_umso gin_trgm_ops);
@@ -0,0 +1,5 @@
+-- 개인화 장소 추천용 place_theme HNSW 인덱스 (내적 기준)
+-- recommend_place_for_user는 theme <#> prefer 오름차순으로 정렬함
+CREATE INDEX CONCURRENTLY IF NOT EXISTS place_theme_theme_hnsw_idx
+  ON preferences.place_theme USING hnsw (theme vector_ip_ops)
+  WITH (m = 16, ef_construction = 64);
@@ -0,0 +1,37 @@
+-- 장소별 좋아요 수 집계 테이블. core_like의 like/dislike 트랜잭션 안에서 함께 갱신됨
+CREATE TABLE IF NOT EXISTS interactions.place_like_stats
+(
+  place_id   uuid      NOT NULL PRIMARY KEY REFERENCES locations.places (uid) ON DELETE CASCADE,
+  like_count integer   NOT NULL DEFAULT 0,
+  updated_at timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS place_like_stats_like_count_idx
+  ON interactions.place_like_stats (like_count);
+
+-- 최근 N일 집계용 일별 좋아요 수
+CREATE TABLE IF NOT EXISTS interactions.place_like_daily
+(
+  place_id   uuid    NOT NULL REFERENCES locations.places (uid) ON DELETE CASCADE,
+  day        date    NOT NULL,
+  like_count integer NOT NULL DEFAULT 0,
+  PRIMARY KEY (place_id, day)
+);
+
+CREATE INDEX IF NOT EXISTS place_like_daily_day_idx
+  ON interactions.place_like_daily (day);
+
+-- 기존 좋아요로 초기 집계
+INSERT INTO interactions.place_like_stats (place_id, like_count)
+SELECT place_id, count(*)
+FROM interactions.likes
+GROUP BY place_id
+ON CONFLICT (place_id) DO UPDATE SET like_count = excluded.like_count,
+                                     updated_at = CURRENT_TIMESTAMP;
+
+INSERT INTO interactions.place_like_daily (place_id, day, like_count)
+SELECT place_id, liked_at::date, count(*)
+FROM interactions.likes
+WHERE liked_at::date > CURRENT_DATE - 30
+GROUP BY place_id, liked_at::date
+ON CONFLICT (place_id, day) DO UPDATE SET like_count = excluded.like_count;
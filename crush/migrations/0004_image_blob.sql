@@ -0,0 +1,16 @@
+-- 내용의 sha256으로 저장되는 이미지 파일. 같은 내용을 가리키는 image_store 행의 수를 ref_count로 관리
+CREATE TABLE IF NOT EXISTS resources.image_blob
+(
+  digest     varchar(64) NOT NULL PRIMARY KEY,
+  mime_type  varchar(32) NOT NULL,
+  size       bigint      NOT NULL,
+  ref_count  integer     NOT NULL DEFAULT 0,
+  created_at timestamp   NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 기존 이미지는 digest 없이 images/<uid>에 남아 있으므로 기존 URL은 그대로 동작함
+ALTER TABLE resources.image_store
+  ADD COLUMN IF NOT EXISTS digest varchar(64) REFERENCES resources.image_blob (digest);
+
+CREATE INDEX IF NOT EXISTS image_store_digest_idx
+  ON resources.image_store (digest);
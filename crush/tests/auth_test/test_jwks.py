@@ -0,0 +1,78 @@
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from fastapi.testclient import TestClient
+from uuid import uuid4
+
+from app.core.user import core_jwt
+from app.core.user.core_jwt import SigningKey, Role
+from app.main import app
+
+client = TestClient(app)
+
+
+def signing_key(kid: str) -> SigningKey:
+  private_key = Ed25519PrivateKey.generate()
+  jwk = jwt.algorithms.OKPAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+  jwk.update({"kid": kid, "alg": "EdDSA", "use": "sig"})
+
+  return SigningKey(kid=kid, private_key=private_key, public_key=private_key.public_key(), jwk=jwk)
+
+
+@pytest.fixture
+def eddsa_keys(monkeypatch) -> dict[str, SigningKey]:
+  keys = {
+    "2025-01": signing_key("2025-01"),
+    "2025-02": signing_key("2025-02")
+  }
+  monkeypatch.setattr(core_jwt, "_signing_keys", keys)
+  monkeypatch.setattr(core_jwt, "ACCESS_TOKEN_ALGORITHM", "EdDSA")
+  monkeypatch.setattr(core_jwt, "ACTIVE_KID", "2025-02")
+
+  return keys
+
+
+def test_jwks_publishes_all_keys(eddsa_keys):
+  response = client.get("/.well-known/jwks.json")
+
+  assert response.status_code == 200
+  assert response.headers["Cache-Control"] == "public, max-age=300"
+  assert {key["kid"] for key in response.json()["keys"]} == {"2025-01", "2025-02"}
+  assert all(key["kty"] == "OKP" and key["crv"] == "Ed25519" for key in response.json()["keys"])
+
+
+def test_access_token_verifies_with_jwks(eddsa_keys):
+  token = core_jwt.create_access_token(uuid4(), [Role.CORE_USER.value])
+
+  assert jwt.get_unverified_header(token)["kid"] == "2025-02"
+
+  jwk_set = jwt.PyJWKSet.from_dict(client.get("/.well-known/jwks.json").json())
+  claims = jwt.decode(
+    token,
+    key=jwk_set["2025-02"],
+    algorithms=["EdDSA"],
+    audience=["crush"],
+    issuer="with"
+  )
+  assert claims["scope"] == [Role.CORE_USER.value]
+
+
+def test_rotated_key_still_verifies(eddsa_keys, monkeypatch):
+  token = core_jwt.create_access_token(uuid4(), [Role.CORE_USER.value])
+  monkeypatch.setattr(core_jwt, "ACTIVE_KID", "2025-01")
+
+  assert core_jwt.decode_access_token(token)["scope"] == [Role.CORE_USER.value]
+  assert jwt.get_unverified_header(core_jwt.create_access_token(uuid4(), []))["kid"] == "2025-01"
+
+
+def test_unknown_kid_is_unauthorized(eddsa_keys, monkeypatch):
+  token = core_jwt.create_access_token(uuid4(), [Role.CORE_USER.value])
+  monkeypatch.setattr(core_jwt, "_signing_keys", {"2025-01": eddsa_keys["2025-01"]})
+
+  response = client.get(
+    "/api/v1/auth/authorize",
+    headers={
+      "Authorization": f"Bearer {token}"
+    }
+  )
+  assert response.status_code == 401
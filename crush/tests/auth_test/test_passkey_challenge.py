@@ -0,0 +1,64 @@
+import base64
+from fastapi.testclient import TestClient
+
+from app.core import worker_pool
+from app.core.auth.passkey import core_passkey_auth
+from app.core.auth.passkey.core_passkey_auth import PASSKEY_CHALLENGE_KEY, PASSKEY_CHALLENGE_TTL
+from app.core.database.database import redis_binary_db0
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_challenge_is_stored_with_expiry():
+  response = client.get("/api/v1/auth/passkey/challenge/option")
+  assert response.status_code == 200
+
+  session_id = response.cookies["PSK_AUTH_SEK"]
+  key = PASSKEY_CHALLENGE_KEY.format(id=session_id)
+
+  challenge = redis_binary_db0.get(key)
+  assert base64.urlsafe_b64encode(challenge).rstrip(b"=").decode() == response.json()["option"]["challenge"]
+  assert 0 < redis_binary_db0.ttl(key) <= PASSKEY_CHALLENGE_TTL
+
+
+def test_challenge_is_consumed_once():
+  response = client.get("/api/v1/auth/passkey/challenge/option")
+  session_id = response.cookies["PSK_AUTH_SEK"]
+
+  assert len(core_passkey_auth.consume_challenge(session_id)) == 32
+  assert core_passkey_auth.consume_challenge(session_id) is None
+
+
+def test_challenge_survives_saturated_worker_pool(
+  access_token_factory,
+  monkeypatch
+):
+  _, u_at = access_token_factory("test")
+  response = client.get(
+    "/api/v1/auth/passkey/register/option",
+    headers={
+      "Authorization": f"Bearer {u_at}"
+    }
+  )
+  session_id = response.cookies["PSK_REG_SEK"]
+  key = PASSKEY_CHALLENGE_KEY.format(id=session_id)
+
+  monkeypatch.setattr(worker_pool, "WORKER_POOL_MAX_PENDING", 0)
+  client.cookies.set("PSK_REG_SEK", session_id)
+  response = client.post(
+    "/api/v1/auth/passkey/register",
+    headers={
+      "Authorization": f"Bearer {u_at}"
+    },
+    json={
+      "attestation": {}
+    }
+  )
+  client.cookies.clear()
+
+  # 거절된 요청은 challenge를 소비하지 않으므로 Retry-After 이후 다시 시도할 수 있음
+  assert response.status_code == 503
+  assert response.json()["code"] == 503
+  assert response.headers["Retry-After"] == "1"
+  assert redis_binary_db0.exists(key) == 1
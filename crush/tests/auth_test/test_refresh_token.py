@@ -0,0 +1,69 @@
+import jwt
+from concurrent.futures import ThreadPoolExecutor
+from fastapi.testclient import TestClient
+
+from app.core.user import core_jwt
+from app.core.user.core_login import login
+from app.main import app
+from app.models.users.IdentityModel import IdentityModel
+from app.schemas.user.Identity import Identity
+
+client = TestClient(app)
+
+
+def refresh(refresh_token: str):
+  return client.post(
+    "/api/v1/auth/refresh",
+    headers={
+      "X-Refresh-Token": refresh_token
+    }
+  )
+
+
+def test_refresh_token_rotation(
+  identity: IdentityModel
+):
+  _, rt = login(Identity(identity))
+  assert "rsq" in jwt.decode(rt, options={"verify_signature": False})
+
+  response = refresh(rt)
+  assert response.status_code == 200
+
+  # 재사용된 토큰은 거부되고, 새로 발급된 토큰은 사용할 수 있음
+  assert refresh(rt).status_code == 401
+  assert refresh(response.cookies["WAUTHREF"]).status_code == 200
+
+
+def test_refresh_token_without_sequence(
+  identity: IdentityModel
+):
+  rt = core_jwt.create_refresh_token(identity.uid)
+
+  assert refresh(rt).status_code == 200
+  assert refresh(rt).status_code == 401
+
+
+def test_revoked_refresh_token_cannot_be_used(
+  identity: IdentityModel
+):
+  _, rt = login(Identity(identity))
+
+  response = client.post(
+    "/api/v1/auth/logout",
+    headers={
+      "X-Refresh-Token": rt
+    }
+  )
+  assert response.status_code == 200
+
+  assert refresh(rt).status_code == 401
+
+
+def test_concurrent_refresh_passes_once(
+  identity: IdentityModel
+):
+  for rt in (login(Identity(identity))[1], core_jwt.create_refresh_token(identity.uid)):
+    with ThreadPoolExecutor(max_workers=4) as executor:
+      statuses = [response.status_code for response in executor.map(refresh, [rt] * 4)]
+
+    assert sorted(statuses) == [200, 401, 401, 401]
@@ -1,12 +1,17 @@
 import numpy as np
 import pytest
+import redis.asyncio
 from datetime import datetime
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
 from typing import Callable, Tuple
 from typing_extensions import Generator
 
 from app.core.config_store import config
+from app.core.database.database import AsyncSessionLocal, ASYNC_SQLALCHEMY_DATABASE_URL, async_redis_db0, \
+  async_redis_refresh_token_blacklist_db1, async_redis_binary_db0
 from app.core.user import core_jwt
 from app.core.user.core_jwt import Role
 from app.models.interacrions.LikeModel import LikesModel
@@ -27,6 +32,20 @@ SQLALCHEMY_DATABASE_URL = "postgresql://{user}:{password}@{host}:{port}/{dbname}
 db_engine = create_engine(SQLALCHEMY_DATABASE_URL)
 session = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
 
+# TestClient은 요청마다 새 event loop를 쓰므로 asyncpg 커넥션을 pool에 남기지 않음
+AsyncSessionLocal.configure(bind=create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, poolclass=NullPool))
+
+
+# redis.asyncio 커넥션도 같은 이유로 반납할 때 끊음
+class DisposableConnectionPool(redis.asyncio.BlockingConnectionPool):
+  async def release(self, connection):
+    await connection.disconnect()
+    await super().release(connection)
+
+
+for async_redis in (async_redis_db0, async_redis_refresh_token_blacklist_db1, async_redis_binary_db0):
+  async_redis.connection_pool = DisposableConnectionPool(**async_redis.connection_pool.connection_kwargs)
+
 
 @pytest.fixture
 def db() -> Generator[Session]:
@@ -0,0 +1,47 @@
+import random
+
+from app.core.hangul.umso import 풀어쓰기, 풀어쓰기_batch, CHOSUNG_LIST, JUNGSUNG_LIST, JONGSUNG_LIST
+
+
+def 풀어쓰기_reference(text: str):
+  sp = ""
+  begin = ord("가")
+  for c in text:
+    if "가" <= c <= "힣":
+      cc = ord(c)
+      delta = (cc - begin)
+      ch1 = delta // 588
+      ch2 = (delta - (588 * ch1)) // 28
+      ch3 = delta - (588 * ch1) - 28 * ch2
+
+      sp += (CHOSUNG_LIST[ch1] + JUNGSUNG_LIST[ch2] + JONGSUNG_LIST[ch3])
+    else:
+      sp += c
+
+  return sp
+
+
+def random_text(length: int, hangul_ratio: float) -> str:
+  chars = []
+  for _ in range(length):
+    if random.random() < hangul_ratio:
+      chars.append(chr(random.randint(ord("가"), ord("힣"))))
+    else:
+      chars.append(random.choice("abcXYZ0123 -/()ㄱㅏ"))
+  return "".join(chars)
+
+
+def test_umso_all_syllables():
+  syllables = "".join(chr(c) for c in range(ord("가"), ord("힣") + 1))
+
+  assert 풀어쓰기(syllables) == 풀어쓰기_reference(syllables)
+
+
+def test_umso_mixed_script():
+  assert 풀어쓰기("4233마음센터 연남점") == "4233ㅁㅏㅇㅡㅁㅅㅔㄴㅌㅓ ㅇㅕㄴㄴㅏㅁㅈㅓㅁ"
+  assert 풀어쓰기("한글ing") == "ㅎㅏㄴㄱㅡㄹing"
+  assert 풀어쓰기("") == ""
+
+  texts = [random_text(64, 0.5) for _ in range(100)]
+  assert 풀어쓰기_batch(texts) == [풀어쓰기_reference(text) for text in texts]
+
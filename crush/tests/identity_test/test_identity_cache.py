@@ -0,0 +1,50 @@
+from fastapi.testclient import TestClient
+
+from app.core.user import core_user
+from app.main import app
+
+client = TestClient(app)
+
+
+def count_followings(access_token: str):
+  response = client.get(
+    "/api/v1/user/following/count",
+    headers={
+      "Authorization": f"Bearer {access_token}"
+    }
+  )
+  assert response.status_code == 200
+
+
+def test_identity_cached_across_requests(
+  access_token_factory
+):
+  _, uat = access_token_factory("TestUser")
+
+  count_followings(uat)
+  hits = core_user.identity_cache_metrics.snapshot()["hits"]
+  count_followings(uat)
+
+  assert core_user.identity_cache_metrics.snapshot()["hits"] == hits + 1
+
+
+def test_identity_cache_invalidated_by_patch(
+  access_token_factory
+):
+  u, uat = access_token_factory("TestUser")
+
+  count_followings(uat)
+  assert u.uid in core_user._identity_cache
+
+  response = client.patch(
+    "/api/v1/user",
+    headers={
+      "Authorization": f"Bearer {uat}"
+    },
+    json={
+      "name": "UpdatedTestUser"
+    }
+  )
+  assert response.status_code == 200
+
+  assert u.uid not in core_user._identity_cache
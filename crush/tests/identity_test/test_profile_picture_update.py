@@ -0,0 +1,88 @@
+import io
+import pytest
+from PIL import Image
+from starlette.testclient import TestClient
+
+from app.core.resources import core_image
+from app.core.resources.image_storage import LocalImageStorage
+from app.main import app
+
+client = TestClient(app)
+
+
+def png(width: int, height: int, mode: str = "RGB") -> bytes:
+  buffer = io.BytesIO()
+  Image.new(mode, (width, height)).save(buffer, format="PNG")
+  return buffer.getvalue()
+
+
+@pytest.fixture
+def image_store(tmp_path, monkeypatch):
+  monkeypatch.setattr(core_image, "image_storage", LocalImageStorage(str(tmp_path)))
+  return tmp_path
+
+
+def update(access_token: str, content: bytes):
+  return client.patch(
+    "/api/v1/user/picture",
+    headers={
+      "Authorization": f"Bearer {access_token}"
+    },
+    files={
+      "file": ("image", content, "image/png")
+    }
+  )
+
+
+def test_update_profile_picture(
+  access_token_factory,
+  image_store
+):
+  _, u_at = access_token_factory("test")
+
+  # 투명도가 있는 이미지도 JPEG로 저장됨
+  response = update(u_at, png(200, 100, "RGBA"))
+
+  assert response.status_code == 200
+
+
+def test_update_profile_picture_rejects_non_image(
+  access_token_factory,
+  image_store
+):
+  _, u_at = access_token_factory("test")
+
+  response = update(u_at, b"<html></html>")
+
+  assert response.status_code == 415
+  assert response.json()["code"] == 415
+  assert response.json()["status"] == "Unsupported Media Type"
+
+
+def test_update_profile_picture_rejects_large_image(
+  access_token_factory,
+  image_store,
+  monkeypatch
+):
+  _, u_at = access_token_factory("test")
+  content = png(64, 64)
+  monkeypatch.setattr(core_image, "IMAGE_MAX_SIZE", len(content) - 1)
+
+  response = update(u_at, content)
+
+  assert response.status_code == 413
+  assert response.json()["code"] == 413
+
+
+def test_update_profile_picture_rejects_too_many_pixels(
+  access_token_factory,
+  image_store,
+  monkeypatch
+):
+  _, u_at = access_token_factory("test")
+  monkeypatch.setattr(core_image, "IMAGE_MAX_PIXELS", 64 * 64)
+
+  response = update(u_at, png(65, 64))
+
+  assert response.status_code == 413
+  assert response.json()["code"] == 413
@@ -0,0 +1,68 @@
+from starlette.testclient import TestClient
+
+from app.core.user.core_jwt import Role
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_cache_metrics(
+  access_token_factory
+):
+  _, u_at = access_token_factory("test", Role.METRICS_READ)
+
+  response = client.get(
+    "/internal/metrics/cache",
+    headers={
+      "Authorization": f"Bearer {u_at}"
+    }
+  )
+
+  assert response.status_code == 200
+  assert response.json()["code"] == 200
+  assert response.json()["status"] == "OK"
+  for namespace in ("place", "place_theme", "region", "stored_image_meta"):
+    status = response.json()["caches"][namespace]
+    assert status["ttl"] > 0
+    assert status["hits"] >= 0
+    assert status["misses"] >= 0
+
+
+def test_cache_metrics_forbidden(
+  access_token_factory
+):
+  _, u_at = access_token_factory("test")
+
+  response = client.get(
+    "/internal/metrics/cache",
+    headers={
+      "Authorization": f"Bearer {u_at}"
+    }
+  )
+
+  assert response.status_code == 403
+  assert response.json()["code"] == 403
+
+
+def test_jwt_cache_metrics(
+  access_token_factory
+):
+  _, u_at = access_token_factory("test", Role.METRICS_READ)
+
+  def jwt_metrics():
+    response = client.get(
+      "/internal/metrics/cache",
+      headers={
+        "Authorization": f"Bearer {u_at}"
+      }
+    )
+    assert response.status_code == 200
+    return response.json()["jwt"]
+
+  before = jwt_metrics()
+  after = jwt_metrics()
+
+  # 같은 토큰의 두 번째 요청부터는 캐시에서 검증됨
+  assert after["hits"] >= before["hits"] + 1
+  assert after["size"] >= 1
+  assert after["maxsize"] > 0
@@ -0,0 +1,45 @@
+from starlette.testclient import TestClient
+
+from app.core.user.core_jwt import Role
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_db_pool_metrics(
+  access_token_factory
+):
+  _, u_at = access_token_factory("test", Role.METRICS_READ)
+
+  response = client.get(
+    "/internal/metrics/db-pool",
+    headers={
+      "Authorization": f"Bearer {u_at}"
+    }
+  )
+
+  assert response.status_code == 200
+  assert response.json()["code"] == 200
+  assert response.json()["status"] == "OK"
+  for pool in ("sync", "async"):
+    status = response.json()["pools"][pool]
+    assert status["checked_out"] >= 0
+    assert status["overflow"] >= 0
+    assert status["checkout_timeouts"] >= 0
+    assert status["checkout_wait_ms"]["buckets"]["+Inf"] == status["checkout_wait_ms"]["count"]
+
+
+def test_db_pool_metrics_forbidden(
+  access_token_factory
+):
+  _, u_at = access_token_factory("test")
+
+  response = client.get(
+    "/internal/metrics/db-pool",
+    headers={
+      "Authorization": f"Bearer {u_at}"
+    }
+  )
+
+  assert response.status_code == 403
+  assert response.json()["code"] == 403
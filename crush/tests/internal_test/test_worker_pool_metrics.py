@@ -0,0 +1,59 @@
+import pytest
+from fastapi import HTTPException
+from starlette.testclient import TestClient
+
+from app.core import worker_pool
+from app.core.user.core_jwt import Role
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_worker_pool_metrics(
+  access_token_factory
+):
+  _, u_at = access_token_factory("test", Role.METRICS_READ)
+
+  assert worker_pool.run(sum, [1, 2, 3]) == 6
+
+  response = client.get(
+    "/internal/metrics/worker-pool",
+    headers={
+      "Authorization": f"Bearer {u_at}"
+    }
+  )
+
+  assert response.status_code == 200
+  assert response.json()["code"] == 200
+  status = response.json()["pool"]
+  assert status["pending"] == 0
+  assert status["completed"] >= 1
+  assert status["avg_run_ms"] >= 0
+
+
+def test_worker_pool_rejects_when_saturated(monkeypatch):
+  monkeypatch.setattr(worker_pool, "WORKER_POOL_MAX_PENDING", 0)
+  rejected = worker_pool.worker_pool_metrics.snapshot()["rejected"]
+
+  with pytest.raises(HTTPException) as e:
+    worker_pool.run(sum, [1, 2, 3])
+
+  assert e.value.status_code == 503
+  assert worker_pool.worker_pool_metrics.snapshot()["rejected"] == rejected + 1
+
+
+def test_unused_reservation_is_released(monkeypatch):
+  monkeypatch.setattr(worker_pool, "WORKER_POOL_MAX_PENDING", 1)
+  pending = worker_pool.worker_pool_metrics.snapshot()["pending"]
+
+  with worker_pool.reserve():
+    assert worker_pool.worker_pool_metrics.snapshot()["pending"] == pending + 1
+    with pytest.raises(HTTPException):
+      worker_pool.run(sum, [1, 2, 3])
+
+  assert worker_pool.worker_pool_metrics.snapshot()["pending"] == pending
+
+  with worker_pool.reserve() as worker:
+    assert worker.run(sum, [1, 2, 3]) == 6
+
+  assert worker_pool.worker_pool_metrics.snapshot()["pending"] == pending
@@ -177,6 +177,30 @@ def test_place_read_by_address(
   assert_place(response, places[0])
 
 
+def test_place_read_by_name_fuzzy(
+  access_token_factory,
+  places
+):
+  _, i_at = access_token_factory("test", Role.CORE_USER)
+
+  response = client.get(
+    "/api/v1/location/place",
+    headers={
+      "Authorization": f"Bearer {i_at}"
+    },
+    params={
+      "name": "이름-지역1장소2",
+      "fuzzy": True
+    }
+  )
+
+  assert response.status_code == 200
+  assert response.json()["code"] == 200
+  assert response.json()["status"] == "OK"
+  assert len(response.json()["content"]) >= 1
+  assert response.json()["content"][0] == Place(places[5]).model_dump()
+
+
 def test_place_read_by_region(
   access_token_factory,
   places
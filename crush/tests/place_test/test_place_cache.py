@@ -0,0 +1,91 @@
+import json
+from fastapi.testclient import TestClient
+
+from app.core.location.core_place import place_cache
+from app.core.user.core_jwt import Role
+from app.main import app
+
+client = TestClient(app)
+
+
+def read_place(access_token: str, place_id):
+  response = client.get(
+    "/api/v1/location/place",
+    headers={
+      "Authorization": f"Bearer {access_token}"
+    },
+    params={
+      "uid": str(place_id)
+    }
+  )
+
+  assert response.status_code == 200
+  assert len(response.json()["content"]) == 1
+  return response.json()["content"][0]
+
+
+def test_place_read_by_uid_cached(
+  access_token_factory,
+  places
+):
+  _, u_at = access_token_factory("test")
+
+  first = read_place(u_at, places[0].uid)
+  hits = place_cache.metrics.snapshot()["hits"]
+  second = read_place(u_at, places[0].uid)
+
+  assert second == first
+  assert place_cache.metrics.snapshot()["hits"] == hits + 1
+
+
+def test_place_cache_invalidated_by_patch(
+  access_token_factory,
+  places
+):
+  _, u_at = access_token_factory("test")
+  _, e_at = access_token_factory("editor", Role.PLACE_EDIT)
+
+  assert read_place(u_at, places[0].uid)["name"] == places[0].name
+
+  response = client.patch(
+    "/api/v1/location/place/" + str(places[0].uid),
+    headers={
+      "Authorization": f"Bearer {e_at}"
+    },
+    content=json.dumps({
+      "name": "바뀐 이름"
+    })
+  )
+  assert response.status_code == 200
+
+  assert read_place(u_at, places[0].uid)["name"] == "바뀐 이름"
+
+
+def test_place_cache_invalidated_by_delete(
+  access_token_factory,
+  places
+):
+  _, u_at = access_token_factory("test")
+  _, d_at = access_token_factory("editor", Role.PLACE_DELETE)
+
+  read_place(u_at, places[0].uid)
+
+  response = client.delete(
+    "/api/v1/location/place/" + str(places[0].uid),
+    headers={
+      "Authorization": f"Bearer {d_at}"
+    }
+  )
+  assert response.status_code == 200
+
+  response = client.get(
+    "/api/v1/location/place",
+    headers={
+      "Authorization": f"Bearer {u_at}"
+    },
+    params={
+      "uid": str(places[0].uid)
+    }
+  )
+  assert response.status_code == 200
+  assert response.json()["content"] == []
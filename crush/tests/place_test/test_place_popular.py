@@ -0,0 +1,132 @@
+import json
+from starlette.testclient import TestClient
+
+from app.main import app
+
+client = TestClient(app)
+
+
+def like(access_token: str, place_id):
+  resp = client.post(
+    "/api/v1/interaction/like",
+    headers={
+      "Authorization": f"Bearer {access_token}"
+    },
+    content=json.dumps({
+      "placeId": str(place_id)
+    })
+  )
+  assert resp.status_code == 200
+
+
+def create_likes(access_token_factory, places):
+  users = [access_token_factory(f"u{i}") for i in range(3)]
+
+  like(users[0][1], places[0].uid)
+  like(users[0][1], places[1].uid)
+  like(users[1][1], places[0].uid)
+  like(users[2][1], places[0].uid)
+  like(users[2][1], places[3].uid)
+
+  return users
+
+
+def test_popular_place(
+  access_token_factory,
+  places
+):
+  users = create_likes(access_token_factory, places)
+
+  resp = client.get(
+    "/api/v1/location/place/popular",
+    headers={
+      "Authorization": f"Bearer {users[0][1]}"
+    }
+  )
+
+  assert resp.status_code == 200
+  assert resp.json()["code"] == 200
+  assert resp.json()["status"] == "OK"
+  assert [(p["place"]["uid"], p["likes"]) for p in resp.json()["content"]] == [
+    (str(places[0].uid), 3),
+    *sorted([(str(places[1].uid), 1), (str(places[3].uid), 1)])
+  ]
+
+
+def test_popular_place_in_region_recently(
+  access_token_factory,
+  places
+):
+  users = create_likes(access_token_factory, places)
+
+  resp = client.get(
+    "/api/v1/location/place/popular",
+    headers={
+      "Authorization": f"Bearer {users[0][1]}"
+    },
+    params={
+      "regionUid": str(places[3].region_uid),
+      "days": 1
+    }
+  )
+
+  assert resp.status_code == 200
+  assert [(p["place"]["uid"], p["likes"]) for p in resp.json()["content"]] == [
+    (str(places[3].uid), 1)
+  ]
+
+
+def test_popular_place_after_dislike(
+  access_token_factory,
+  places
+):
+  users = create_likes(access_token_factory, places)
+
+  resp = client.delete(
+    f"/api/v1/interaction/like/{places[0].uid}",
+    headers={
+      "Authorization": f"Bearer {users[2][1]}"
+    }
+  )
+  assert resp.status_code == 200
+
+  resp = client.get(
+    "/api/v1/location/place/popular",
+    headers={
+      "Authorization": f"Bearer {users[0][1]}"
+    },
+    params={
+      "limit": 1
+    }
+  )
+
+  assert resp.status_code == 200
+  assert [(p["place"]["uid"], p["likes"]) for p in resp.json()["content"]] == [
+    (str(places[0].uid), 2)
+  ]
+
+
+def test_popular_region(
+  access_token_factory,
+  places
+):
+  users = create_likes(access_token_factory, places)
+
+  resp = client.get(
+    "/api/v1/location/region/popular",
+    headers={
+      "Authorization": f"Bearer {users[0][1]}"
+    }
+  )
+
+  assert resp.status_code == 200
+  assert resp.json()["content"] == [
+    {
+      "region": str(places[0].region_uid),
+      "likes": 4
+    },
+    {
+      "region": str(places[3].region_uid),
+      "likes": 1
+    }
+  ]
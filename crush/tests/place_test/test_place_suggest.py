@@ -0,0 +1,59 @@
+from starlette.testclient import TestClient
+
+from app.core.user.core_jwt import Role
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_place_suggest(
+  access_token_factory,
+  places
+):
+  _, i_at = access_token_factory("test", Role.CORE_USER)
+
+  response = client.get(
+    "/api/v1/location/place/suggest",
+    headers={
+      "Authorization": f"Bearer {i_at}"
+    },
+    params={
+      "q": "지역1장소"
+    }
+  )
+
+  assert response.status_code == 200
+  assert response.json()["code"] == 200
+  assert response.json()["status"] == "OK"
+
+  suggested = [place["uid"] for place in response.json()["content"]]
+  for place in places[3:6]:
+    assert str(place.uid) in suggested
+
+
+def test_place_suggest_after_delete(
+  access_token_factory,
+  places
+):
+  _, i_at = access_token_factory("test", Role.CORE_USER, Role.PLACE_DELETE)
+
+  response = client.delete(
+    f"/api/v1/location/place/{places[0].uid}",
+    headers={
+      "Authorization": f"Bearer {i_at}"
+    }
+  )
+  assert response.status_code == 200
+
+  response = client.get(
+    "/api/v1/location/place/suggest",
+    headers={
+      "Authorization": f"Bearer {i_at}"
+    },
+    params={
+      "q": "이름-지역0장소0"
+    }
+  )
+
+  assert response.status_code == 200
+  assert str(places[0].uid) not in [place["uid"] for place in response.json()["content"]]
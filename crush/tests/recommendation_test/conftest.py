@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from sqlalchemy.orm import Session
+from typing import Callable
+from typing_extensions import Generator
+
+from app.models.locations.PlaceModel import PlaceModel
+from app.models.preferences.UserPrefer import UserPrefer
+from app.models.users.IdentityModel import IdentityModel
+
+
+def one_hot(*weights: tuple[int, float]) -> np.ndarray:
+  vector = np.zeros(100, dtype=np.float32)
+  for idx, weight in weights:
+    vector[idx] = weight
+  return vector
+
+
+@pytest.fixture
+def prefer_factory(
+  db: Session
+) -> Generator[Callable[[IdentityModel, np.ndarray], UserPrefer]]:
+  prefers: list[UserPrefer] = []
+
+  def create_prefer(identity: IdentityModel, prefer: np.ndarray) -> UserPrefer:
+    user_prefer = UserPrefer(
+      user_id=identity.uid,
+      prefer=prefer
+    )
+    db.add(user_prefer)
+    db.commit()
+    prefers.append(user_prefer)
+    return user_prefer
+
+  yield create_prefer
+
+  for user_prefer in prefers:
+    db.delete(user_prefer)
+  db.commit()
+
+
+@pytest.fixture
+def themed_places(
+  places: list[PlaceModel],
+  db: Session
+) -> list[PlaceModel]:
+  # i번째 장소는 theme 0에 (i + 1) / 10, theme 1에 (9 - i) / 10 가중치
+  for i, place in enumerate(places):
+    place.theme.theme = one_hot((0, (i + 1) / 10), (1, (9 - i) / 10))
+  db.commit()
+
+  return places
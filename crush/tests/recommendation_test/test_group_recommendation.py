@@ -0,0 +1,163 @@
+import pytest
+from starlette.testclient import TestClient
+from typing import Tuple
+
+from app.main import app
+from app.models.users.IdentityModel import IdentityModel
+from app.models.users.RelationshipModel import RelationshipState
+from tests.recommendation_test.conftest import one_hot
+
+client = TestClient(app)
+
+
+def create_group(
+  access_token_factory,
+  relation_factory,
+  prefer_factory
+) -> list[Tuple[IdentityModel, str]]:
+  users: list[Tuple[IdentityModel, str]] = [
+    access_token_factory(f"u{i}")
+    for i in range(3)
+  ]
+
+  for u in users[1:]:
+    relation_factory(users[0][0], u[0], RelationshipState.FRIEND)
+
+  # u2는 선호도 벡터가 없음
+  prefer_factory(users[0][0], one_hot((0, 1.0)))
+  prefer_factory(users[1][0], one_hot((1, 1.0)))
+
+  return users
+
+
+def test_group_recommendation_mean(
+  access_token_factory,
+  relation_factory,
+  prefer_factory,
+  like_factory,
+  themed_places
+):
+  users = create_group(access_token_factory, relation_factory, prefer_factory)
+  like_factory(users[2][0], themed_places[2])
+
+  resp = client.get(
+    "/api/v1/recommendation/place/group",
+    headers={
+      "Authorization": f"Bearer {users[0][1]}"
+    },
+    params={
+      "users": ".".join([str(user[0].uid) for user in users])
+    }
+  )
+
+  assert resp.status_code == 200
+  assert resp.json()["code"] == 200
+  assert resp.json()["status"] == "OK"
+  assert len(resp.json()["recommendation"]) == 9
+  assert resp.json()["recommendation"][0]["place"] == str(themed_places[2].uid)
+  assert resp.json()["recommendation"][0]["likes"] == 1
+  assert resp.json()["recommendation"][0]["preference"] == pytest.approx(0.5)
+
+
+def test_group_recommendation_least_misery(
+  access_token_factory,
+  relation_factory,
+  prefer_factory,
+  themed_places
+):
+  users = create_group(access_token_factory, relation_factory, prefer_factory)
+
+  resp = client.get(
+    "/api/v1/recommendation/place/group",
+    headers={
+      "Authorization": f"Bearer {users[0][1]}"
+    },
+    params={
+      "users": ".".join([str(user[0].uid) for user in users]),
+      "strategy": "least_misery",
+      "limit": 3
+    }
+  )
+
+  assert resp.status_code == 200
+  assert resp.json()["recommendation"][0]["place"] == str(themed_places[4].uid)
+  assert {r["place"] for r in resp.json()["recommendation"][1:]} == {
+    str(themed_places[3].uid), str(themed_places[5].uid)
+  }
+
+
+def test_group_recommendation_weighted(
+  access_token_factory,
+  relation_factory,
+  prefer_factory,
+  themed_places
+):
+  users = create_group(access_token_factory, relation_factory, prefer_factory)
+
+  resp = client.get(
+    "/api/v1/recommendation/place/group",
+    headers={
+      "Authorization": f"Bearer {users[0][1]}"
+    },
+    params={
+      "users": ".".join([str(user[0].uid) for user in users]),
+      "regions": str(themed_places[0].region_uid),
+      "strategy": "weighted",
+      "weights": "3,1,1"
+    }
+  )
+
+  assert resp.status_code == 200
+  assert [r["place"] for r in resp.json()["recommendation"]] == [
+    str(themed_places[i].uid) for i in (2, 1, 0)
+  ]
+
+
+def test_group_recommendation_weights_mismatch(
+  access_token_factory,
+  relation_factory,
+  prefer_factory,
+  themed_places
+):
+  users = create_group(access_token_factory, relation_factory, prefer_factory)
+
+  resp = client.get(
+    "/api/v1/recommendation/place/group",
+    headers={
+      "Authorization": f"Bearer {users[0][1]}"
+    },
+    params={
+      "users": ".".join([str(user[0].uid) for user in users]),
+      "strategy": "weighted",
+      "weights": "3,1"
+    }
+  )
+
+  assert resp.status_code == 400
+  assert resp.json()["code"] == 400
+
+
+@pytest.mark.parametrize("weights", ["nan,1,1", "inf,1,1", "-1,1,1"])
+def test_group_recommendation_invalid_weights(
+  access_token_factory,
+  relation_factory,
+  prefer_factory,
+  themed_places,
+  weights
+):
+  users = create_group(access_token_factory, relation_factory, prefer_factory)
+
+  resp = client.get(
+    "/api/v1/recommendation/place/group",
+    headers={
+      "Authorization": f"Bearer {users[0][1]}"
+    },
+    params={
+      "users": ".".join([str(user[0].uid) for user in users]),
+      "strategy": "weighted",
+      "weights": weights
+    }
+  )
+
+  assert resp.status_code == 400
+  assert resp.json()["code"] == 400
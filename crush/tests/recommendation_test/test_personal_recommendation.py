@@ -0,0 +1,73 @@
+from starlette.testclient import TestClient
+
+from app.main import app
+from tests.recommendation_test.conftest import one_hot
+
+client = TestClient(app)
+
+
+def test_personal_recommendation(
+  access_token_factory,
+  prefer_factory,
+  themed_places
+):
+  user, user_at = access_token_factory("u")
+  prefer_factory(user, one_hot((0, 1.0)))
+
+  resp = client.get(
+    "/api/v1/recommendation/place/personal",
+    headers={
+      "Authorization": f"Bearer {user_at}"
+    },
+    params={
+      "limit": 3
+    }
+  )
+
+  assert resp.status_code == 200
+  assert resp.json()["code"] == 200
+  assert resp.json()["status"] == "OK"
+  assert [r["place"] for r in resp.json()["recommendation"]] == [
+    str(themed_places[i].uid) for i in (8, 7, 6)
+  ]
+
+
+def test_personal_recommendation_from_region(
+  access_token_factory,
+  prefer_factory,
+  themed_places
+):
+  user, user_at = access_token_factory("u")
+  prefer_factory(user, one_hot((1, 1.0)))
+
+  resp = client.get(
+    "/api/v1/recommendation/place/personal",
+    headers={
+      "Authorization": f"Bearer {user_at}"
+    },
+    params={
+      "regions": str(themed_places[3].region_uid)
+    }
+  )
+
+  assert resp.status_code == 200
+  assert [r["place"] for r in resp.json()["recommendation"]] == [
+    str(themed_places[i].uid) for i in (3, 4, 5)
+  ]
+
+
+def test_personal_recommendation_without_preference(
+  access_token_factory,
+  themed_places
+):
+  _, user_at = access_token_factory("u")
+
+  resp = client.get(
+    "/api/v1/recommendation/place/personal",
+    headers={
+      "Authorization": f"Bearer {user_at}"
+    }
+  )
+
+  assert resp.status_code == 404
+  assert resp.json()["code"] == 404
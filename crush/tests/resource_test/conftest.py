@@ -0,0 +1,33 @@
+import io
+import pytest
+from PIL import Image
+from starlette.testclient import TestClient
+
+from app.core.resources import core_image
+from app.core.resources.image_storage import LocalImageStorage
+from app.core.resources.variant_cache import VariantCache
+from app.core.user.core_jwt import Role
+from app.main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def image_id(access_token_factory, tmp_path, monkeypatch) -> str:
+  monkeypatch.setattr(core_image, "image_storage", LocalImageStorage(str(tmp_path)))
+  monkeypatch.setattr(core_image, "variant_cache", VariantCache(str(tmp_path / "variants"), 1024 * 1024))
+  _, u_at = access_token_factory("test", Role.IMAGE_UPLOAD)
+
+  buffer = io.BytesIO()
+  Image.new("RGB", (400, 200), "red").save(buffer, format="PNG")
+
+  response = client.post(
+    "/api/v1/resources/image/store",
+    headers={
+      "Authorization": f"Bearer {u_at}"
+    },
+    files={
+      "file": ("image", buffer.getvalue(), "image/png")
+    }
+  )
+  return response.json()["image_id"]
@@ -0,0 +1,100 @@
+import base64
+import pytest
+from starlette.testclient import TestClient
+from uuid import uuid4
+
+from app.core.auth.passkey import paykey_aaguid
+from app.main import app
+
+client = TestClient(app)
+
+LIGHT_SVG = b'<svg xmlns="http://www.w3.org/2000/svg"><rect fill="#fff"/></svg>'
+DARK_SVG = b'<svg xmlns="http://www.w3.org/2000/svg"><rect fill="#000"/></svg>'
+
+
+def data_uri(svg: bytes) -> str:
+  return "data:image/svg+xml;base64," + base64.b64encode(svg).decode("ascii")
+
+
+@pytest.fixture
+def authenticators(monkeypatch):
+  both, light_only = uuid4(), uuid4()
+  monkeypatch.setattr(paykey_aaguid, "_authenticators", paykey_aaguid.build_table({
+    str(both): {
+      "name": "Both",
+      "icon_light": data_uri(LIGHT_SVG),
+      "icon_dark": data_uri(DARK_SVG)
+    },
+    str(light_only): {
+      "name": "Light only",
+      "icon_light": data_uri(LIGHT_SVG),
+      "icon_dark": None
+    }
+  }))
+  return both, light_only
+
+
+def test_authenticator_image(
+  authenticators
+):
+  both, _ = authenticators
+
+  response = client.get(f"/api/v1/resources/image/authenticator/{both}")
+
+  assert response.status_code == 200
+  assert response.content == LIGHT_SVG
+  assert response.headers["Content-Type"].startswith("image/svg+xml")
+  assert "immutable" in response.headers["Cache-Control"]
+  assert response.headers["ETag"].startswith('"')
+
+
+def test_authenticator_image_dark(
+  authenticators
+):
+  both, light_only = authenticators
+
+  response = client.get(f"/api/v1/resources/image/authenticator/{both}", params={"variant": "dark"})
+  assert response.status_code == 200
+  assert response.content == DARK_SVG
+
+  response = client.get(f"/api/v1/resources/image/authenticator/{light_only}", params={"variant": "dark"})
+  assert response.status_code == 200
+  assert response.content == LIGHT_SVG
+
+
+def test_authenticator_image_not_modified(
+  authenticators
+):
+  both, _ = authenticators
+
+  etag = client.get(f"/api/v1/resources/image/authenticator/{both}").headers["ETag"]
+
+  response = client.get(
+    f"/api/v1/resources/image/authenticator/{both}",
+    headers={
+      "If-None-Match": f'"other", W/{etag}'
+    }
+  )
+
+  assert response.status_code == 304
+  assert response.content == b""
+  assert response.headers["ETag"] == etag
+
+  response = client.get(
+    f"/api/v1/resources/image/authenticator/{both}",
+    params={"variant": "dark"},
+    headers={
+      "If-None-Match": etag
+    }
+  )
+
+  assert response.status_code == 200
+
+
+def test_authenticator_image_not_found(
+  authenticators
+):
+  response = client.get(f"/api/v1/resources/image/authenticator/{uuid4()}")
+
+  assert response.status_code == 404
+  assert response.json()["code"] == 404
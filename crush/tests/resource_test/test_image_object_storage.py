@@ -0,0 +1,90 @@
+import io
+import pytest
+from PIL import Image
+from moto import mock_aws
+from starlette.testclient import TestClient
+
+from app.core.resources import core_image
+from app.core.resources.image_storage import S3ImageStorage
+from app.core.resources.variant_cache import VariantCache
+from app.core.user.core_jwt import Role
+from app.main import app
+
+client = TestClient(app)
+
+BUCKET = "images"
+
+
+@pytest.fixture
+def object_storage(tmp_path, monkeypatch):
+  with mock_aws():
+    storage = S3ImageStorage(
+      bucket=BUCKET,
+      prefix="store/",
+      region="us-east-1",
+      access_key="test",
+      secret_key="test",
+      spool_dir=str(tmp_path)
+    )
+    storage._client.create_bucket(Bucket=BUCKET)
+    monkeypatch.setattr(core_image, "image_storage", storage)
+    monkeypatch.setattr(core_image, "variant_cache", VariantCache(str(tmp_path / "variants"), 1024 * 1024))
+    yield storage
+
+
+def png() -> bytes:
+  buffer = io.BytesIO()
+  Image.new("RGB", (400, 200), "blue").save(buffer, format="PNG")
+  return buffer.getvalue()
+
+
+def upload(access_token_factory, content: bytes) -> str:
+  _, u_at = access_token_factory("test", Role.IMAGE_UPLOAD)
+
+  response = client.post(
+    "/api/v1/resources/image/store",
+    headers={
+      "Authorization": f"Bearer {u_at}"
+    },
+    files={
+      "file": ("image", content, "image/png")
+    }
+  )
+  assert response.status_code == 200
+  return response.json()["image_id"]
+
+
+def test_stored_image_redirects_to_object_storage(
+  access_token_factory,
+  object_storage,
+  tmp_path
+):
+  content = png()
+  image_id = upload(access_token_factory, content)
+
+  # 임시 파일은 저장소로 올린 뒤 남지 않음
+  assert [name for name in tmp_path.iterdir() if name.name.startswith(".upload-")] == []
+
+  stored = object_storage._client.get_object(Bucket=BUCKET, Key=f"store/{image_id}")
+  assert stored["Body"].read() == content
+  assert stored["ContentType"] == "image/png"
+
+  response = client.get(f"/api/v1/resources/image/store/{image_id}", follow_redirects=False)
+
+  assert response.status_code == 307
+  assert f"store/{image_id}?" in response.headers["Location"]
+  assert "X-Amz-Signature" in response.headers["Location"]
+  assert response.headers["Cache-Control"] == f"public, max-age={object_storage.url_max_age}"
+
+
+def test_variant_is_rendered_from_object_storage(
+  access_token_factory,
+  object_storage
+):
+  image_id = upload(access_token_factory, png())
+
+  response = client.get(f"/api/v1/resources/image/store/{image_id}?width=100&format=jpeg")
+
+  assert response.status_code == 200
+  assert response.headers["Content-Type"] == "image/jpeg"
+  assert Image.open(io.BytesIO(response.content)).size == (100, 50)
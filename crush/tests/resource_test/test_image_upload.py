@@ -0,0 +1,132 @@
+import io
+import os
+import pytest
+from PIL import Image
+from starlette.testclient import TestClient
+
+from app.core.hash import sha256_bytes
+from app.core.resources import core_image
+from app.core.resources.image_storage import LocalImageStorage
+from app.core.user.core_jwt import Role
+from app.main import app
+from app.models.resources.ImageBlobModel import ImageBlobModel
+
+client = TestClient(app)
+
+
+def png(size: int = 32) -> bytes:
+  buffer = io.BytesIO()
+  Image.new("RGB", (size, size), "red").save(buffer, format="PNG")
+  return buffer.getvalue()
+
+
+@pytest.fixture
+def image_store(tmp_path, monkeypatch):
+  monkeypatch.setattr(core_image, "image_storage", LocalImageStorage(str(tmp_path)))
+  return tmp_path
+
+
+def upload(access_token: str, content: bytes, content_type: str = "image/png"):
+  return client.post(
+    "/api/v1/resources/image/store",
+    headers={
+      "Authorization": f"Bearer {access_token}"
+    },
+    files={
+      "file": ("image", content, content_type)
+    }
+  )
+
+
+def test_upload_image(
+  access_token_factory,
+  image_store
+):
+  _, u_at = access_token_factory("test", Role.IMAGE_UPLOAD)
+  content = png()
+
+  # 클라이언트가 보낸 Content-Type 대신 실제 형식으로 저장됨
+  response = upload(u_at, content, "application/octet-stream")
+
+  assert response.status_code == 200
+  image_id = response.json()["image_id"]
+  assert (image_store / image_id).read_bytes() == content
+
+  response = client.get(f"/api/v1/resources/image/store/{image_id}")
+  assert response.status_code == 200
+  assert response.headers["Content-Type"] == "image/png"
+
+
+def test_upload_rejects_non_image(
+  access_token_factory,
+  image_store
+):
+  _, u_at = access_token_factory("test", Role.IMAGE_UPLOAD)
+
+  response = upload(u_at, b"<html></html>", "image/png")
+
+  assert response.status_code == 415
+  assert response.json()["code"] == 415
+  assert response.json()["status"] == "Unsupported Media Type"
+  assert os.listdir(image_store) == []
+
+
+def test_upload_rejects_large_image(
+  access_token_factory,
+  image_store,
+  monkeypatch
+):
+  _, u_at = access_token_factory("test", Role.IMAGE_UPLOAD)
+  content = png(256)
+  monkeypatch.setattr(core_image, "IMAGE_MAX_SIZE", len(content) - 1)
+
+  response = upload(u_at, content)
+
+  assert response.status_code == 413
+  assert response.json()["code"] == 413
+  assert response.json()["status"] == "Payload Too Large"
+  assert os.listdir(image_store) == []
+
+
+def test_content_addressed_upload_deduplicates(
+  access_token_factory,
+  image_store,
+  monkeypatch,
+  db
+):
+  monkeypatch.setattr(core_image, "IMAGE_CONTENT_ADDRESSED", True)
+  _, u_at = access_token_factory("test", Role.IMAGE_UPLOAD)
+  content = png(48)
+  digest = sha256_bytes(content)
+
+  first = upload(u_at, content).json()["image_id"]
+  second = upload(u_at, content).json()["image_id"]
+
+  # 이미지 id는 따로 발급되지만 파일은 하나만 저장됨
+  assert first != second
+  assert (image_store / "sha256" / digest[:2] / digest[2:4] / digest).read_bytes() == content
+  assert [name for name in os.listdir(image_store) if name != "sha256"] == []
+
+  blob = db.query(ImageBlobModel).filter(ImageBlobModel.digest == digest).one()
+  assert blob.ref_count >= 2
+
+  for image_id in (first, second):
+    response = client.get(f"/api/v1/resources/image/store/{image_id}")
+    assert response.status_code == 200
+    assert response.content == content
+
+
+def test_upload_rejects_large_dimensions(
+  access_token_factory,
+  image_store,
+  monkeypatch
+):
+  _, u_at = access_token_factory("test", Role.IMAGE_UPLOAD)
+  monkeypatch.setattr(core_image, "IMAGE_MAX_PIXELS", 1000)
+
+  # 단색 이미지는 압축되어 파일 크기 제한에 걸리지 않음
+  response = upload(u_at, png(64))
+
+  assert response.status_code == 413
+  assert response.json()["code"] == 413
+  assert os.listdir(image_store) == []
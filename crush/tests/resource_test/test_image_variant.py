@@ -0,0 +1,55 @@
+import io
+import os
+from PIL import Image
+from starlette.testclient import TestClient
+
+from app.core.resources import core_image
+from app.main import app
+from app.schemas.resources.ImageRequests import ImageVariantQuery
+
+client = TestClient(app)
+
+
+def test_resized_variant(
+  image_id: str
+):
+  response = client.get(f"/api/v1/resources/image/store/{image_id}?width=100&format=webp")
+
+  assert response.status_code == 200
+  assert response.headers["Content-Type"] == "image/webp"
+  assert response.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+  assert Image.open(io.BytesIO(response.content)).size == (100, 50)
+
+
+def test_variant_is_rendered_once(
+  image_id: str
+):
+  client.get(f"/api/v1/resources/image/store/{image_id}?width=64")
+  client.get(f"/api/v1/resources/image/store/{image_id}?width=64")
+
+  status = core_image.variant_cache.status()
+  assert status["entries"] == 1
+  assert status["hits"] == 1
+
+
+def test_variant_rejects_unknown_format(
+  image_id: str
+):
+  response = client.get(f"/api/v1/resources/image/store/{image_id}?format=bmp")
+
+  assert response.status_code == 400
+  assert response.json()["code"] == 400
+
+
+def test_evicted_variant_is_rendered_again(
+  image_id: str
+):
+  first = client.get(f"/api/v1/resources/image/store/{image_id}?width=64")
+  key = core_image.image_variant(image_id, "image/png", ImageVariantQuery(width=64)).key
+  os.unlink(core_image.variant_cache.path(key))
+
+  response = client.get(f"/api/v1/resources/image/store/{image_id}?width=64")
+
+  assert response.status_code == 200
+  assert response.content == first.content
+  assert "Last-Modified" in response.headers
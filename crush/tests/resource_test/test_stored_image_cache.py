@@ -0,0 +1,51 @@
+from starlette.testclient import TestClient
+
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_stored_image_cache_headers(
+  image_id: str
+):
+  response = client.get(f"/api/v1/resources/image/store/{image_id}")
+
+  assert response.status_code == 200
+  assert response.headers["ETag"] == f'"{image_id}"'
+  assert response.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+  assert "Last-Modified" in response.headers
+
+
+def test_stored_image_not_modified(
+  image_id: str
+):
+  for query in ("", "?width=100&format=jpeg"):
+    etag = client.get(f"/api/v1/resources/image/store/{image_id}{query}").headers["ETag"]
+
+    response = client.get(
+      f"/api/v1/resources/image/store/{image_id}{query}",
+      headers={
+        "If-None-Match": etag
+      }
+    )
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+def test_stored_image_range(
+  image_id: str
+):
+  full = client.get(f"/api/v1/resources/image/store/{image_id}").content
+
+  response = client.get(
+    f"/api/v1/resources/image/store/{image_id}",
+    headers={
+      "Range": "bytes=0-15"
+    }
+  )
+
+  assert response.status_code == 206
+  assert response.headers["Content-Range"] == f"bytes 0-15/{len(full)}"
+  assert response.content == full[:16]
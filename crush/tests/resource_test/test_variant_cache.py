@@ -0,0 +1,47 @@
+import os
+import time
+
+from app.core.resources.variant_cache import VariantCache
+
+
+def files(root) -> list[str]:
+  return [name for _, _, names in os.walk(root) for name in names if not name.startswith(".")]
+
+
+def test_caches_sharing_a_directory_stay_bounded(tmp_path):
+  # worker마다 따로 만든 캐시가 같은 디렉터리를 씀
+  workers = [VariantCache(str(tmp_path), max_bytes=3000, rescan_bytes=1000) for _ in range(2)]
+
+  for i in range(8):
+    workers[i % 2].put(f"{i:02d}" + "0" * 62, b"x" * 1000).close()
+
+  assert sum(os.path.getsize(os.path.join(tmp_path, name[:2], name)) for name in files(tmp_path)) <= 3000
+
+
+def test_opened_variant_survives_eviction(tmp_path):
+  cache = VariantCache(str(tmp_path), max_bytes=1000)
+  other = VariantCache(str(tmp_path), max_bytes=1000)
+  cache.put("aa" + "0" * 62, b"a" * 1000).close()
+
+  handle = cache.open("aa" + "0" * 62)
+  os.utime(cache.path("aa" + "0" * 62), (0, 0))
+  # 다른 worker가 새 항목을 쓰며 앞의 항목을 지움
+  other.put("bb" + "0" * 62, b"b" * 1000).close()
+
+  assert not os.path.exists(cache.path("aa" + "0" * 62))
+  with handle:
+    assert handle.read() == b"a" * 1000
+  assert cache.open("aa" + "0" * 62) is None
+
+
+def test_hit_keeps_modified_time(tmp_path):
+  cache = VariantCache(str(tmp_path), max_bytes=1000)
+  key = "cc" + "0" * 62
+  cache.put(key, b"c").close()
+  os.utime(cache.path(key), (1000, 1000))
+
+  cache.open(key).close()
+
+  stat = os.stat(cache.path(key))
+  assert stat.st_mtime == 1000
+  assert stat.st_atime >= time.time() - 60